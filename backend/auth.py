@@ -2,36 +2,143 @@
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import threading
+import time
 import jwt
-from passlib.context import CryptContext
+import bcrypt
+import orjson
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import os
 from enum import Enum
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing settings ("bcrypt" or "argon2")
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt").lower()
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+ARGON2_PREFIX = "$argon2"
+BCRYPT_MAX_PASSWORD_BYTES = 72  # bcrypt only consumes the first 72 bytes
+BCRYPT_COST = int(os.getenv("BCRYPT_COST", "12"))
+
+_argon2_hasher = None
+_legacy_pwd_context = None
+
+# Bounded pool so password hashing never blocks the event loop
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
 
 # JWT settings
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Verified token cache settings
+TOKEN_CACHE_MAX_SIZE = 10000
+TOKEN_CACHE_TTL_MAX = 3600  # Cached payloads never outlive this many seconds
+
+# Decoded payloads keyed by a digest of the raw token: key -> (expires_at, payload)
+_jwt_cache: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+_jwt_cache_lock = threading.Lock()
+
+# Recently rejected tokens, so bursts of bad tokens skip jwt.decode: key -> (expires_at, detail)
+NEGATIVE_CACHE_MAX_SIZE = 1024
+NEGATIVE_CACHE_TTL = 1.0
+_jwt_negative_cache: "OrderedDict[bytes, tuple[float, str]]" = OrderedDict()
+
 # Security scheme
 security = HTTPBearer()
 
+class _OrjsonPyJWT(jwt.PyJWT):
+    """PyJWT with orjson for payload (de)serialization."""
+
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        if json_encoder is not None:
+            return super()._encode_payload(payload, headers, json_encoder)
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict) -> dict:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+_jwt = _OrjsonPyJWT()
+
 class UserRole(str, Enum):
     ADMIN = "admin"
     MANAGER = "manager"
     USER = "user"
 
+def _get_argon2_hasher():
+    """Lazily create the Argon2id hasher (requires argon2-cffi)."""
+    global _argon2_hasher
+    if _argon2_hasher is None:
+        from argon2 import PasswordHasher
+        _argon2_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+    return _argon2_hasher
+
+def _get_legacy_pwd_context():
+    """Lazily create a passlib context for hashes in any other format."""
+    global _legacy_pwd_context
+    if _legacy_pwd_context is None:
+        from passlib.context import CryptContext
+        _legacy_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _legacy_pwd_context
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], hashed_password.encode()
+            )
+        except ValueError:
+            return False
+    if hashed_password.startswith(ARGON2_PREFIX):
+        from argon2.exceptions import VerificationError, InvalidHashError
+        try:
+            return _get_argon2_hasher().verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return _get_legacy_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    if PASSWORD_HASH_SCHEME == "argon2":
+        return _get_argon2_hasher().hash(password)
+    return bcrypt.hashpw(
+        password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], bcrypt.gensalt(rounds=BCRYPT_COST)
+    ).decode()
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash is weaker than the current hashing settings."""
+    if hashed_password.startswith(ARGON2_PREFIX):
+        return _get_argon2_hasher().check_needs_rehash(hashed_password)
+    if PASSWORD_HASH_SCHEME == "argon2":
+        return True
+    if hashed_password.startswith(BCRYPT_PREFIXES):
+        try:
+            return int(hashed_password.split("$")[2]) < BCRYPT_COST
+        except (IndexError, ValueError):
+            return True
+    return True
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password on the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
@@ -43,78 +150,134 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def _token_cache_key(token: str) -> bytes:
+    """Digest a raw token so the cache never retains bearer credentials."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def _get_cached_token(key: bytes) -> Optional[dict]:
+    """Return a cached payload for the token key if it has not expired."""
+    with _jwt_cache_lock:
+        entry = _jwt_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if time.time() >= expires_at:
+            del _jwt_cache[key]
+            return None
+        _jwt_cache.move_to_end(key)
+        return dict(payload)
+
+def _cache_token(key: bytes, exp: Optional[float], payload: dict) -> None:
+    """Cache a verified payload until the token's own expiry (capped)."""
+    now = time.time()
+    expires_at = now + TOKEN_CACHE_TTL_MAX
+    if exp is not None:
+        expires_at = min(expires_at, float(exp))
+    if expires_at <= now:
+        return
+    with _jwt_cache_lock:
+        _jwt_cache[key] = (expires_at, payload)
+        _jwt_cache.move_to_end(key)
+        while len(_jwt_cache) > TOKEN_CACHE_MAX_SIZE:
+            _jwt_cache.popitem(last=False)
+
+def _get_rejected_token(key: bytes) -> Optional[str]:
+    """Return the rejection detail if the token key failed validation very recently."""
+    with _jwt_cache_lock:
+        entry = _jwt_negative_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, detail = entry
+        if time.time() >= expires_at:
+            del _jwt_negative_cache[key]
+            return None
+        return detail
+
+def _reject_token(key: bytes, detail: str) -> HTTPException:
+    """Remember a failed token for a short time and build its 401 error."""
+    with _jwt_cache_lock:
+        _jwt_negative_cache[key] = (time.time() + NEGATIVE_CACHE_TTL, detail)
+        _jwt_negative_cache.move_to_end(key)
+        while len(_jwt_negative_cache) > NEGATIVE_CACHE_MAX_SIZE:
+            _jwt_negative_cache.popitem(last=False)
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 def verify_token(token: str) -> dict:
     """Verify and decode a JWT token."""
+    cache_key = _token_cache_key(token)
+    cached = _get_cached_token(cache_key)
+    if cached is not None:
+        return cached
+
+    rejected = _get_rejected_token(cache_key)
+    if rejected is not None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=rejected,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         user_id: int = payload.get("user_id")
         role: str = payload.get("role")
         
         if username is None or user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise _reject_token(cache_key, "Invalid authentication credentials")
         
-        return {
+        user = {
             "username": username,
             "user_id": user_id,
             "role": role
         }
+        _cache_token(cache_key, payload.get("exp"), user)
+        return dict(user)
     except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except jwt.JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _reject_token(cache_key, "Token has expired")
+    except jwt.InvalidTokenError:
+        raise _reject_token(cache_key, "Could not validate credentials")
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """Get the current authenticated user."""
     return verify_token(credentials.credentials)
 
-async def get_admin_user(current_user: dict = Depends(get_current_user)) -> dict:
-    """Ensure the current user is an admin."""
-    if current_user.get("role") != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
-    return current_user
+def require_roles(*roles: UserRole, detail: str):
+    """Build a dependency that only admits users whose role is in `roles`."""
+    allowed_roles = frozenset(roles)
 
-async def get_manager_user(current_user: dict = Depends(get_current_user)) -> dict:
-    """Ensure the current user is a manager."""
-    if current_user.get("role") != UserRole.MANAGER:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Manager access required"
-        )
-    return current_user
+    async def role_checker(current_user: dict = Depends(get_current_user)) -> dict:
+        if current_user.get("role") not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+        return current_user
 
-async def get_manager_or_admin_user(current_user: dict = Depends(get_current_user)) -> dict:
-    """Ensure the current user is a manager or admin."""
-    if current_user.get("role") not in [UserRole.MANAGER, UserRole.ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Manager or Admin access required"
-        )
-    return current_user
+    return role_checker
+
+# Ensure the current user is an admin
+get_admin_user = require_roles(UserRole.ADMIN, detail="Admin access required")
+
+# Ensure the current user is a manager
+get_manager_user = require_roles(UserRole.MANAGER, detail="Manager access required")
+
+# Ensure the current user is a manager or admin
+get_manager_or_admin_user = require_roles(
+    UserRole.MANAGER, UserRole.ADMIN, detail="Manager or Admin access required"
+)
 
 def create_default_admin_if_not_exists(user_db) -> None:
     """Create a default admin user if no users exist."""
     try:
-        users = user_db.get_all_users()
-        if not users:
+        if not user_db.any_users_exist():
             # Create default admin
             admin_data = {
                 "username": "admin",
@@ -124,7 +287,8 @@ def create_default_admin_if_not_exists(user_db) -> None:
                 "role": UserRole.ADMIN,
                 "is_active": True
             }
-            user_db.create_user(admin_data)
-            print("Default admin user created: username=admin, password=admin123")
+            # create_user returns None on a UNIQUE conflict, so concurrent startups are safe
+            if user_db.create_user(admin_data):
+                print("Default admin user created: username=admin, password=admin123")
     except Exception as e:
         print(f"Error creating default admin: {e}")
@@ -0,0 +1,31 @@
+"""Benchmark bcrypt cost factors to pick a BCRYPT_COST for this machine.
+
+Usage: python -m bench_bcrypt [min_cost] [max_cost]
+Aim for the highest cost that stays around 250 ms per hash.
+"""
+
+import sys
+import time
+import bcrypt
+
+TARGET_MS = 250
+
+def bench_cost(cost: int, password: bytes = b"benchmark-password", rounds: int = 3) -> float:
+    """Return the average wall time in milliseconds to hash at the given cost."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds=cost))
+    return (time.perf_counter() - start) / rounds * 1000
+
+def main(min_cost: int = 10, max_cost: int = 14) -> None:
+    recommended = min_cost
+    for cost in range(min_cost, max_cost + 1):
+        elapsed = bench_cost(cost)
+        print(f"cost={cost:2d}  {elapsed:8.1f} ms")
+        if elapsed <= TARGET_MS:
+            recommended = cost
+    print(f"Recommended BCRYPT_COST={recommended} (target ~{TARGET_MS} ms)")
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
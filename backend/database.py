@@ -1,21 +1,118 @@
 import sqlite3
 import os
+import atexit
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional
-import json
+import orjson
+ 
+# Insert statements shared by the single and bulk write paths, so each is
+# compiled once per connection and then served from sqlite3's statement cache
+_INSERT_EMAIL_SQL = '''
+    INSERT OR REPLACE INTO emails
+    (tracking_id, recipient_email, recipient_name, sender_email, sender_name,
+     subject, content, sent_at, tracking_enabled, sendgrid_message_id, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_EVENT_SQL = '''
+    INSERT INTO email_events
+    (tracking_id, event_type, event_data, ip_address, user_agent)
+    VALUES (?, ?, ?, ?, ?)
+'''
+ 
+# Seconds to reuse get_email_stats results; dashboard stats need not be real-time
+STATS_CACHE_TTL = 30
  
 class EmailTrackingDB:
     def __init__(self, db_path: str = "email_tracking.db"):
         self.db_path = db_path
+        self._stats_cache: Optional[tuple] = None  # (expires_at, stats)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close_all)
         self.init_database()
    
     def get_connection(self):
-        """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's pooled database connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+   
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply per-connection PRAGMAs once when a pooled connection is opened."""
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA wal_autocheckpoint=1000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA mmap_size=268435456')
+   
+    @contextmanager
+    def connection(self):
+        """Borrow the pooled connection, rolling back any open transaction on error."""
+        conn = self.get_connection()
+        try:
+            yield conn
+        except Exception:
+            # Inside batch() the failed statement is already undone; keep the rest
+            if not self._in_batch():
+                conn.rollback()
+            raise
+   
+    def _in_batch(self) -> bool:
+        return getattr(self._local, 'batch_depth', 0) > 0
+   
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit unless a batch() block on this thread will commit later."""
+        if not self._in_batch():
+            conn.commit()
+   
+    @contextmanager
+    def batch(self):
+        """Defer commits from save_email/record_event until the block exits."""
+        conn = self.get_connection()
+        self._local.batch_depth = getattr(self._local, 'batch_depth', 0) + 1
+        try:
+            yield self
+        except Exception:
+            self._local.batch_depth -= 1
+            if not self._in_batch():
+                conn.rollback()
+            raise
+        else:
+            self._local.batch_depth -= 1
+            if not self._in_batch():
+                conn.commit()
+   
+    def close_all(self):
+        """Close every pooled connection (registered with atexit)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
    
     def init_database(self):
         """Initialize database with required tables."""
-        conn = self.get_connection()
+        with self.connection() as conn:
+            # WAL is persistent in the database file, so it only needs setting once
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._create_schema(conn)
+   
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create tables and indexes."""
         cursor = conn.cursor()
        
         # Create emails table
@@ -57,87 +154,120 @@ class EmailTrackingDB:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_sent_at ON emails (sent_at)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_tracking_id ON email_events (tracking_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_type ON email_events (event_type)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_tid_type ON email_events (tracking_id, event_type)')
        
         conn.commit()
-        conn.close()
+   
+    @staticmethod
+    def _email_row(email_data: Dict) -> tuple:
+        return (
+            email_data['tracking_id'],
+            email_data['recipient_email'],
+            email_data['recipient_name'],
+            email_data.get('sender_email', ''),
+            email_data.get('sender_name', ''),
+            email_data['subject'],
+            email_data.get('content', ''),
+            email_data['sent_at'],
+            email_data['tracking_enabled'],
+            email_data.get('sendgrid_message_id', ''),
+            email_data.get('status', 'sent')
+        )
+   
+    @staticmethod
+    def _event_row(tracking_id: str, event_type: str,
+                   event_data: Optional[Dict] = None,
+                   ip_address: Optional[str] = None,
+                   user_agent: Optional[str] = None) -> tuple:
+        return (
+            tracking_id,
+            event_type,
+            orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode() if event_data else None,
+            ip_address,
+            user_agent
+        )
    
     def save_email(self, email_data: Dict) -> bool:
         """Save email information to database."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            cursor.execute('''
-                INSERT OR REPLACE INTO emails
-                (tracking_id, recipient_email, recipient_name, sender_email, sender_name,
-                 subject, content, sent_at, tracking_enabled, sendgrid_message_id, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                email_data['tracking_id'],
-                email_data['recipient_email'],
-                email_data['recipient_name'],
-                email_data.get('sender_email', ''),
-                email_data.get('sender_name', ''),
-                email_data['subject'],
-                email_data.get('content', ''),
-                email_data['sent_at'],
-                email_data['tracking_enabled'],
-                email_data.get('sendgrid_message_id', ''),
-                email_data.get('status', 'sent')
-            ))
+                cursor.execute(_INSERT_EMAIL_SQL, self._email_row(email_data))
            
-            conn.commit()
-            conn.close()
-            return True
+                self._commit(conn)
+                return True
         except Exception as e:
             print(f"Error saving email: {e}")
             return False
    
+    def save_emails_bulk(self, emails: List[Dict]) -> int:
+        """Save many emails in a single transaction. Returns the number saved."""
+        if not emails:
+            return 0
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+           
+                cursor.executemany(_INSERT_EMAIL_SQL, [self._email_row(email_data) for email_data in emails])
+           
+                self._commit(conn)
+                return len(emails)
+        except Exception as e:
+            print(f"Error saving emails in bulk: {e}")
+            return 0
+   
     def record_event(self, tracking_id: str, event_type: str,
                     event_data: Optional[Dict] = None,
                     ip_address: Optional[str] = None,
                     user_agent: Optional[str] = None) -> bool:
         """Record an email event (open, click, etc.)."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            cursor.execute('''
-                INSERT INTO email_events
-                (tracking_id, event_type, event_data, ip_address, user_agent)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                tracking_id,
-                event_type,
-                json.dumps(event_data) if event_data else None,
-                ip_address,
-                user_agent
-            ))
+                cursor.execute(_INSERT_EVENT_SQL, self._event_row(tracking_id, event_type, event_data, ip_address, user_agent))
            
-            conn.commit()
-            conn.close()
-            return True
+                self._commit(conn)
+                return True
         except Exception as e:
             print(f"Error recording event: {e}")
             return False
    
+    def record_events_bulk(self, events: List[Dict]) -> int:
+        """Record many events in a single transaction. Returns the number recorded.
+
+        Each event is a dict with the same keys as record_event's arguments.
+        """
+        if not events:
+            return 0
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+           
+                cursor.executemany(_INSERT_EVENT_SQL, [self._event_row(**event) for event in events])
+           
+                self._commit(conn)
+                return len(events)
+        except Exception as e:
+            print(f"Error recording events in bulk: {e}")
+            return 0
+   
     def get_email_by_tracking_id(self, tracking_id: str) -> Optional[Dict]:
         """Get email information by tracking ID."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            cursor.execute('''
-                SELECT * FROM emails WHERE tracking_id = ?
-            ''', (tracking_id,))
+                cursor.execute('''
+                    SELECT * FROM emails WHERE tracking_id = ?
+                ''', (tracking_id,))
            
-            row = cursor.fetchone()
-            conn.close()
+                row = cursor.fetchone()
            
-            if row:
-                columns = [desc[0] for desc in cursor.description]
-                return dict(zip(columns, row))
-            return None
+                if row:
+                    return dict(row)
+                return None
         except Exception as e:
             print(f"Error getting email: {e}")
             return None
@@ -145,115 +275,131 @@ class EmailTrackingDB:
     def get_email_events(self, tracking_id: str) -> List[Dict]:
         """Get all events for a specific email."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            cursor.execute('''
-                SELECT * FROM email_events
-                WHERE tracking_id = ?
-                ORDER BY timestamp DESC
-            ''', (tracking_id,))
+                cursor.execute('''
+                    SELECT * FROM email_events
+                    WHERE tracking_id = ?
+                    ORDER BY timestamp DESC
+                ''', (tracking_id,))
            
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+                return [dict(row) for row in rows]
         except Exception as e:
             print(f"Error getting events: {e}")
             return []
    
     def get_email_with_events(self, tracking_id: str) -> Optional[Dict]:
-        """Get email with all its events."""
-        email = self.get_email_by_tracking_id(tracking_id)
-        if email:
-            events = self.get_email_events(tracking_id)
-            email['events'] = events
+        """Get email with all its events in a single query."""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            # Add convenience flags
-            email['opened'] = any(event['event_type'] == 'open' for event in events)
-            email['clicked'] = any(event['event_type'] == 'click' for event in events)
-            email['click_count'] = len([e for e in events if e['event_type'] == 'click'])
+                cursor.execute('''
+                    SELECT e.*,
+                           (SELECT json_group_array(json_object(
+                                       'id', ev.id,
+                                       'tracking_id', ev.tracking_id,
+                                       'event_type', ev.event_type,
+                                       'event_data', ev.event_data,
+                                       'ip_address', ev.ip_address,
+                                       'user_agent', ev.user_agent,
+                                       'timestamp', ev.timestamp))
+                            FROM (SELECT * FROM email_events
+                                  WHERE tracking_id = e.tracking_id
+                                  ORDER BY timestamp DESC) ev) AS events_json,
+                           (SELECT COUNT(*) FROM email_events
+                            WHERE tracking_id = e.tracking_id AND event_type = 'open') AS open_count,
+                           (SELECT COUNT(*) FROM email_events
+                            WHERE tracking_id = e.tracking_id AND event_type = 'click') AS click_count,
+                           (SELECT MAX(timestamp) FROM email_events
+                            WHERE tracking_id = e.tracking_id AND event_type = 'open') AS opened_at
+                    FROM emails e
+                    WHERE e.tracking_id = ?
+                ''', (tracking_id,))
+           
+                row = cursor.fetchone()
+                if not row:
+                    return None
+           
+                email = dict(row)
            
-            # Get latest open time
-            open_events = [e for e in events if e['event_type'] == 'open']
-            if open_events:
-                email['opened_at'] = open_events[0]['timestamp']  # Most recent first
+            email['events'] = orjson.loads(email.pop('events_json'))
+            open_count = email.pop('open_count')
+            opened_at = email.pop('opened_at')
            
-        return email
+            # Add convenience flags
+            email['opened'] = open_count > 0
+            email['clicked'] = email['click_count'] > 0
+            if opened_at:
+                email['opened_at'] = opened_at
+           
+            return email
+        except Exception as e:
+            print(f"Error getting email with events: {e}")
+            return None
    
     def get_all_emails(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """Get all emails with basic event counts."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            cursor.execute('''
-                SELECT e.*,
-                       COUNT(CASE WHEN ev.event_type = 'open' THEN 1 END) as open_count,
-                       COUNT(CASE WHEN ev.event_type = 'click' THEN 1 END) as click_count,
-                       MAX(CASE WHEN ev.event_type = 'open' THEN ev.timestamp END) as last_opened
-                FROM emails e
-                LEFT JOIN email_events ev ON e.tracking_id = ev.tracking_id
-                GROUP BY e.id
-                ORDER BY e.sent_at DESC
-                LIMIT ? OFFSET ?
-            ''', (limit, offset))
+                cursor.execute('''
+                    SELECT e.*,
+                           COUNT(CASE WHEN ev.event_type = 'open' THEN 1 END) as open_count,
+                           COUNT(CASE WHEN ev.event_type = 'click' THEN 1 END) as click_count,
+                           MAX(CASE WHEN ev.event_type = 'open' THEN ev.timestamp END) as last_opened
+                    FROM emails e
+                    LEFT JOIN email_events ev ON e.tracking_id = ev.tracking_id
+                    GROUP BY e.id
+                    ORDER BY e.sent_at DESC
+                    LIMIT ? OFFSET ?
+                ''', (limit, offset))
            
-            rows = cursor.fetchall()
-            conn.close()
+                rows = cursor.fetchall()
            
-            columns = [desc[0] for desc in cursor.description]
-            emails = [dict(zip(columns, row)) for row in rows]
+                emails = [dict(row) for row in rows]
            
-            # Add convenience flags
-            for email in emails:
-                email['opened'] = email['open_count'] > 0
-                email['clicked'] = email['click_count'] > 0
+                # Add convenience flags
+                for email in emails:
+                    email['opened'] = email['open_count'] > 0
+                    email['clicked'] = email['click_count'] > 0
            
-            return emails
+                return emails
         except Exception as e:
             print(f"Error getting all emails: {e}")
             return []
    
     def get_email_stats(self) -> Dict:
-        """Get email statistics."""
+        """Get email statistics (cached for STATS_CACHE_TTL seconds)."""
+        cached = self._stats_cache
+        if cached and time.monotonic() < cached[0]:
+            return dict(cached[1])
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-           
-            # Total emails
-            cursor.execute('SELECT COUNT(*) FROM emails')
-            total_emails = cursor.fetchone()[0]
+            with self.connection() as conn:
+                cursor = conn.cursor()
            
-            # Emails with opens
-            cursor.execute('''
-                SELECT COUNT(DISTINCT e.tracking_id)
-                FROM emails e
-                JOIN email_events ev ON e.tracking_id = ev.tracking_id
-                WHERE ev.event_type = 'open'
-            ''')
-            opened_emails = cursor.fetchone()[0]
+                # Total, opened, clicked and recent (last 24 hours) emails in one statement
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM emails) AS total_emails,
+                        (SELECT COUNT(*) FROM emails e WHERE EXISTS (
+                            SELECT 1 FROM email_events ev
+                            WHERE ev.tracking_id = e.tracking_id AND ev.event_type = 'open'
+                        )) AS opened_emails,
+                        (SELECT COUNT(*) FROM emails e WHERE EXISTS (
+                            SELECT 1 FROM email_events ev
+                            WHERE ev.tracking_id = e.tracking_id AND ev.event_type = 'click'
+                        )) AS clicked_emails,
+                        (SELECT COUNT(*) FROM emails
+                         WHERE sent_at > datetime('now', '-1 day')) AS recent_emails
+                ''')
+                total_emails, opened_emails, clicked_emails, recent_emails = cursor.fetchone()
            
-            # Emails with clicks
-            cursor.execute('''
-                SELECT COUNT(DISTINCT e.tracking_id)
-                FROM emails e
-                JOIN email_events ev ON e.tracking_id = ev.tracking_id
-                WHERE ev.event_type = 'click'
-            ''')
-            clicked_emails = cursor.fetchone()[0]
-           
-            # Recent emails (last 24 hours)
-            cursor.execute('''
-                SELECT COUNT(*) FROM emails
-                WHERE sent_at > datetime('now', '-1 day')
-            ''')
-            recent_emails = cursor.fetchone()[0]
-           
-            conn.close()
-           
-            return {
+            stats = {
                 'total_emails': total_emails,
                 'opened_emails': opened_emails,
                 'clicked_emails': clicked_emails,
@@ -261,6 +407,8 @@ class EmailTrackingDB:
                 'open_rate': (opened_emails / total_emails * 100) if total_emails > 0 else 0,
                 'click_rate': (clicked_emails / total_emails * 100) if total_emails > 0 else 0
             }
+            self._stats_cache = (time.monotonic() + STATS_CACHE_TTL, stats)
+            return dict(stats)
         except Exception as e:
             print(f"Error getting stats: {e}")
             return {}
@@ -268,26 +416,26 @@ class EmailTrackingDB:
     def delete_old_emails(self, days_old: int = 30) -> int:
         """Delete emails older than specified days."""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                DELETE FROM email_events
-                WHERE tracking_id IN (
-                    SELECT tracking_id FROM emails
-                    WHERE sent_at < datetime('now', '-' || ? || ' days')
-                )
-            ''', (days_old,))
+                cursor.execute('''
+                    DELETE FROM email_events
+                    WHERE tracking_id IN (
+                        SELECT tracking_id FROM emails
+                        WHERE sent_at < datetime('now', '-' || ? || ' days')
+                    )
+                ''', (days_old,))
             
-            cursor.execute('''
-                DELETE FROM emails
-                WHERE sent_at < datetime('now', '-' || ? || ' days')
-            ''', (days_old,))
+                cursor.execute('''
+                    DELETE FROM emails
+                    WHERE sent_at < datetime('now', '-' || ? || ' days')
+                ''', (days_old,))
             
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
-            return deleted_count
+                deleted_count = cursor.rowcount
+                self._commit(conn)
+                self._stats_cache = None
+                return deleted_count
         except Exception as e:
             print(f"Error deleting old emails: {e}")
             return 0
@@ -4,9 +4,87 @@ Implements intelligent chunking strategies for processing long text.
 """
 
 import re
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
 from typing import List, Dict, Any
 from dataclasses import dataclass
 
+# Precompiled patterns (compiled once at import instead of per call)
+_TIMESTAMP_RE = re.compile(r'\[(\d{2}:\d{2}(?::\d{2})?)\]')
+_SPEAKER_RE = re.compile(r'^([^:]+):')
+
+# Semantic break phrases: topic transitions, conclusions and discussion starters
+_SEMANTIC_BREAK_RE = re.compile(
+    r'(?P<transition>moving on to|next item|regarding|lets discuss|turning to|speaking of|about the|on the topic of)'
+    r'|(?P<conclusion>in conclusion|to summarize|wrapping up|finally|in summary)'
+    r'|(?P<starter>what (?:do|are|if|about)|how (?:should|do|would|can)|should we|could we|lets think about)'
+)
+
+# Explicit topic markers, tried in order of preference
+_TOPIC_PATTERNS = tuple(re.compile(p) for p in (
+    r'discussing (.+?)(\.|\n|$)',
+    r'topic: (.+?)(\.|\n|$)',
+    r'regarding (.+?)(\.|\n|$)',
+    r'about (.+?)(\.|\n|$)'
+))
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+_TRANSITION_MARKER_RE = re.compile(
+    r"moving on to|next topic|let's discuss|turning to|regarding|about the|discussing|new agenda item|new topic"
+)
+
+_REDUNDANT_PHRASE_RE = re.compile(
+    r'in this part of the meeting,|during this segment,|in this section,|moving on,|additionally,',
+    re.IGNORECASE
+)
+
+# Keywords that might indicate topic areas
+_TOPIC_KEYWORDS = {
+    'technical': frozenset(['code', 'bug', 'feature', 'development', 'testing']),
+    'business': frozenset(['cost', 'budget', 'client', 'revenue', 'market']),
+    'planning': frozenset(['schedule', 'timeline', 'deadline', 'plan', 'milestone']),
+    'design': frozenset(['ui', 'ux', 'design', 'layout', 'interface']),
+    'team': frozenset(['team', 'staff', 'hire', 'role', 'responsibility'])
+}
+_ANY_TOPIC_WORD = frozenset().union(*_TOPIC_KEYWORDS.values())
+
+
+@lru_cache(maxsize=1024)
+def _topic_areas(text: str) -> frozenset:
+    """Return the topic areas mentioned in a piece of text (memoized per text)."""
+    words = text.lower().split()
+    if _ANY_TOPIC_WORD.isdisjoint(words):
+        return frozenset()
+    words = set(words)
+    return frozenset(topic for topic, keywords in _TOPIC_KEYWORDS.items() if words & keywords)
+
+
+def _find_break_lines(lowered_lines: List[str]) -> set:
+    """Return indices of lines containing a semantic break phrase.
+
+    Scans the whole lowered transcript with one finditer pass instead of
+    calling search once per line. Break phrases never span a newline.
+    """
+    line_starts = []
+    offset = 0
+    for line in lowered_lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+    return {
+        bisect_right(line_starts, match.start()) - 1
+        for match in _SEMANTIC_BREAK_RE.finditer('\n'.join(lowered_lines))
+    }
+
+
+def _dedupe(items) -> list:
+    """Drop case-insensitive duplicates, keeping the first occurrence in order."""
+    unique = {}
+    for item in items:
+        unique.setdefault(str(item).lower(), item)
+    return list(unique.values())
+
+
 @dataclass
 class TranscriptChunk:
     """Represents a chunk of the transcript with metadata."""
@@ -32,14 +110,12 @@ class TranscriptChunker:
 
     def extract_timestamp(self, line: str) -> str:
         """Extract timestamp from a line if present."""
-        timestamp_pattern = r'\[(\d{2}:\d{2}(?::\d{2})?)\]'
-        match = re.search(timestamp_pattern, line)
+        match = _TIMESTAMP_RE.search(line)
         return match.group(1) if match else ""
 
     def extract_speaker(self, line: str) -> str:
         """Extract speaker name from a line if present."""
-        speaker_pattern = r'^([^:]+):'
-        match = re.search(speaker_pattern, line)
+        match = _SPEAKER_RE.search(line)
         return match.group(1).strip() if match else ""
 
     def smart_chunk(self, transcript: str) -> List[TranscriptChunk]:
@@ -121,19 +197,23 @@ class TranscriptChunker:
         """Split transcript into semantic segments using key phrases and context."""
         segments = []
         current_segment = []
+        context = deque(maxlen=5)  # Rolling window of the last few lines for context
         lines = transcript.split('\n')
+        last_index = len(lines) - 1
+        break_lines = _find_break_lines(transcript.lower().split('\n'))
         
         for i, line in enumerate(lines):
             current_segment.append(line)
+            context.append(line)
             
-            # Check for semantic breaks
-            if i < len(lines) - 1:
-                current_context = ' '.join(current_segment[-5:])  # Look at last few lines for context
+            # Check for semantic breaks (same rules as _is_semantic_break)
+            if i < last_index:
                 next_line = lines[i + 1]
                 
-                if self._is_semantic_break(current_context, next_line):
+                if (i + 1) in break_lines or self._is_major_topic_shift(' '.join(context), next_line):
                     segments.append('\n'.join(current_segment))
                     current_segment = []
+                    context.clear()
         
         if current_segment:
             segments.append('\n'.join(current_segment))
@@ -142,48 +222,8 @@ class TranscriptChunker:
 
     def _is_semantic_break(self, current_context: str, next_line: str) -> bool:
         """Detect semantic breaks in the discussion flow."""
-        # Topic transition phrases
-        topic_transitions = [
-            r'moving on to',
-            r'next item',
-            r'regarding',
-            r'lets discuss',
-            r'turning to',
-            r'speaking of',
-            r'about the',
-            r'on the topic of'
-        ]
-        
-        # Conclusion phrases
-        conclusion_phrases = [
-            r'in conclusion',
-            r'to summarize',
-            r'wrapping up',
-            r'finally',
-            r'in summary'
-        ]
-        
-        # Question or discussion starters
-        discussion_starters = [
-            r'what (do|are|if|about)',
-            r'how (should|do|would|can)',
-            r'should we',
-            r'could we',
-            r'lets think about'
-        ]
-        
-        next_line_lower = next_line.lower()
-        
-        # Check for topic transitions
-        if any(re.search(pattern, next_line_lower) for pattern in topic_transitions):
-            return True
-            
-        # Check for conclusion phrases
-        if any(re.search(pattern, next_line_lower) for pattern in conclusion_phrases):
-            return True
-            
-        # Check for new discussion starters
-        if any(re.search(pattern, next_line_lower) for pattern in discussion_starters):
+        # Check for topic transitions, conclusion phrases and new discussion starters
+        if _SEMANTIC_BREAK_RE.search(next_line.lower()):
             return True
             
         # Check for significant speaker or context shifts
@@ -195,20 +235,14 @@ class TranscriptChunker:
     def _extract_topic(self, segment: str) -> str:
         """Extract the main topic from a segment."""
         # Look for explicit topic markers
-        topic_patterns = [
-            r'discussing (.+?)(\.|\n|$)',
-            r'topic: (.+?)(\.|\n|$)',
-            r'regarding (.+?)(\.|\n|$)',
-            r'about (.+?)(\.|\n|$)'
-        ]
-        
-        for pattern in topic_patterns:
-            match = re.search(pattern, segment.lower())
+        segment_lower = segment.lower()
+        for pattern in _TOPIC_PATTERNS:
+            match = pattern.search(segment_lower)
             if match:
                 return match.group(1).strip()
         
         # If no explicit topic found, use first substantive sentence
-        sentences = re.split(r'[.!?]+', segment)
+        sentences = _SENTENCE_SPLIT_RE.split(segment)
         if sentences:
             return sentences[0].strip()
         
@@ -216,51 +250,19 @@ class TranscriptChunker:
 
     def _is_major_topic_shift(self, current_text: str, next_text: str) -> bool:
         """Detect major shifts in discussion topic."""
-        # Keywords that might indicate topic areas
-        topic_keywords = {
-            'technical': set(['code', 'bug', 'feature', 'development', 'testing']),
-            'business': set(['cost', 'budget', 'client', 'revenue', 'market']),
-            'planning': set(['schedule', 'timeline', 'deadline', 'plan', 'milestone']),
-            'design': set(['ui', 'ux', 'design', 'layout', 'interface']),
-            'team': set(['team', 'staff', 'hire', 'role', 'responsibility'])
-        }
-        
-        # Get current and next topics
-        current_words = set(current_text.lower().split())
-        next_words = set(next_text.lower().split())
-        
-        # Determine topic areas for each text
-        current_topics = set()
-        next_topics = set()
-        
-        for topic, keywords in topic_keywords.items():
-            if current_words & keywords:
-                current_topics.add(topic)
-            if next_words & keywords:
-                next_topics.add(topic)
+        next_topics = _topic_areas(next_text)
+        if not next_topics:
+            return False
         
         # Check if there's a significant topic shift
-        return bool(next_topics) and not (current_topics & next_topics)
+        return not (_topic_areas(current_text) & next_topics)
 
     def _is_topic_transition(self, line: str) -> bool:
         """
         Detect if a line indicates a topic transition.
         Looks for markers like "Moving on to", "Next topic", "Let's discuss", etc.
         """
-        transition_markers = [
-            r'moving on to',
-            r'next topic',
-            r"let's discuss",
-            r'turning to',
-            r'regarding',
-            r'about the',
-            r'discussing',
-            r'new agenda item',
-            r'new topic'
-        ]
-        
-        line_lower = line.lower()
-        return any(re.search(marker, line_lower) for marker in transition_markers)
+        return bool(_TRANSITION_MARKER_RE.search(line.lower()))
 
     def merge_analyses(self, chunk_analyses: List[Dict]) -> Dict:
         """
@@ -268,42 +270,20 @@ class TranscriptChunker:
         Implements smart deduplication and consolidation of information.
         """
         merged = {
-            "key_points": [],
-            "action_items": [],
-            "decisions": [],
+            "key_points": _dedupe(
+                point for analysis in chunk_analyses for point in analysis.get("key_points", [])
+            ),
+            "action_items": _dedupe(
+                action for analysis in chunk_analyses for action in analysis.get("action_items", [])
+            ),
+            "decisions": _dedupe(
+                decision for analysis in chunk_analyses for decision in analysis.get("decisions", [])
+            ),
             "summary": ""
         }
-        
-        seen_points = set()
-        seen_actions = set()
-        seen_decisions = set()
-        summaries = []
-
-        for analysis in chunk_analyses:
-            # Merge key points with deduplication
-            for point in analysis.get("key_points", []):
-                point_text = str(point).lower()
-                if point_text not in seen_points:
-                    merged["key_points"].append(point)
-                    seen_points.add(point_text)
-
-            # Merge action items with deduplication
-            for action in analysis.get("action_items", []):
-                action_text = str(action).lower()
-                if action_text not in seen_actions:
-                    merged["action_items"].append(action)
-                    seen_actions.add(action_text)
-
-            # Merge decisions with deduplication
-            for decision in analysis.get("decisions", []):
-                decision_text = str(decision).lower()
-                if decision_text not in seen_decisions:
-                    merged["decisions"].append(decision)
-                    seen_decisions.add(decision_text)
-
-            # Collect summaries for final consolidation
-            if analysis.get("summary"):
-                summaries.append(analysis["summary"])
+
+        # Collect summaries for final consolidation
+        summaries = [analysis["summary"] for analysis in chunk_analyses if analysis.get("summary")]
 
         # Create consolidated summary
         if summaries:
@@ -319,15 +299,6 @@ class TranscriptChunker:
         consolidated = " ".join(summaries)
         
         # Remove redundant phrases and transitions
-        redundant_phrases = [
-            r'in this part of the meeting,',
-            r'during this segment,',
-            r'in this section,',
-            r'moving on,',
-            r'additionally,'
-        ]
-        
-        for phrase in redundant_phrases:
-            consolidated = re.sub(phrase, '', consolidated, flags=re.IGNORECASE)
+        consolidated = _REDUNDANT_PHRASE_RE.sub('', consolidated)
         
         return consolidated.strip()
@@ -5,24 +5,45 @@ Author: Assignment04
 """
  
 import os
+import re
 import json
-from typing import List, Dict, Any, Optional
+import orjson
+import asyncio
+import hashlib
+import logging
+import random
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, TYPE_CHECKING
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager, contextmanager
+from functools import cached_property, lru_cache, wraps
 from enum import Enum
-from openai import OpenAI
 from prompts import (
     SYSTEM_PROMPT,
     METADATA_EXTRACTION_PROMPT,
     ANALYSIS_PROMPT,
     ANALYSIS_EXAMPLES,
-    PERSONALIZED_EMAIL_PROMPT,
-    STAKEHOLDER_EMAIL_PROMPT,
+    COMBINED_METADATA_ANALYSIS_PROMPT,
+    CHUNK_SUMMARY_PROMPT,
     EMAIL_TYPE_REQUIREMENTS,
-    format_bullet_points,
-    format_action_items,
-    get_content_focus_and_tone
+    DEFAULT_EMAIL_REQUIREMENTS,
+    PromptTemplate,
+    render_stakeholder_email_prompt
 )
+
+try:
+    import tiktoken
+except ImportError:  # Optional: token counts fall back to a character estimate
+    tiktoken = None
+
+if TYPE_CHECKING:
+    from openai import OpenAI, AsyncOpenAI
  
  
 class EmailType(Enum):
@@ -33,7 +54,7 @@ class EmailType(Enum):
     EXTERNAL_STAKEHOLDER = "external"
  
  
-@dataclass
+@dataclass(slots=True)
 class ActionItem:
     """Structure for action items extracted from meetings."""
     task: str
@@ -43,7 +64,7 @@ class ActionItem:
     status: str = "pending"
  
  
-@dataclass
+@dataclass(slots=True)
 class MeetingData:
     """Structure for meeting information."""
     transcript: str
@@ -51,50 +72,471 @@ class MeetingData:
     date: Optional[str] = None
     participants: Optional[List[str]] = None
     duration: Optional[str] = None
+    # Filled in from extracted metadata during analysis
+    participants_data: List[Dict[str, Any]] = field(default_factory=list)
+    suggested_email_type: Optional[str] = None
+    meeting_type: Optional[str] = None
  
  
 @dataclass
 class MeetingSummary:
-    """Structure for processed meeting summary."""
+    """Structure for processed meeting summary.
+
+    Not slotted: the joined *_text views below are cached in the instance dict.
+    """
     executive_summary: str
     key_decisions: List[str]
     action_items: List[ActionItem]
     next_steps: List[str]
     risks_concerns: List[str]
     follow_up_meetings: List[str]
+
+    # Prose renderings shared by every email built from this summary (computed on first use)
+    @cached_property
+    def key_decisions_text(self) -> str:
+        return ". ".join(self.key_decisions)
+
+    @cached_property
+    def action_items_text(self) -> str:
+        return ". ".join([f"{item.task} (assigned to {item.owner}, due {item.due_date})"
+                          for item in self.action_items])
+
+    @cached_property
+    def action_items_priority_text(self) -> str:
+        return ". ".join([f"{item.task} (assigned to {item.owner}, due {item.due_date}, {item.priority} priority)"
+                          for item in self.action_items])
+
+    @cached_property
+    def next_steps_text(self) -> str:
+        return ". ".join(self.next_steps)
+
+    @cached_property
+    def risks_text(self) -> str:
+        return ". ".join(self.risks_concerns)
+
+    @cached_property
+    def follow_ups_text(self) -> str:
+        return ". ".join(self.follow_up_meetings)
  
  
+# Exact-match LLM response cache settings
+LLM_CACHE_MAX_SIZE = int(os.getenv("LLM_CACHE_MAX_SIZE", "256"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+# Optional SQLite file that persists cached responses across restarts
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH")
+LLM_CACHE_DISK_TTL = int(os.getenv("LLM_CACHE_DISK_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_DISK_MAX_ROWS = int(os.getenv("LLM_CACHE_DISK_MAX_ROWS", "5000"))
+# Bump when prompts or response parsing change to invalidate persisted responses
+PROMPT_VERSION = "1"
+
+# Transcripts longer than this are summarized part by part before analysis
+TRANSCRIPT_CHUNK_THRESHOLD = int(os.getenv("TRANSCRIPT_CHUNK_THRESHOLD", "12000"))
+TRANSCRIPT_CHUNK_TOKENS = int(os.getenv("TRANSCRIPT_CHUNK_TOKENS", "3000"))
+CHUNK_SUMMARY_MAX_TOKENS = 600
+CHUNK_SUMMARY_WORKERS = 8
+# Rough English average, used when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+# Client-side OpenAI throttling, shared by every analyzer in the process
+# (defaults stay under tier-1 limits for the mini models)
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "200000"))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
+OPENAI_MAX_ATTEMPTS = int(os.getenv("OPENAI_MAX_ATTEMPTS", "5"))
+
+# Ask for JSON mode on structured calls; disable for endpoints that reject response_format
+OPENAI_JSON_MODE = os.getenv("OPENAI_JSON_MODE", "1") == "1"
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Process-wide HTTP connection pool for OpenAI traffic
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 50
+HTTP_TIMEOUT = 60
+
+
+logger = logging.getLogger(__name__)
+
+# Prompt templates parsed once at import instead of on every call
+_METADATA_INSTRUCTIONS = PromptTemplate(METADATA_EXTRACTION_PROMPT).format()
+_ANALYSIS_TEMPLATE = PromptTemplate(ANALYSIS_PROMPT)
+_COMBINED_TEMPLATE = PromptTemplate(COMBINED_METADATA_ANALYSIS_PROMPT)
+
+# JSON object wrapped in a markdown code fence (with or without a language tag)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+
+# Email post-processing: whitespace around line breaks, section lines that
+# force a paragraph break, and runs of blank lines
+_LINE_EDGE_WS_RE = re.compile(r'[ \t\r\f\v]*\n[ \t\r\f\v]*')
+_EMAIL_SECTION_LINE_RE = re.compile(
+    r'^(?:(?P<both>Subject:.*)|(?P<after>(?:Dear|Hi ).*)|(?P<before>(?:Best|Regards|Sincerely).*))$',
+    re.MULTILINE
+)
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _email_section_breaks(match: "re.Match") -> str:
+    """Surround a matched email section line with the paragraph breaks it needs."""
+    if match.group('both'):
+        return '\n\n' + match.group('both') + '\n\n'
+    if match.group('after'):
+        return match.group('after') + '\n\n'
+    return '\n\n' + match.group('before')
+
+# Shared body of the consistent follow-up email; the greeting is added per participant
+CONSISTENT_EMAIL_BODY_TEMPLATE = """I hope this email finds you well. I wanted to follow up on our {date} meeting to ensure everyone is aligned on the key outcomes and next steps.
+
+**Meeting Summary:**
+{executive_summary}
+
+**Key Decisions Made:**
+{key_decisions}
+
+**Action Items:**
+{action_items}
+
+**Next Steps:**
+{next_steps}
+
+Please let me know if you have any questions or need clarification on any of these points. Looking forward to our continued collaboration.
+
+Best regards,
+Meeting Organizer"""
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Tokenizer for a model, or None when tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model.lower())
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count (or, without tiktoken, estimate) the tokens in a piece of text."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute token buckets plus a concurrency cap.
+
+    Works for both threads and coroutines: a caller reserves its share of
+    both buckets up front and sleeps until the buckets would have refilled,
+    so waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rpm: int = OPENAI_RPM, tpm: int = OPENAI_TPM,
+                 max_concurrency: int = OPENAI_MAX_CONCURRENCY):
+        self._capacity = [float(rpm), float(tpm)]
+        self._rates = [rpm / 60.0, tpm / 60.0]
+        self._levels = list(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._max_concurrency = max_concurrency
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        # asyncio semaphores are bound to a loop, so keep one per running loop
+        self._async_semaphores = weakref.WeakKeyDictionary()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and `tokens` from the buckets; return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            wait = 0.0
+            # A request larger than the whole bucket still goes through, after a full refill
+            for i, amount in enumerate((1, min(tokens, self._capacity[1]))):
+                level = min(self._capacity[i], self._levels[i] + elapsed * self._rates[i]) - amount
+                self._levels[i] = level
+                if level < 0:
+                    wait = max(wait, -level / self._rates[i])
+            return wait
+
+    @contextmanager
+    def limit(self, tokens: int):
+        with self._semaphore:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                time.sleep(delay)
+            yield
+
+    @asynccontextmanager
+    async def alimit(self, tokens: int):
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.BoundedSemaphore(self._max_concurrency)
+        async with semaphore:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+
+
+_rate_limiter = RateLimiter()
+
+
+@lru_cache(maxsize=1)
+def _retryable_errors() -> tuple:
+    """Rate-limit, timeout and connection errors of both the SDK and the direct client."""
+    import requests
+    errors = [requests.Timeout, requests.ConnectionError]
+    try:
+        import openai
+        errors += [openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError]
+    except (ImportError, AttributeError):
+        pass
+    return tuple(errors)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, _retryable_errors()):
+        return True
+    # The direct client surfaces 429s as requests.HTTPError
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def _backoff_delay(attempt: int) -> float:
+    return min(2 ** attempt, 60) + random.uniform(0, 1)
+
+
+def _retry_with_backoff(func):
+    """Retry an OpenAI call on rate limits and timeouts with exponential backoff and jitter."""
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            for attempt in range(OPENAI_MAX_ATTEMPTS):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == OPENAI_MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                        raise
+                    delay = _backoff_delay(attempt)
+                    logger.warning("OpenAI call failed (%s), retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(OPENAI_MAX_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == OPENAI_MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning("OpenAI call failed (%s), retrying in %.1fs", e, delay)
+                time.sleep(delay)
+    return wrapper
+
+
+@lru_cache(maxsize=1)
+def _get_http_client():
+    """httpx client shared by every OpenAI client, so TLS connections are kept alive across analyzers."""
+    import httpx
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        timeout=HTTP_TIMEOUT
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_async_http_client():
+    """Async counterpart of _get_http_client (the app serves requests from a single event loop)."""
+    import httpx
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        timeout=HTTP_TIMEOUT
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_direct_session():
+    """requests session shared by every direct (custom endpoint) client."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.trust_env = False  # Ignore environment proxy settings
+    session.proxies = {}  # Force no proxies
+    adapter = HTTPAdapter(pool_connections=HTTP_MAX_KEEPALIVE, pool_maxsize=HTTP_MAX_KEEPALIVE, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: Optional[str]) -> "OpenAI":
+    """Shared OpenAI client per API key, all on one HTTP connection pool."""
+    from openai import OpenAI  # Deferred: the SDK is slow to import
+    # Retries are handled by _retry_with_backoff so they also respect the rate limiter
+    return OpenAI(api_key=api_key, max_retries=0, http_client=_get_http_client())
+
+
+@lru_cache(maxsize=4)
+def _get_async_openai_client(api_key: Optional[str]) -> "AsyncOpenAI":
+    """Shared AsyncOpenAI client per API key."""
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=api_key, max_retries=0, http_client=_get_async_http_client())
+
+
+class LLMCache:
+    """Thread-safe LRU cache of LLM responses with a TTL.
+
+    Entries live in memory and, when `path` is set, are also persisted to a
+    SQLite file so identical analyses survive restarts.
+    """
+
+    def __init__(self, max_size: int = LLM_CACHE_MAX_SIZE, ttl: float = LLM_CACHE_TTL,
+                 path: Optional[str] = LLM_CACHE_PATH):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        self._disk_lock = threading.Lock()
+        if path:
+            try:
+                self._disk = sqlite3.connect(os.path.expanduser(path), timeout=5, check_same_thread=False)
+                self._disk.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key TEXT PRIMARY KEY,
+                        content TEXT NOT NULL,
+                        expires_at REAL NOT NULL,
+                        last_used REAL NOT NULL
+                    )
+                """)
+                self._disk.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used)")
+                self._disk.commit()
+            except sqlite3.Error as e:
+                logger.warning("LLM disk cache disabled: %s", e)
+                self._disk = None
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> str:
+        """Hash everything that determines the completion."""
+        payload = orjson.dumps(
+            {"v": PROMPT_VERSION, "m": model, "t": temperature, "n": max_tokens, "msgs": messages},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, content = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    return content
+                del self._entries[key]
+        content = self._disk_get(key)
+        if content is not None:
+            self._remember(key, content)
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        self._remember(key, content)
+        self._disk_set(key, content)
+
+    def _remember(self, key: str, content: str) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        if self._disk is None:
+            return None
+        now = time.time()
+        try:
+            with self._disk_lock:
+                row = self._disk.execute(
+                    "SELECT content FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._disk.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+                self._disk.commit()
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning("LLM disk cache read failed: %s", e)
+            return None
+
+    def _disk_set(self, key: str, content: str) -> None:
+        if self._disk is None:
+            return
+        now = time.time()
+        try:
+            with self._disk_lock:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, content, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                    (key, content, now + LLM_CACHE_DISK_TTL, now)
+                )
+                # Drop expired rows and keep only the most recently used ones
+                self._disk.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                self._disk.execute("""
+                    DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                    )
+                """, (LLM_CACHE_DISK_MAX_ROWS,))
+                self._disk.commit()
+        except sqlite3.Error as e:
+            logger.warning("LLM disk cache write failed: %s", e)
+
+
 class MeetingTranscriptAnalyzer:
-    """Production AI-powered meeting transcript analyzer using OpenAI API."""
+    """Production AI-powered meeting transcript analyzer using OpenAI API.
+
+    Clients, connection pools, the rate limiter and the response cache are
+    all thread-safe, so one instance can be shared by the whole process.
+    """
+
+    # Digests of (api_key, base_url) pairs already validated in this process
+    _validated_credentials: set = set()
    
     def _create_direct_client(self, api_key: str, base_url: str):
         """Create a direct HTTP client that bypasses proxy issues."""
-        import requests
-        import json
         
         class DirectOpenAIClient:
             def __init__(self, api_key, base_url):
                 self.api_key = api_key
                 self.base_url = base_url.rstrip('/')
                 self.chat = self
+                self.url = f"{self.base_url}/chat/completions"
+                
+                # Connections are pooled process-wide; auth headers are per client
+                self.session = _get_direct_session()
+                self.headers = {
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                }
                 
             @property 
             def completions(self):
                 return self
                 
-            def create(self, **kwargs):
-                url = f"{self.base_url}/chat/completions"
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
+            @property
+            def models(self):
+                return self
                 
-                # Remove any proxy settings from requests
-                session = requests.Session()
-                session.trust_env = False  # Ignore environment proxy settings
-                session.proxies = {}  # Force no proxies
+            def list(self):
+                # Cheap metadata endpoint used to validate credentials
+                response = self.session.get(f"{self.base_url}/models", headers=self.headers, timeout=30)
+                response.raise_for_status()
+                return orjson.loads(response.content)
                 
-                response = session.post(url, headers=headers, json=kwargs, timeout=30)
+            def create(self, **kwargs):
+                # json= lets requests serialize the body once, compactly
+                response = self.session.post(self.url, json=kwargs, headers=self.headers, timeout=30)
                 response.raise_for_status()
                 
                 # Wrap response to match OpenAI format
@@ -110,7 +552,7 @@ class MeetingTranscriptAnalyzer:
                     def __init__(self, message_data):
                         self.content = message_data['content']
                 
-                return MockResponse(response.json())
+                return MockResponse(orjson.loads(response.content))
         
         return DirectOpenAIClient(api_key, base_url)
 
@@ -120,7 +562,7 @@ class MeetingTranscriptAnalyzer:
         base_url = base_url or os.getenv("OPENAI_BASE_URL")
         self.model = os.getenv("OPENAI_MODEL", "GPT-4o-mini")
         
-        print(f"🔧 Initializing OpenAI client with base_url: {base_url}")
+        logger.info("🔧 Initializing OpenAI client with base_url: %s", base_url)
         
         # AGGRESSIVE proxy removal for Render environment
         proxy_vars = [
@@ -134,208 +576,493 @@ class MeetingTranscriptAnalyzer:
             if var in os.environ:
                 original_proxies[var] = os.environ[var]
                 del os.environ[var]
-                print(f"🧹 Temporarily removed {var} environment variable")
+                logger.debug("🧹 Temporarily removed %s environment variable", var)
         
         try:
             # For custom endpoints, use direct HTTP client to bypass proxy issues
             if base_url:
-                print(f"🔧 Using direct HTTP client for custom endpoint: {base_url}")
+                logger.info("🔧 Using direct HTTP client for custom endpoint: %s", base_url)
                 self.client = self._create_direct_client(api_key, base_url)
-                print("✅ Direct HTTP client created successfully")
+                self.aclient = None  # Async calls run the direct client in a worker thread
+                self._supports_streaming = False
+                logger.debug("✅ Direct HTTP client created successfully")
             else:
-                print(f"🔧 Using standard OpenAI endpoint")
-                # Clear any requests session proxies
-                import requests
-                requests.Session().trust_env = False
-                
-                self.client = OpenAI(api_key=api_key)
-                print("✅ Standard OpenAI client created successfully")
+                logger.info("🔧 Using standard OpenAI endpoint")
+                self.client = _get_openai_client(api_key)
+                self.aclient = _get_async_openai_client(api_key)
+                self._supports_streaming = True
+                logger.debug("✅ Standard OpenAI client created successfully")
                 
         finally:
             # Restore original proxy environment variables
             for var, value in original_proxies.items():
                 os.environ[var] = value
-                print(f"🔄 Restored {var} environment variable")
+                logger.debug("🔄 Restored %s environment variable", var)
         
-        try:
-            self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": "Test connection"}],
-                max_tokens=5
-            )
-            print("API connection established")
-        except Exception as e:
-            print(f"API connection failed: {e}")
-            raise ValueError("Invalid API key or connection issue")
+        # Credentials are validated lazily on the first API call, once per process
+        self._auth_key = hashlib.sha256(f"{api_key}|{base_url}".encode()).hexdigest()
+        self._llm_cache = LLMCache()
        
         # Initialize prompts
         self.system_prompt = SYSTEM_PROMPT
         self.analysis_examples = ANALYSIS_EXAMPLES
    
+    @property
+    def _auth_ok(self) -> bool:
+        return self._auth_key in MeetingTranscriptAnalyzer._validated_credentials
+
+    def _ensure_auth(self):
+        """Validate the API connection once, using the models endpoint (no token cost)."""
+        if self._auth_ok:
+            return
+        try:
+            self.client.models.list()
+            logger.info("API connection established")
+        except Exception as e:
+            logger.error("API connection failed: %s", e)
+            raise ValueError("Invalid API key or connection issue")
+        MeetingTranscriptAnalyzer._validated_credentials.add(self._auth_key)
+   
+    def _chat(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+              parse: Optional[Callable[[str], Any]] = None, json_mode: bool = False) -> Any:
+        """Run a chat completion through the response cache.
+
+        When `parse` is given its result is returned, and the response is only
+        cached if parsing succeeds, so `parse` should reject any reply the caller
+        can't use, not just malformed JSON. `json_mode` requests a JSON object response.
+        """
+        key = LLMCache.make_key(self.model, messages, temperature, max_tokens)
+        content = self._llm_cache.get(key)
+        if content is not None:
+            return parse(content) if parse else content
+
+        content = self._complete(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **self._response_options(json_mode)
+        )
+        result = parse(content) if parse else content
+        self._llm_cache.set(key, content)
+        return result
+
+    def _estimate_tokens(self, request: Dict[str, Any]) -> int:
+        """Tokens a request counts against the TPM limit: prompt plus the completion budget."""
+        prompt_tokens = sum(_count_tokens(message["content"], self.model) for message in request["messages"])
+        return prompt_tokens + request.get("max_tokens", 0)
+
+    @_retry_with_backoff
+    def _complete(self, **request) -> str:
+        """Run a throttled chat completion, streaming the deltas when the client supports it."""
+        with _rate_limiter.limit(self._estimate_tokens(request)):
+            if not self._supports_streaming:
+                return self.client.chat.completions.create(**request).choices[0].message.content
+            chunks = []
+            for event in self.client.chat.completions.create(**request, stream=True):
+                if event.choices and event.choices[0].delta.content:
+                    chunks.append(event.choices[0].delta.content)
+            return "".join(chunks)
+
+    async def _acomplete(self, **request) -> str:
+        """Async counterpart of _complete; the direct client runs in a worker thread."""
+        if self.aclient is None:
+            return await asyncio.to_thread(self._complete, **request)
+        return await self._astream_completion(**request)
+
+    @_retry_with_backoff
+    async def _astream_completion(self, **request) -> str:
+        async with _rate_limiter.alimit(self._estimate_tokens(request)):
+            chunks = []
+            async for event in await self.aclient.chat.completions.create(**request, stream=True):
+                if event.choices and event.choices[0].delta.content:
+                    chunks.append(event.choices[0].delta.content)
+            return "".join(chunks)
+
+    async def _achat(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+                     parse: Optional[Callable[[str], Any]] = None, json_mode: bool = False) -> Any:
+        """Async counterpart of _chat sharing the same response cache."""
+        key = LLMCache.make_key(self.model, messages, temperature, max_tokens)
+        content = self._llm_cache.get(key)
+        if content is not None:
+            return parse(content) if parse else content
+
+        content = await self._acomplete(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **self._response_options(json_mode)
+        )
+        result = parse(content) if parse else content
+        self._llm_cache.set(key, content)
+        return result
+
+    @staticmethod
+    def _response_options(json_mode: bool) -> Dict[str, Any]:
+        return {"response_format": JSON_RESPONSE_FORMAT} if json_mode and OPENAI_JSON_MODE else {}
+
+    @staticmethod
+    def _extract_json(content: str) -> str:
+        """Strip optional markdown fences around a JSON response.
+
+        JSON mode responses are bare objects; fences only appear when the
+        endpoint ignores response_format (or it is disabled).
+        """
+        content = content.strip()
+        if content.startswith("{"):
+            return content
+        match = _JSON_FENCE_RE.search(content)
+        return match.group(1) if match else content
+   
     def extract_meeting_metadata(self, transcript: str) -> Dict[str, Any]:
         """Extract meeting metadata from transcript."""
-        metadata_prompt = METADATA_EXTRACTION_PROMPT.format(transcript=transcript)
+        self._ensure_auth()
  
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            metadata = self._chat(
                 messages=[
                     {"role": "system", "content": "You are a precise metadata extraction assistant. Return only valid JSON."},
-                    {"role": "user", "content": metadata_prompt}
+                    # The transcript goes in its own message so it is never copied into a prompt string
+                    {"role": "user", "content": transcript},
+                    {"role": "user", "content": _METADATA_INSTRUCTIONS}
                 ],
                 max_tokens=800,
-                temperature=0.1
+                temperature=0.1,
+                parse=lambda content: orjson.loads(self._extract_json(content)),
+                json_mode=True
             )
-           
-            metadata = json.loads(response.choices[0].message.content.strip())
-            print(f"Extracted metadata for: {metadata.get('title', 'Unknown')}")
+            logger.info("Extracted metadata for: %s", metadata.get('title', 'Unknown'))
             return metadata
            
         except (json.JSONDecodeError, Exception) as e:
-            print(f"Error during metadata extraction: {e}")
-            return {
-                "title": "Meeting Analysis",
-                "date": "Not specified",
-                "participants": [{"name": "Unknown", "role": "Participant", "email_preference": "team"}],
-                "duration": "Not specified",
-                "suggested_email_type": "team",
-                "meeting_type": "other"
-            }
-   
-    def analyze_transcript(self, meeting_data: MeetingData) -> MeetingSummary:
-        """Analyze meeting transcript and extract key information."""
+            logger.warning("Error during metadata extraction: %s", e)
+            return self._default_metadata()
+
+    @staticmethod
+    def _default_metadata() -> Dict[str, Any]:
+        """Metadata used when extraction fails."""
+        return {
+            "title": "Meeting Analysis",
+            "date": "Not specified",
+            "participants": [{"name": "Unknown", "role": "Participant", "email_preference": "team"}],
+            "duration": "Not specified",
+            "suggested_email_type": "team",
+            "meeting_type": "other"
+        }
+
+    @staticmethod
+    def _parse_combined_response(content: str) -> Dict[str, Any]:
+        """Parse a combined metadata + analysis response."""
+        combined = orjson.loads(MeetingTranscriptAnalyzer._extract_json(content))
+        if not isinstance(combined, dict) or not isinstance(combined.get("analysis"), dict):
+            raise json.JSONDecodeError("Missing 'analysis' object", content, 0)
+        return combined
+
+    def _apply_metadata(self, meeting_data: MeetingData, extracted_metadata: Dict[str, Any]) -> None:
+        """Fill in missing meeting details from extracted metadata."""
+        meeting_data.title = meeting_data.title or extracted_metadata.get("title", "Meeting Analysis")
+        meeting_data.date = meeting_data.date or extracted_metadata.get("date", "Not specified")
         
-        if not meeting_data.title or not meeting_data.participants:
-            extracted_metadata = self.extract_meeting_metadata(meeting_data.transcript)
-            
-            meeting_data.title = meeting_data.title or extracted_metadata.get("title", "Meeting Analysis")
-            meeting_data.date = meeting_data.date or extracted_metadata.get("date", "Not specified")
-            
-            if not meeting_data.participants:
-                participants_data = extracted_metadata.get("participants", [])
-                if isinstance(participants_data, list) and len(participants_data) > 0:
-                    if isinstance(participants_data[0], dict):
-                        meeting_data.participants = [p.get("name", "Unknown") for p in participants_data]
-                        meeting_data.participants_data = participants_data
-                    else:
-                        meeting_data.participants = participants_data
-                        meeting_data.participants_data = [{"name": name, "role": "Participant", "email_preference": "team"} for name in participants_data]
+        if not meeting_data.participants:
+            participants_data = extracted_metadata.get("participants", [])
+            if isinstance(participants_data, list) and len(participants_data) > 0:
+                if isinstance(participants_data[0], dict):
+                    meeting_data.participants = [p.get("name", "Unknown") for p in participants_data]
+                    meeting_data.participants_data = participants_data
                 else:
-                    meeting_data.participants = ["Unknown"]
-                    meeting_data.participants_data = [{"name": "Unknown", "role": "Participant", "email_preference": "team"}]
-            
-            meeting_data.duration = meeting_data.duration or extracted_metadata.get("duration", "Not specified")
-            meeting_data.suggested_email_type = extracted_metadata.get("suggested_email_type", "team")
-            meeting_data.meeting_type = extracted_metadata.get("meeting_type", "other")
+                    meeting_data.participants = participants_data
+                    meeting_data.participants_data = [{"name": name, "role": "Participant", "email_preference": "team"} for name in participants_data]
+            else:
+                meeting_data.participants = ["Unknown"]
+                meeting_data.participants_data = [{"name": "Unknown", "role": "Participant", "email_preference": "team"}]
         
-        print(f"Analyzing meeting: {meeting_data.title}")
+        meeting_data.duration = meeting_data.duration or extracted_metadata.get("duration", "Not specified")
+        meeting_data.suggested_email_type = extracted_metadata.get("suggested_email_type", "team")
+        meeting_data.meeting_type = extracted_metadata.get("meeting_type", "other")
+   
+    def _chunk_transcript(self, transcript: str, max_tokens: int = TRANSCRIPT_CHUNK_TOKENS) -> List[str]:
+        """Split a transcript into parts of about `max_tokens`, cutting only between lines (speaker turns)."""
+        chunks = []
+        current: List[str] = []
+        current_tokens = 0
+        for line in transcript.split('\n'):
+            line_tokens = _count_tokens(line, self.model) + 1  # +1 for the newline
+            if current and current_tokens + line_tokens > max_tokens:
+                chunks.append('\n'.join(current))
+                current, current_tokens = [], 0
+            current.append(line)
+            current_tokens += line_tokens
+        if current:
+            chunks.append('\n'.join(current))
+        return chunks
+
+    def _split_long_transcript(self, transcript: str) -> Optional[List[str]]:
+        """Return the transcript's parts when it is too long for one analysis prompt, else None."""
+        if _count_tokens(transcript, self.model) <= TRANSCRIPT_CHUNK_THRESHOLD:
+            return None
+        chunks = self._chunk_transcript(transcript)
+        logger.info("Long transcript: summarizing %d parts before analysis", len(chunks))
+        return chunks
+
+    def _chunk_summary_messages(self, chunk: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": "You are a precise meeting note-taker."},
+            {"role": "user", "content": chunk},
+            {"role": "user", "content": CHUNK_SUMMARY_PROMPT}
+        ]
+
+    @staticmethod
+    def _join_chunk_notes(notes: List[str]) -> str:
+        total = len(notes)
+        return "\n\n".join(f"[Part {i} of {total}]\n{note.strip()}" for i, note in enumerate(notes, 1))
+
+    def _condense_transcript(self, transcript: str) -> str:
+        """Map step for long transcripts: summarize the parts concurrently and join the notes.
+
+        Short transcripts are returned unchanged.
+        """
+        chunks = self._split_long_transcript(transcript)
+        if chunks is None:
+            return transcript
+        summarize = lambda chunk: self._chat(
+            messages=self._chunk_summary_messages(chunk),
+            temperature=0.1,
+            max_tokens=CHUNK_SUMMARY_MAX_TOKENS
+        )
+        with ThreadPoolExecutor(max_workers=min(len(chunks), CHUNK_SUMMARY_WORKERS)) as executor:
+            notes = list(executor.map(summarize, chunks))
+        return self._join_chunk_notes(notes)
+
+    async def _acondense_transcript(self, transcript: str) -> str:
+        """Async counterpart of _condense_transcript using asyncio.gather."""
+        chunks = self._split_long_transcript(transcript)
+        if chunks is None:
+            return transcript
+        notes = await asyncio.gather(*(
+            self._achat(
+                messages=self._chunk_summary_messages(chunk),
+                temperature=0.1,
+                max_tokens=CHUNK_SUMMARY_MAX_TOKENS
+            )
+            for chunk in chunks
+        ))
+        return self._join_chunk_notes(notes)
+
+    def _analysis_request(self, meeting_data: MeetingData, transcript: Optional[str] = None):
+        """Build the analysis messages, token budget and response parser for a meeting.
+
+        The parser returns the finished MeetingSummary, so a reply that is valid
+        JSON but lacks a required field fails parsing and is never cached.
+        `transcript` replaces the meeting transcript in the prompt (e.g. condensed notes).
+        """
+        needs_metadata = not meeting_data.title or not meeting_data.participants
+        
+        if needs_metadata:
+            # Extract metadata and analysis in a single call so the transcript is only sent once
+            logger.info("Analyzing meeting and extracting metadata")
+            participants_str = ', '.join(meeting_data.participants) if meeting_data.participants else 'Not specified'
+            analysis_prompt = _COMBINED_TEMPLATE.format(
+                title=meeting_data.title or 'Not specified',
+                date=meeting_data.date or 'Not specified',
+                participants=participants_str,
+                duration=meeting_data.duration or 'Not specified'
+            )
+            parse_json = self._parse_combined_response
+            max_tokens = 2800
+        else:
+            logger.info("Analyzing meeting: %s", meeting_data.title)
+            # Create analysis prompt with few-shot examples and chain-of-thought
+            analysis_prompt = _ANALYSIS_TEMPLATE.format(
+                title=meeting_data.title,
+                date=meeting_data.date,
+                participants=', '.join(meeting_data.participants),
+                duration=meeting_data.duration
+            )
+            parse_json = lambda content: orjson.loads(self._extract_json(content))
+            max_tokens = 2000
+        
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            *self.analysis_examples,  # Few-shot examples
+            # The transcript goes in its own message so it is never copied into a prompt string
+            {"role": "user", "content": transcript if transcript is not None else meeting_data.transcript},
+            {"role": "user", "content": analysis_prompt}
+        ]
+        parse = lambda content: self._build_summary(meeting_data, parse_json(content), needs_metadata)
+        return messages, max_tokens, parse
+
+    def _build_summary(self, meeting_data: MeetingData, analysis_data: Dict[str, Any],
+                       needs_metadata: bool) -> MeetingSummary:
+        """Apply extracted metadata and convert the analysis JSON to structured objects."""
+        if needs_metadata:
+            metadata = analysis_data.get("metadata")
+            self._apply_metadata(meeting_data, metadata if isinstance(metadata, dict) else self._default_metadata())
+            analysis_data = analysis_data["analysis"]
+            logger.info("Extracted metadata for: %s", meeting_data.title)
+        logger.info("✅ Analysis completed successfully")
        
-        # Create analysis prompt with few-shot examples and chain-of-thought
-        participants_str = ', '.join(meeting_data.participants) if meeting_data.participants else 'Not specified'
-        analysis_prompt = ANALYSIS_PROMPT.format(
-            title=meeting_data.title,
-            date=meeting_data.date,
-            participants=participants_str,
-            duration=meeting_data.duration,
-            transcript=meeting_data.transcript
+        # Convert to structured objects
+        action_items = [
+            ActionItem(
+                task=item["task"],
+                owner=item["owner"],
+                due_date=item["due_date"],
+                priority=item["priority"]
+            )
+            for item in analysis_data["action_items"]
+        ]
+       
+        return MeetingSummary(
+            executive_summary=analysis_data["executive_summary"],
+            key_decisions=analysis_data["key_decisions"],
+            action_items=action_items,
+            next_steps=analysis_data["next_steps"],
+            risks_concerns=analysis_data["risks_concerns"],
+            follow_up_meetings=analysis_data["follow_up_meetings"]
         )
+
+    def analyze_transcript(self, meeting_data: MeetingData) -> MeetingSummary:
+        """Analyze meeting transcript and extract key information."""
+        self._ensure_auth()
+        transcript = self._condense_transcript(meeting_data.transcript)
+        messages, max_tokens, parse = self._analysis_request(meeting_data, transcript)
        
         try:
-            # Make API call with structured prompt
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    *self.analysis_examples,  # Few-shot examples
-                    {"role": "user", "content": analysis_prompt}
-                ],
+            # Make API call with structured prompt, parsing the JSON response
+            # (handles potential markdown formatting) into the summary
+            return self._chat(
+                messages=messages,
                 temperature=0.3,  # Lower temperature for more consistent outputs
-                max_tokens=2000
+                max_tokens=max_tokens,
+                parse=parse,
+                json_mode=True
             )
            
-            # Parse the JSON response
-            content = response.choices[0].message.content
-            print("✅ Analysis completed successfully")
-           
-            # Extract JSON from response (handle potential markdown formatting)
-            if "```json" in content:
-                json_start = content.find("```json") + 7
-                json_end = content.find("```", json_start)
-                json_content = content[json_start:json_end].strip()
-            else:
-                json_content = content.strip()
-           
-            analysis_data = json.loads(json_content)
-           
-            # Convert to structured objects
-            action_items = [
-                ActionItem(
-                    task=item["task"],
-                    owner=item["owner"],
-                    due_date=item["due_date"],
-                    priority=item["priority"]
-                )
-                for item in analysis_data["action_items"]
-            ]
-           
-            return MeetingSummary(
-                executive_summary=analysis_data["executive_summary"],
-                key_decisions=analysis_data["key_decisions"],
-                action_items=action_items,
-                next_steps=analysis_data["next_steps"],
-                risks_concerns=analysis_data["risks_concerns"],
-                follow_up_meetings=analysis_data["follow_up_meetings"]
+        except json.JSONDecodeError as e:
+            logger.error("❌ Error parsing AI response: %s", e)
+            logger.debug("Raw response: %.500s...", e.doc)
+            raise ValueError("Failed to parse AI analysis response")
+        except Exception as e:
+            logger.error("❌ Error during analysis: %s", e)
+            raise
+
+    async def aanalyze_transcript(self, meeting_data: MeetingData) -> MeetingSummary:
+        """Analyze a meeting transcript without blocking the event loop."""
+        if not self._auth_ok:
+            await asyncio.to_thread(self._ensure_auth)
+        transcript = await self._acondense_transcript(meeting_data.transcript)
+        messages, max_tokens, parse = self._analysis_request(meeting_data, transcript)
+       
+        try:
+            return await self._achat(
+                messages=messages,
+                temperature=0.3,  # Lower temperature for more consistent outputs
+                max_tokens=max_tokens,
+                parse=parse,
+                json_mode=True
             )
            
         except json.JSONDecodeError as e:
-            print(f"❌ Error parsing AI response: {e}")
-            print(f"Raw response: {content[:500]}...")
+            logger.error("❌ Error parsing AI response: %s", e)
+            logger.debug("Raw response: %.500s...", e.doc)
             raise ValueError("Failed to parse AI analysis response")
         except Exception as e:
-            print(f"❌ Error during analysis: {e}")
+            logger.error("❌ Error during analysis: %s", e)
             raise
    
+    def submit_analysis_batch(self, meetings: List[MeetingData]) -> str:
+        """Submit analyses for several meetings as one OpenAI Batch API job.
+
+        Batch jobs cost half as much as real-time calls and are not subject to
+        per-minute rate limits, but complete asynchronously (within 24h).
+        Returns the batch id for wait_for_analysis_batch.
+        """
+        if self.aclient is None:
+            raise ValueError("Batch analysis requires the standard OpenAI endpoint")
+        self._ensure_auth()
+        lines = []
+        for index, meeting_data in enumerate(meetings):
+            messages, max_tokens, _ = self._analysis_request(meeting_data)
+            lines.append(orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": 0.3,
+                    "max_tokens": max_tokens,
+                    **self._response_options(True)
+                }
+            }))
+        batch_file = self.client.files.create(file=("analysis_batch.jsonl", b"\n".join(lines)), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("📦 Submitted analysis batch %s for %d meetings", batch.id, len(meetings))
+        return batch.id
+
+    def wait_for_analysis_batch(self, batch_id: str, meetings: List[MeetingData],
+                                poll_interval: float = 30) -> List[Optional[MeetingSummary]]:
+        """Wait for a batch submitted with submit_analysis_batch and parse its results.
+
+        Results are in the same order as `meetings`; failed analyses are None.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise ValueError(f"Analysis batch {batch_id} ended with status {batch.status}")
+
+        summaries: List[Optional[MeetingSummary]] = [None] * len(meetings)
+        output = self.client.files.content(batch.output_file_id).content
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            index = int(record["custom_id"])
+            meeting_data = meetings[index]
+            try:
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+                _, _, parse = self._analysis_request(meeting_data)
+                summaries[index] = parse(content)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.error("❌ Error parsing batch result %s: %s", index, e)
+        return summaries
+
+    def batch_analyze_transcripts(self, meetings: List[MeetingData],
+                                  poll_interval: float = 30) -> List[Optional[MeetingSummary]]:
+        """Analyze many meetings through the Batch API (for background jobs)."""
+        batch_id = self.submit_analysis_batch(meetings)
+        return self.wait_for_analysis_batch(batch_id, meetings, poll_interval)
+   
     def generate_personalized_emails(self, meeting_summary: MeetingSummary, meeting_data: MeetingData) -> Dict[str, Dict[str, Any]]:
         """Generate personalized emails for each participant with consistent summary content."""
         emails = {}
-        participants_data = getattr(meeting_data, 'participants_data', [])
+        participants_data = meeting_data.participants_data
         
         # Generate consistent base content that will be the same for all participants
-        key_decisions_text = ". ".join(meeting_summary.key_decisions)
-        action_items_text = ". ".join(f"{item.task} (assigned to {item.owner}, due {item.due_date})" 
-                                    for item in meeting_summary.action_items)
-        next_steps_text = ". ".join(meeting_summary.next_steps)
-        
-        # Create a consistent base email content that's the same for everyone
+        # Create a consistent base email body that's the same for everyone
         base_subject = f"Follow-Up on {meeting_data.title}"
-        base_content = f"""Dear [NAME],
-
-I hope this email finds you well. I wanted to follow up on our {meeting_data.date} meeting to ensure everyone is aligned on the key outcomes and next steps.
-
-**Meeting Summary:**
-{meeting_summary.executive_summary}
-
-**Key Decisions Made:**
-{key_decisions_text}
-
-**Action Items:**
-{action_items_text}
-
-**Next Steps:**
-{next_steps_text}
-
-Please let me know if you have any questions or need clarification on any of these points. Looking forward to our continued collaboration.
-
-Best regards,
-Meeting Organizer"""
+        base_body = CONSISTENT_EMAIL_BODY_TEMPLATE.format_map({
+            "date": meeting_data.date,
+            "executive_summary": meeting_summary.executive_summary,
+            "key_decisions": meeting_summary.key_decisions_text,
+            "action_items": meeting_summary.action_items_text,
+            "next_steps": meeting_summary.next_steps_text
+        })
        
         for participant in participants_data:
             name = participant.get("name", "Unknown")
             role = participant.get("role", "Participant")
             email_preference = participant.get("email_preference", "team")
             
-            # Replace placeholder with actual name - this is the only personalization
-            personalized_content = base_content.replace("[NAME]", name)
+            # The greeting is the only personalization, so prepend it instead of rescanning the body
+            personalized_content = f"Dear {name},\n\n{base_body}"
             
             emails[name] = {
                 "subject": base_subject,
@@ -345,76 +1072,92 @@ Meeting Organizer"""
                 "participant_data": participant
             }
        
-        print(f"✅ Generated {len(emails)} consistent emails")
+        logger.info("✅ Generated %d consistent emails", len(emails))
         return emails
    
-    def generate_stakeholder_email(self, meeting_summary: MeetingSummary,
-                                 email_type: EmailType, recipients: List[str]) -> str:
-        """Generate professional email for stakeholders."""
-        # Convert lists to natural language paragraphs
-        key_decisions_text = ". ".join(meeting_summary.key_decisions)
-        
-        # Format action items as a flowing paragraph
-        action_items_text = ". ".join(
-            f"{item.task} (assigned to {item.owner}, due {item.due_date}, {item.priority} priority)"
-            for item in meeting_summary.action_items
-        )
-        
-        next_steps_text = ". ".join(meeting_summary.next_steps)
-        risks_text = ". ".join(meeting_summary.risks_concerns)
-        follow_ups_text = ". ".join(meeting_summary.follow_up_meetings)
-        
-        email_prompt = STAKEHOLDER_EMAIL_PROMPT.format(
+    def _stakeholder_email_messages(self, meeting_summary: MeetingSummary,
+                                    email_type: EmailType, recipients: List[str]) -> List[Dict[str, str]]:
+        """Build the chat messages for a stakeholder email."""
+        # Lists are rendered as natural language paragraphs (cached on the summary)
+        email_prompt = render_stakeholder_email_prompt(
             email_type=email_type.value,
             recipients=', '.join(recipients),
             executive_summary=meeting_summary.executive_summary,
-            key_decisions=key_decisions_text,
-            action_items=action_items_text,
-            next_steps=next_steps_text,
-            risks_concerns=risks_text,
-            follow_up_meetings=follow_ups_text,
+            key_decisions=meeting_summary.key_decisions_text,
+            action_items=meeting_summary.action_items_priority_text,
+            next_steps=meeting_summary.next_steps_text,
+            risks_concerns=meeting_summary.risks_text,
+            follow_up_meetings=meeting_summary.follow_ups_text,
             email_requirements=self._get_email_requirements(email_type)
         )
+        return [
+            {"role": "system", "content": "You are a professional business communication expert. Generate clear, actionable, and appropriately toned emails for different stakeholder groups. Use double line breaks between paragraphs."},
+            {"role": "user", "content": email_prompt}
+        ]
+
+    @staticmethod
+    def _format_email(email_content: str) -> str:
+        """Process the email content to ensure proper formatting.
+
+        Paragraphs are separated by a blank line; the subject and greeting
+        always end a paragraph and the sign-off always starts one.
+        """
+        email_content = _LINE_EDGE_WS_RE.sub('\n', email_content.strip())
+        email_content = _EMAIL_SECTION_LINE_RE.sub(_email_section_breaks, email_content)
+        return _EXTRA_BLANK_LINES_RE.sub('\n\n', email_content).strip()
+   
+    def generate_stakeholder_email(self, meeting_summary: MeetingSummary,
+                                 email_type: EmailType, recipients: List[str]) -> str:
+        """Generate professional email for stakeholders."""
+        self._ensure_auth()
+        messages = self._stakeholder_email_messages(meeting_summary, email_type, recipients)
        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional business communication expert. Generate clear, actionable, and appropriately toned emails for different stakeholder groups. Use double line breaks between paragraphs."},
-                    {"role": "user", "content": email_prompt}
-                ],
+            email_content = self._chat(
+                messages=messages,
                 temperature=0.4,  # Slightly higher for more natural language
                 max_tokens=1500
             )
+            email_content = self._format_email(email_content)
+            logger.info("✅ Email generated successfully")
+            return email_content
            
-            # Process the email content to ensure proper formatting
-            email_content = response.choices[0].message.content
-            
-            # Ensure proper line breaks between sections
-            email_lines = email_content.split('\n')
-            formatted_lines = []
-            
-            for line in email_lines:
-                line = line.strip()
-                if line:  # If line is not empty
-                    if line.startswith('Subject:'):
-                        formatted_lines.extend(['', line, ''])
-                    elif line.startswith('Dear') or line.startswith('Hi '):
-                        formatted_lines.extend([line, ''])
-                    elif line.startswith('Best') or line.startswith('Regards') or line.startswith('Sincerely'):
-                        formatted_lines.extend(['', line])
-                    else:
-                        formatted_lines.append(line)
-            
-            # Join lines with proper spacing
-            email_content = '\n\n'.join(' '.join(formatted_lines).split('  '))
-            print("✅ Email generated successfully")
+        except Exception as e:
+            logger.error("❌ Error generating email: %s", e)
+            raise
+
+    async def agenerate_stakeholder_email(self, meeting_summary: MeetingSummary,
+                                          email_type: EmailType, recipients: List[str]) -> str:
+        """Generate a stakeholder email without blocking the event loop."""
+        if not self._auth_ok:
+            await asyncio.to_thread(self._ensure_auth)
+        messages = self._stakeholder_email_messages(meeting_summary, email_type, recipients)
+       
+        try:
+            email_content = await self._achat(
+                messages=messages,
+                temperature=0.4,  # Slightly higher for more natural language
+                max_tokens=1500
+            )
+            email_content = self._format_email(email_content)
+            logger.info("✅ Email generated successfully")
             return email_content
            
         except Exception as e:
-            print(f"❌ Error generating email: {e}")
+            logger.error("❌ Error generating email: %s", e)
             raise
+
+    async def generate_stakeholder_emails_bulk(self, meeting_summary: MeetingSummary,
+                                               requests: List[tuple]) -> List[str]:
+        """Generate several stakeholder emails concurrently.
+
+        `requests` is a list of (EmailType, recipients) pairs; results keep the same order.
+        """
+        return await asyncio.gather(*(
+            self.agenerate_stakeholder_email(meeting_summary, email_type, recipients)
+            for email_type, recipients in requests
+        ))
    
     def _get_email_requirements(self, email_type: EmailType) -> str:
         """Get specific requirements for each email type."""
-        return EMAIL_TYPE_REQUIREMENTS.get(email_type.value, "Generate a professional, clear, and actionable email.")
+        return EMAIL_TYPE_REQUIREMENTS.get(email_type.value, DEFAULT_EMAIL_REQUIREMENTS)
@@ -1,13 +1,21 @@
 """Initialize the prompts package."""
 
 from .system_prompts import SYSTEM_PROMPT, METADATA_EXTRACTION_PROMPT
-from .analysis_prompts import ANALYSIS_PROMPT, ANALYSIS_EXAMPLES
+from .analysis_prompts import (
+    ANALYSIS_PROMPT,
+    ANALYSIS_EXAMPLES,
+    COMBINED_METADATA_ANALYSIS_PROMPT,
+    CHUNK_SUMMARY_PROMPT
+)
 from .email_prompts import (
     PERSONALIZED_EMAIL_PROMPT,
     STAKEHOLDER_EMAIL_PROMPT,
-    EMAIL_TYPE_REQUIREMENTS
+    EMAIL_TYPE_REQUIREMENTS,
+    DEFAULT_EMAIL_REQUIREMENTS,
+    render_stakeholder_email_prompt
 )
 from .utils import (
+    PromptTemplate,
     format_bullet_points,
     format_action_items,
     get_content_focus_and_tone
@@ -18,9 +26,14 @@ __all__ = [
     'METADATA_EXTRACTION_PROMPT',
     'ANALYSIS_PROMPT',
     'ANALYSIS_EXAMPLES',
+    'COMBINED_METADATA_ANALYSIS_PROMPT',
+    'CHUNK_SUMMARY_PROMPT',
     'PERSONALIZED_EMAIL_PROMPT',
     'STAKEHOLDER_EMAIL_PROMPT',
     'EMAIL_TYPE_REQUIREMENTS',
+    'DEFAULT_EMAIL_REQUIREMENTS',
+    'render_stakeholder_email_prompt',
+    'PromptTemplate',
     'format_bullet_points',
     'format_action_items',
     'get_content_focus_and_tone'
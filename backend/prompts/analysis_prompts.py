@@ -1,7 +1,7 @@
 """Analysis prompts for the Meeting Analyzer."""
 
 ANALYSIS_PROMPT = """
-Analyze the following meeting transcript and extract structured information.
+Analyze the meeting transcript and extract structured information.
 Apply chain-of-thought reasoning to understand context and implications.
 
 MEETING DETAILS:
@@ -10,8 +10,7 @@ Date: {date}
 Participants: {participants}
 Duration: {duration}
 
-TRANSCRIPT:
-{transcript}
+TRANSCRIPT: provided in the previous message.
 
 ANALYSIS REQUIREMENTS:
 1. EXECUTIVE SUMMARY (2-3 paragraphs):
@@ -81,3 +80,85 @@ RISKS:
 """
     }
 ]
+
+# Used when title or participants are unknown: extracts metadata and analysis
+# in one completion so the transcript is only sent once.
+COMBINED_METADATA_ANALYSIS_PROMPT = """
+Analyze the meeting transcript. First extract the meeting metadata, then extract structured analysis.
+Apply chain-of-thought reasoning to understand context and implications.
+
+KNOWN MEETING DETAILS (infer anything marked 'Not specified'):
+Title: {title}
+Date: {date}
+Participants: {participants}
+Duration: {duration}
+
+TRANSCRIPT: provided in the previous message.
+
+METADATA REQUIREMENTS:
+- title: Meeting title or topic (infer from content if not explicitly stated)
+- date: Meeting date (YYYY-MM-DD format, or 'Not specified' if unclear)
+- participants: Names with their role/title inferred from context, and an email_preference of
+  executive (managers, directors, VPs), team (team members and peers),
+  action (individual contributors) or external (clients, stakeholders outside the team)
+- duration: Meeting duration (estimate in minutes if not specified, e.g., '60 minutes')
+- suggested_email_type: executive|team|action|external, based on meeting content and audience
+- meeting_type: status|planning|review|decision|other
+
+ANALYSIS REQUIREMENTS:
+1. EXECUTIVE SUMMARY (2-3 paragraphs): key outcomes and business impact, main challenges or concerns raised, overall meeting sentiment and next steps
+2. KEY DECISIONS: specific decisions made during the meeting, with context and reasoning
+3. ACTION ITEMS: task description, owner, due date (if mentioned, otherwise "TBD"), priority level (Critical/High/Medium/Low based on context)
+4. NEXT STEPS: immediate actions and follow-up activities mentioned
+5. RISKS & CONCERNS: potential obstacles, business risks, resource or timeline concerns
+6. FOLLOW-UP MEETINGS: any scheduled follow-up meetings or reviews
+
+Return only valid JSON with the following structure:
+{{
+    "metadata": {{
+        "title": "string",
+        "date": "string",
+        "participants": [
+            {{
+                "name": "string",
+                "role": "string",
+                "email_preference": "executive|team|action|external"
+            }}
+        ],
+        "duration": "string",
+        "suggested_email_type": "executive|team|action|external",
+        "meeting_type": "status|planning|review|decision|other"
+    }},
+    "analysis": {{
+        "executive_summary": "string",
+        "key_decisions": ["decision1", "decision2", ...],
+        "action_items": [
+            {{
+                "task": "string",
+                "owner": "string",
+                "due_date": "string",
+                "priority": "string"
+            }}
+        ],
+        "next_steps": ["step1", "step2", ...],
+        "risks_concerns": ["risk1", "risk2", ...],
+        "follow_up_meetings": ["meeting1", "meeting2", ...]
+    }}
+}}
+"""
+
+# Map step for long transcripts: each part is condensed on its own and the
+# notes replace the transcript in the final analysis prompt.
+CHUNK_SUMMARY_PROMPT = """
+The previous message is one part of a longer meeting transcript.
+Write concise notes on this part only, to be combined with notes on the other parts.
+
+Keep:
+- Speaker names and their roles, as stated
+- Any meeting title, date or duration that is mentioned
+- Decisions made, with their reasoning
+- Action items with owner, due date and urgency exactly as stated
+- Next steps, risks or concerns, and any follow-up meetings
+
+Return plain text notes only, without an introduction.
+"""
@@ -1,5 +1,7 @@
 """Email generation prompts for the Meeting Analyzer."""
 
+from .utils import PromptTemplate
+
 PERSONALIZED_EMAIL_PROMPT = """
 Write a natural, conversational email to {name}, who serves as {role}. The email should be written in a {tone} style and focus primarily on {content_focus}.
 
@@ -122,3 +124,13 @@ EMAIL_TYPE_REQUIREMENTS = {
 - Maintain positive and solution-focused tone
 """
 }
+
+DEFAULT_EMAIL_REQUIREMENTS = "Generate a professional, clear, and actionable email."
+
+# Tokenized once here; render with the helper below
+_STAKEHOLDER_EMAIL_TEMPLATE = PromptTemplate(STAKEHOLDER_EMAIL_PROMPT)
+
+
+def render_stakeholder_email_prompt(**values):
+    """Fill STAKEHOLDER_EMAIL_PROMPT without re-parsing it."""
+    return _STAKEHOLDER_EMAIL_TEMPLATE.format(**values)
@@ -16,8 +16,7 @@ Always provide structured, clear, and actionable outputs with proper reasoning a
 METADATA_EXTRACTION_PROMPT = """
 You are a meeting metadata extraction specialist. Analyze the transcript and extract comprehensive information:
 
-TRANSCRIPT:
-{transcript}
+TRANSCRIPT: provided in the previous message.
 
 Extract and return a JSON object with the following fields:
 {{
@@ -1,35 +1,67 @@
 """Prompt utility functions for the Meeting Analyzer."""
 
+from string import Formatter
+
+
+class PromptTemplate:
+    """A `str.format` template parsed once into literal and field segments."""
+
+    def __init__(self, template):
+        self.template = template
+        self._segments = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in prompt field: {field}")
+            self._segments.append((literal, field))
+
+    def format(self, **values):
+        """Substitute values without re-parsing the template."""
+        return ''.join([
+            literal + str(values[field]) if field is not None else literal
+            for literal, field in self._segments
+        ])
+
+# Placeholder for action items without a due date
+TBD = "TBD"
+_ACTION_ITEM_FMT = '• %s (Owner: %s, Priority: %s, Due: %s)'
+
 def format_bullet_points(items, prefix='• '):
     """Format a list of items as bullet points."""
-    return '\n'.join(f'{prefix}{item}' for item in items)
+    return '\n'.join([prefix + str(item) for item in items])
 
 def format_action_items(action_items):
     """Format action items into a readable string."""
-    return '\n'.join(
-        f'• {item.task} (Owner: {item.owner}, Priority: {item.priority}, Due: {item.due_date or "TBD"})'
+    fmt = _ACTION_ITEM_FMT
+    return '\n'.join([
+        fmt % (item.task, item.owner, item.priority, item.due_date or TBD)
         for item in action_items
-    )
+    ])
+
+# Static focus/tone per email preference; "action" is built per recipient name
+_CONTENT_FOCUS_AND_TONE = {
+    "executive": {
+        "content_focus": "executive summary, key decisions, business impact, and high-level next steps",
+        "tone": "concise and strategic"
+    },
+    "external": {
+        "content_focus": "meeting outcomes, decisions that affect external stakeholders, and relevant next steps",
+        "tone": "formal and diplomatic"
+    },
+    "team": {
+        "content_focus": "detailed technical discussions, all decisions, action items, and comprehensive next steps",
+        "tone": "collaborative and detailed"
+    },
+}
 
 def get_content_focus_and_tone(email_preference, name):
-    """Get content focus and tone based on email preference."""
-    if email_preference == "executive":
-        return {
-            "content_focus": "executive summary, key decisions, business impact, and high-level next steps",
-            "tone": "concise and strategic"
-        }
-    elif email_preference == "action":
+    """
+    Get content focus and tone based on email preference.
+    Static preferences return a shared dict, so callers must not mutate the result.
+    """
+    if email_preference == "action":
         return {
             "content_focus": f"action items specifically assigned to or relevant to {name}, deadlines, and immediate next steps",
             "tone": "task-focused and actionable"
         }
-    elif email_preference == "external":
-        return {
-            "content_focus": "meeting outcomes, decisions that affect external stakeholders, and relevant next steps",
-            "tone": "formal and diplomatic"
-        }
-    else:  # team
-        return {
-            "content_focus": "detailed technical discussions, all decisions, action items, and comprehensive next steps",
-            "tone": "collaborative and detailed"
-        }
+    # Anything else falls back to the team style
+    return _CONTENT_FOCUS_AND_TONE.get(email_preference, _CONTENT_FOCUS_AND_TONE["team"])
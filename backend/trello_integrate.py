@@ -1,15 +1,370 @@
 
 import os
+import asyncio
+import importlib.util
+import logging
+import random
+import threading
 import time
 import typing as t
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing for the shared keep-alive session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 32
+
+# Rate limits and server errors are retried by urllib3 with jittered exponential
+# backoff, honouring Retry-After; the final failed response is still returned.
+# Read errors (timeout or dropped connection after the request was sent) are not
+# retried: Trello may already have created the card/comment/attachment
+RETRY_POLICY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "PUT", "POST", "DELETE"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 30)
+UPLOAD_TIMEOUT = (3.05, 300)
+
+# Trello's /batch endpoint accepts at most this many GET routes per call
+BATCH_MAX_URLS = 10
+
+# Seconds to keep effectively static lookups (e.g. the authenticated member) in memory
+STATIC_CACHE_TTL = 600
+# Board lists/labels/members change on human timescales; our own writes invalidate them
+BOARD_CACHE_TTL = 60
+# Least recently used entries are evicted once the cache holds this many keys
+CACHE_MAX_ENTRIES = 256
+
+# Adaptive cap on in-flight requests: halved whenever Trello answers 429,
+# raised by one after this many consecutive unthrottled responses
+CONCURRENCY_INITIAL = 8
+CONCURRENCY_MAX = POOL_MAXSIZE
+CONCURRENCY_INCREASE_AFTER = 100
+# Consecutive 429/5xx/connection failures (after retries) that open the circuit,
+# and how long calls then fail fast before Trello is tried again
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 30
+
+# AsyncTrelloClient pool; HTTP/2 multiplexing is used when the h2 package is installed
+ASYNC_MAX_CONNECTIONS = 20
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
  
  
 
 class TrelloError(Exception):
     pass
+
+
+class _AIMDLimiter:
+    """Concurrency cap with additive increase / multiplicative decrease on throttling."""
+
+    def __init__(self, initial: int, maximum: int, increase_after: int):
+        self.limit = initial
+        self.maximum = maximum
+        self.increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool):
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+class _CircuitBreaker:
+    """Fail fast for a cooldown after repeated failures instead of piling more retries on Trello."""
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def check(self) -> bool:
+        """Raise while open. Returns True for the single trial call let through after the cooldown."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            # Half-open: the first caller after the cooldown claims the trial,
+            # everyone else keeps failing fast until record() settles it
+            if remaining <= 0 and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+        if remaining > 0:
+            raise TrelloError(f"Trello circuit open after repeated failures; retry in {remaining:.0f}s")
+        raise TrelloError("Trello circuit half-open; waiting on a trial call")
+
+    def record(self, failed: bool, trial: bool = False):
+        with self._lock:
+            if trial:
+                self._trial_in_flight = False
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            # Once open, a failed trial call after the cooldown re-opens it
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+class _TTLCache:
+    """Thread-safe LRU of responses that each expire after their own TTL."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, t.Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, now: float) -> tuple[bool, t.Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if now >= entry[0]:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def set(self, key: tuple, ttl: float, data, now: float):
+        with self._lock:
+            self._entries[key] = (now + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+# Shared like _SESSION: Trello's rate limit applies to the token, not to a client instance
+_LIMITER = _AIMDLimiter(CONCURRENCY_INITIAL, CONCURRENCY_MAX, CONCURRENCY_INCREASE_AFTER)
+_BREAKER = _CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN)
+# Request handlers build a new TrelloClient per call, so lookups are cached
+# process-wide; keys start with the token so accounts never see each other's data
+_CACHE = _TTLCache(CACHE_MAX_ENTRIES)
+
+
+def _was_throttled(resp: requests.Response) -> bool:
+    """True if Trello answered 429, including attempts urllib3 already retried."""
+    if resp.status_code == 429:
+        return True
+    retries = getattr(resp.raw, "retries", None)
+    return retries is not None and any(h.status == 429 for h in retries.history)
+
+
+def _build_session() -> requests.Session:
+    """Keep-alive session shared by every TrelloClient; credentials travel as per-request params."""
+    session = requests.Session()
+    # Sized pool so bursts of calls reuse keep-alive connections
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY_POLICY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": "TrelloClient/1.0", "Connection": "keep-alive"})
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _board_params(name: str, default_lists: bool, desc: str | None, public: bool, idOrganization: str | None) -> dict:
+    params = {
+        "name": name,
+        "defaultLists": str(default_lists).lower(),
+        "prefs_permissionLevel": "public" if public else "private"
+    }
+    if desc:
+        params["desc"] = desc
+    if idOrganization is not None and str(idOrganization).strip():
+        params["idOrganization"] = str(idOrganization).strip()
+    else:
+        # If Trello will create a new workspace, set the workspace name as required
+        params["organizationName"] = "AI Elevate Course Demo"
+    return params
+
+
+def _parse_body(resp) -> t.Any:
+    """Decode a successful response (requests or httpx) with orjson; 204/empty bodies give None."""
+    if resp.status_code == 204:
+        return None
+    content = resp.content
+    return orjson.loads(content) if content else None
+
+
+def _board_key(name: str) -> str:
+    return name.strip().casefold()
+
+
+def _index_open_boards(boards: list[dict]) -> dict:
+    # First open board wins on duplicate names, matching find_board_by_name
+    index = {}
+    for board in boards:
+        if not board.get("closed", False):
+            index.setdefault(_board_key(board.get("name", "")), board)
+    return index
+
+
+def _find_open_board(boards: list[dict], name: str) -> dict | None:
+    target = _board_key(name)
+    for board in boards:
+        # Only consider open boards (closed == False)
+        if not board.get("closed", False) and _board_key(board.get("name", "")) == target:
+            return board
+    return None
+
+
+def _check_board_workspace(board: dict, idOrganization: str | None):
+    # Kiểm tra nếu idOrganization trả về khác với idOrganization truyền vào (nếu có)
+    if idOrganization and board.get("idOrganization") != str(idOrganization).strip():
+        raise TrelloError(f"Trello đã tạo board ở workspace khác! idOrganization gửi: {idOrganization}, idOrganization trả về: {board.get('idOrganization')}")
+
+
+def _card_params(
+    list_id: str,
+    name: str,
+    desc: str | None,
+    due_iso: str | None,
+    member_ids: list[str] | None,
+    label_ids: list[str] | None,
+    pos: str | float | None,
+    url_source: str | None,
+) -> dict:
+    params = {
+        "idList": list_id,
+        "name": name,
+    }
+    if desc:
+        params["desc"] = desc
+    if due_iso:
+        params["due"] = due_iso
+    if member_ids:
+        params["idMembers"] = ",".join(member_ids)
+    if label_ids:
+        params["idLabels"] = ",".join(label_ids)
+    if pos is not None:
+        params["pos"] = str(pos)
+    if url_source:
+        params["urlSource"] = url_source
+    return params
+
+
+def _batch_results(paths: list[str], envelopes: list, raise_errors: bool) -> list:
+    """Unwrap /batch {"200": body} envelopes into positional results."""
+    results = []
+    for path, entry in zip(paths, envelopes):
+        if "200" in entry:
+            results.append(entry["200"])
+            continue
+        error = TrelloError(f"GET {path} failed in batch: {entry}")
+        if raise_errors:
+            raise error
+        results.append(error)
+    return results
+
+
+def _batch_urls(paths: list[str]) -> str:
+    return ",".join("/" + path.lstrip("/") for path in paths)
+
+
+class _MultipartFileBody:
+    """
+    multipart/form-data body that reads the file from disk while it is sent,
+    instead of building the whole body in memory. Sized (Content-Length is
+    set) and seekable, so urllib3 can rewind it when a request is retried.
+    """
+
+    def __init__(self, fields: dict, file_field: str, file_path: str, filename: str,
+                 content_type: str = "application/octet-stream"):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        filename = filename.replace('"', "%22")
+        parts = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'
+            for key, value in fields.items()
+        ]
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._head = "".join(parts).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        self._file = open(file_path, "rb")
+        self._file_size = os.fstat(self._file.fileno()).st_size
+        self._file_end = len(self._head) + self._file_size
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._file_end + len(self._tail)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: len(self)}[whence]
+        self._pos = max(0, min(base + offset, len(self)))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self) if size is None or size < 0 else min(self._pos + size, len(self))
+        chunks = []
+        while self._pos < end:
+            if self._pos < len(self._head):
+                chunk = self._head[self._pos:end]
+            elif self._pos < self._file_end:
+                self._file.seek(self._pos - len(self._head))
+                chunk = self._file.read(min(end, self._file_end) - self._pos)
+                if not chunk:
+                    raise TrelloError("File changed size during upload")
+            else:
+                chunk = self._tail[self._pos - self._file_end:end - self._file_end]
+            chunks.append(chunk)
+            self._pos += len(chunk)
+        return b"".join(chunks)
  
  
 
@@ -22,14 +377,15 @@ class TrelloClient:
         me = self.get_me()
         member_id = me["id"]
         boards = self._request("GET", f"members/{member_id}/boards")
-        for board in boards:
-            # Only consider open boards (closed == False)
-            if (
-                board.get("name", "").strip().lower() == name.strip().lower()
-                and not board.get("closed", False)
-            ):
-                return board
-        return None
+        return _find_open_board(boards, name)
+
+    def index_boards_by_name(self) -> dict:
+        """
+        Map case-folded name -> board for every open board of the member,
+        for callers that look up several boards by name with one request.
+        """
+        me = self.get_me()
+        return _index_open_boards(self._request("GET", f"members/{me['id']}/boards"))
     """
     Simple Trello API client (v1) using key/token auth.
     Docs: https://developer.atlassian.com/cloud/trello/rest/api-group-cards/
@@ -40,87 +396,128 @@ class TrelloClient:
         if not self.key or not self.token:
             raise TrelloError("Missing TRELLO_KEY or TRELLO_TOKEN. Set env vars or pass to TrelloClient().")
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "TrelloClient/1.0"})
+        # Built once; _request only appends the path and merges call params
+        self._base = base_url.rstrip("/") + "/"
+        self._auth = {"key": self.key, "token": self.token}
+        # Shared across clients so TLS connections to api.trello.com are reused
+        self.session = _SESSION
+
+    def _cached(self, key: tuple, ttl: float, fetch: t.Callable[[], t.Any]):
+        """Return a cached response for key, calling fetch() when missing or expired."""
+        now = time.monotonic()
+        hit, data = _CACHE.get((self.token, *key), now)
+        if hit:
+            return data
+        data = fetch()
+        _CACHE.set((self.token, *key), ttl, data, now)
+        return data
+
+    def _store(self, key: tuple, ttl: float, data):
+        _CACHE.set((self.token, *key), ttl, data, time.monotonic())
+
+    def _invalidate(self, key: tuple):
+        _CACHE.pop((self.token, *key))
 
     def _request(
         self,
         method: str,
         path: str,
         params: dict | None = None,
-        data: dict | None = None,
+        data: t.Any = None,
         files: dict | None = None,
-        max_retries: int = 3,
+        headers: dict | None = None,
+        timeout: tuple = REQUEST_TIMEOUT,
     ):
-        url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
-        qp = {"key": self.key, "token": self.token}
-        if params:
-            qp.update(params)
-
-        backoff = 1.0
-        for attempt in range(max_retries):
-            resp = self.session.request(method, url, params=qp, data=data, files=files, timeout=30)
-
-            # Rate limit
-            if resp.status_code == 429:
-                retry_after = float(resp.headers.get("Retry-After", backoff))
-                time.sleep(retry_after)
-                backoff = min(backoff * 2, 8)
-                continue
+        url = self._base + path.lstrip("/")
+        # requests only reads params, so the shared auth dict can be passed as is
+        qp = {**self._auth, **params} if params else self._auth
+
+        trial = _BREAKER.check()
+        _LIMITER.acquire()
+        throttled = False
+        failed = True
+        # 429/5xx retries happen inside the session's adapter (see RETRY_POLICY)
+        try:
+            resp = self.session.request(
+                method, url, params=qp, data=data, files=files, headers=headers, timeout=timeout
+            )
+            throttled = _was_throttled(resp)
+            failed = resp.status_code == 429 or resp.status_code >= 500
+        except requests.RequestException as e:
+            raise TrelloError(f"{method} {url} failed: {e}") from e
+        finally:
+            _LIMITER.release(throttled)
+            _BREAKER.record(failed, trial)
 
-            # Success
-            if 200 <= resp.status_code < 300:
-                if resp.content:
-                    return resp.json()
-                return None
+        if 200 <= resp.status_code < 300:
+            return _parse_body(resp)
 
-            # Server errors → retry a bit
-            if 500 <= resp.status_code < 600 and attempt < max_retries - 1:
-                time.sleep(backoff)
-                backoff = min(backoff * 2, 8)
-                continue
+        try:
+            detail = orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            detail = resp.text
+        raise TrelloError(f"{method} {url} failed [{resp.status_code}]: {detail}")
 
-            # Other errors → raise
-            try:
-                detail = resp.json()
-            except Exception:
-                detail = resp.text
-            raise TrelloError(f"{method} {url} failed [{resp.status_code}]: {detail}")
+    def batch(self, paths: list[str], raise_errors: bool = True) -> list:
+        """
+        Run several GET routes through Trello's /batch endpoint, 10 per round trip.
+        Paths are API routes without the version, e.g. "boards/{id}/lists".
+        Results are positional; a failed route raises TrelloError, or with
+        raise_errors=False is returned in place as a TrelloError.
+        """
+        results = []
+        for start in range(0, len(paths), BATCH_MAX_URLS):
+            chunk = paths[start:start + BATCH_MAX_URLS]
+            envelopes = self._request("GET", "batch", params={"urls": _batch_urls(chunk)})
+            results.extend(_batch_results(chunk, envelopes, raise_errors))
+        return results
 
-        raise TrelloError(f"{method} {url} failed after {max_retries} retries.")
+    def get_board_overview(self, board_id: str, raise_errors: bool = True) -> dict:
+        """Fetch a board's lists, labels and members in a single batched request."""
+        lists, labels, members = self.batch(
+            [f"boards/{board_id}/lists", f"boards/{board_id}/labels", f"boards/{board_id}/members"],
+            raise_errors=raise_errors,
+        )
+        overview = {"lists": lists, "labels": labels, "members": members}
+        # Seed the shared per-endpoint caches so follow-up get_lists() etc. stay in memory
+        for name, data in overview.items():
+            if not isinstance(data, TrelloError):
+                self._store((name, board_id), BOARD_CACHE_TTL, data)
+        return overview
 
     # Board, List, Label, Member APIs
     def get_board(self, board_id: str):
         return self._request("GET", f"boards/{board_id}")
 
     def get_lists(self, board_id: str):
-        return self._request("GET", f"boards/{board_id}/lists")
+        return self._cached(("lists", board_id), BOARD_CACHE_TTL,
+                            lambda: self._request("GET", f"boards/{board_id}/lists"))
 
     def get_labels(self, board_id: str):
-        return self._request("GET", f"boards/{board_id}/labels")
+        return self._cached(("labels", board_id), BOARD_CACHE_TTL,
+                            lambda: self._request("GET", f"boards/{board_id}/labels"))
 
     def get_me(self):
-        return self._request("GET", "members/me")
+        return self._cached(("me",), STATIC_CACHE_TTL, lambda: self._request("GET", "members/me"))
+
+    def get_member(self, member_id_or_username: str):
+        return self._request("GET", f"members/{member_id_or_username}")
+
+    def bulk_get_members(self, member_ids_or_usernames: list[str], max_workers: int = 8) -> dict:
+        """Look up several members concurrently over the pooled session."""
+        if not member_ids_or_usernames:
+            return {}
+        workers = min(max_workers, POOL_MAXSIZE, len(member_ids_or_usernames))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            members = ex.map(self.get_member, member_ids_or_usernames)
+            return dict(zip(member_ids_or_usernames, members))
 
     def create_board(self, name: str, default_lists: bool = False, desc: str = None, public: bool = True, idOrganization: str = None) -> dict:
-        params = {
-            "name": name,
-            "defaultLists": str(default_lists).lower(),
-            "prefs_permissionLevel": "public" if public else "private"
-        }
-        if desc:
-            params["desc"] = desc
-        if idOrganization is not None and str(idOrganization).strip():
-            params["idOrganization"] = str(idOrganization).strip()
-        else:
-            # If Trello will create a new workspace, set the workspace name as required
-            params["organizationName"] = "AI Elevate Course Demo"
-        print("[TRELLO][DEBUG] Payload gửi lên Trello khi tạo board:", params)
+        params = _board_params(name, default_lists, desc, public, idOrganization)
+        logger.debug("[TRELLO] Payload gửi lên Trello khi tạo board: %s", params)
         board = self._request("POST", "boards", params=params)
-        print("[TRELLO][DEBUG] Response trả về khi tạo board:", board)
-        # Kiểm tra nếu idOrganization trả về khác với idOrganization truyền vào (nếu có)
-        if idOrganization and board.get("idOrganization") != str(idOrganization).strip():
-            raise TrelloError(f"Trello đã tạo board ở workspace khác! idOrganization gửi: {idOrganization}, idOrganization trả về: {board.get('idOrganization')}")
+        logger.debug("[TRELLO] Response trả về khi tạo board: %s", board)
+        _check_board_workspace(board, idOrganization)
         return board
 
     def create_list(self, board_id: str, name: str, pos: str = "bottom") -> dict:
@@ -129,7 +526,9 @@ class TrelloClient:
             "idBoard": board_id,
             "pos": pos
         }
-        return self._request("POST", "lists", params=params)
+        created = self._request("POST", "lists", params=params)
+        self._invalidate(("lists", board_id))
+        return created
 
     def create_label(self, board_id: str, name: str, color: str = "null"):
         params = {
@@ -137,7 +536,9 @@ class TrelloClient:
             "name": name,
             "color": color
         }
-        return self._request("POST", "labels", params=params)
+        created = self._request("POST", "labels", params=params)
+        self._invalidate(("labels", board_id))
+        return created
 
     # Card APIs
     def create_card(
@@ -151,22 +552,7 @@ class TrelloClient:
         pos: str | float | None = None,
         url_source: str | None = None,
     ):
-        params = {
-            "idList": list_id,
-            "name": name,
-        }
-        if desc:
-            params["desc"] = desc
-        if due_iso:
-            params["due"] = due_iso
-        if member_ids:
-            params["idMembers"] = ",".join(member_ids)
-        if label_ids:
-            params["idLabels"] = ",".join(label_ids)
-        if pos is not None:
-            params["pos"] = str(pos)
-        if url_source:
-            params["urlSource"] = url_source
+        params = _card_params(list_id, name, desc, due_iso, member_ids, label_ids, pos, url_source)
         return self._request("POST", "cards", params=params)
 
     def update_card(
@@ -206,14 +592,16 @@ class TrelloClient:
     def attach_file(self, card_id: str, file_path: str, name: str | None = None):
         if not os.path.exists(file_path):
             raise TrelloError(f"File not found: {file_path}")
-        files = {"file": open(file_path, "rb")}
-        data = {}
-        if name:
-            data["name"] = name
-        try:
-            return self._request("POST", f"cards/{card_id}/attachments", data=data, files=files)
-        finally:
-            files["file"].close()
+        fields = {"name": name} if name else {}
+        # Streamed from disk, so large recordings/PDFs are never held in memory
+        with _MultipartFileBody(fields, "file", file_path, os.path.basename(file_path)) as body:
+            return self._request(
+                "POST",
+                f"cards/{card_id}/attachments",
+                data=body,
+                headers={"Content-Type": body.content_type},
+                timeout=UPLOAD_TIMEOUT,
+            )
 
     def get_card(self, card_id: str):
         return self._request("GET", f"cards/{card_id}")
@@ -231,15 +619,159 @@ class TrelloClient:
     def unassign_member(self, card_id: str, member_id: str):
         return self._request("DELETE", f"cards/{card_id}/idMembers/{member_id}")
 
-    def assign_members(self, card_id: str, member_ids: list[str]):
-        results = []
-        for mid in member_ids:
-            results.append(self.assign_member(card_id, mid))
-        return results
+    def assign_members(self, card_id: str, member_ids: list[str], max_workers: int = 8):
+        """Add members concurrently (Trello takes one idMembers value per POST); results keep input order."""
+        if not member_ids:
+            return []
+        workers = min(max_workers, POOL_MAXSIZE, len(member_ids))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(lambda mid: self.assign_member(card_id, mid), member_ids))
 
     def get_board_members(self, board_id: str):
-        return self._request("GET", f"boards/{board_id}/members")
+        return self._cached(("members", board_id), BOARD_CACHE_TTL,
+                            lambda: self._request("GET", f"boards/{board_id}/members"))
 
     def get_board_member_ids(self, board_id: str) -> list[str]:
         members = self.get_board_members(board_id)
-        return [m["id"] for m in members]
\ No newline at end of file
+        return [m["id"] for m in members]
+
+
+class AsyncTrelloClient:
+    """
+    asyncio counterpart of TrelloClient for flows that issue many independent
+    calls (board bootstrap, label and card creation): calls made together with
+    asyncio.gather overlap their latency instead of adding up.
+    Use as `async with AsyncTrelloClient() as trello:` so the pool is closed.
+    """
+    def __init__(self, key: str | None = None, token: str | None = None, base_url: str = "https://api.trello.com/1"):
+        import httpx  # Deferred: only async flows need it
+        self.key = key or os.getenv("TRELLO_KEY")
+        self.token = token or os.getenv("TRELLO_TOKEN")
+        if not self.key or not self.token:
+            raise TrelloError("Missing TRELLO_KEY or TRELLO_TOKEN. Set env vars or pass to AsyncTrelloClient().")
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/") + "/",
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS, max_keepalive_connections=ASYNC_MAX_CONNECTIONS),
+            timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+            params={"key": self.key, "token": self.token},
+            headers={"User-Agent": "TrelloClient/1.0"},
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, params: dict | None = None):
+        # Same retry policy as the sync session: jittered backoff on 429/5xx, honouring Retry-After
+        import httpx
+        path = path.lstrip("/")
+        for attempt in range(RETRY_POLICY.total + 1):
+            try:
+                resp = await self._client.request(method, path, params=params)
+            except httpx.HTTPError as e:
+                raise TrelloError(f"{method} {path} failed: {e}") from e
+            if resp.status_code in RETRY_POLICY.status_forcelist and attempt < RETRY_POLICY.total:
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after and RETRY_POLICY.respect_retry_after_header:
+                    delay = RETRY_POLICY.parse_retry_after(retry_after)
+                else:
+                    delay = RETRY_POLICY.backoff_factor * (2 ** attempt) + random.uniform(0, RETRY_POLICY.backoff_jitter)
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        if 200 <= resp.status_code < 300:
+            return _parse_body(resp)
+
+        try:
+            detail = orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            detail = resp.text
+        raise TrelloError(f"{method} {path} failed [{resp.status_code}]: {detail}")
+
+    async def batch(self, paths: list[str], raise_errors: bool = True) -> list:
+        """Async TrelloClient.batch; the 10-route chunks are fetched concurrently."""
+        chunks = [paths[start:start + BATCH_MAX_URLS] for start in range(0, len(paths), BATCH_MAX_URLS)]
+        envelopes = await asyncio.gather(*(
+            self._request("GET", "batch", params={"urls": _batch_urls(chunk)}) for chunk in chunks
+        ))
+        results = []
+        for chunk, chunk_envelopes in zip(chunks, envelopes):
+            results.extend(_batch_results(chunk, chunk_envelopes, raise_errors))
+        return results
+
+    async def get_board_overview(self, board_id: str, raise_errors: bool = True) -> dict:
+        lists, labels, members = await self.batch(
+            [f"boards/{board_id}/lists", f"boards/{board_id}/labels", f"boards/{board_id}/members"],
+            raise_errors=raise_errors,
+        )
+        overview = {"lists": lists, "labels": labels, "members": members}
+        # Fresh data for TrelloClient's shared board caches
+        for name, data in overview.items():
+            if not isinstance(data, TrelloError):
+                _CACHE.set((self.token, name, board_id), BOARD_CACHE_TTL, data, time.monotonic())
+        return overview
+
+    async def get_me(self):
+        return await self._request("GET", "members/me")
+
+    async def find_board_by_name(self, name: str):
+        me = await self.get_me()
+        boards = await self._request("GET", f"members/{me['id']}/boards")
+        return _find_open_board(boards, name)
+
+    async def index_boards_by_name(self) -> dict:
+        me = await self.get_me()
+        return _index_open_boards(await self._request("GET", f"members/{me['id']}/boards"))
+
+    async def get_lists(self, board_id: str):
+        return await self._request("GET", f"boards/{board_id}/lists")
+
+    async def get_labels(self, board_id: str):
+        return await self._request("GET", f"boards/{board_id}/labels")
+
+    async def get_cards_in_list(self, list_id: str):
+        return await self._request("GET", f"lists/{list_id}/cards")
+
+    async def create_board(self, name: str, default_lists: bool = False, desc: str = None, public: bool = True, idOrganization: str = None) -> dict:
+        board = await self._request("POST", "boards", params=_board_params(name, default_lists, desc, public, idOrganization))
+        _check_board_workspace(board, idOrganization)
+        return board
+
+    async def create_list(self, board_id: str, name: str, pos: str = "bottom") -> dict:
+        created = await self._request("POST", "lists", params={"name": name, "idBoard": board_id, "pos": pos})
+        # The board caches are shared with TrelloClient, so async writes must drop them too
+        _CACHE.pop((self.token, "lists", board_id))
+        return created
+
+    async def create_label(self, board_id: str, name: str, color: str = "null"):
+        created = await self._request("POST", "labels", params={"idBoard": board_id, "name": name, "color": color})
+        _CACHE.pop((self.token, "labels", board_id))
+        return created
+
+    async def create_card(
+        self,
+        list_id: str,
+        name: str,
+        desc: str | None = None,
+        due_iso: str | None = None,
+        member_ids: list[str] | None = None,
+        label_ids: list[str] | None = None,
+        pos: str | float | None = None,
+        url_source: str | None = None,
+    ):
+        params = _card_params(list_id, name, desc, due_iso, member_ids, label_ids, pos, url_source)
+        return await self._request("POST", "cards", params=params)
+
+    async def assign_member(self, card_id: str, member_id: str):
+        return await self._request("POST", f"cards/{card_id}/idMembers", params={"value": member_id})
+
+    async def assign_members(self, card_id: str, member_ids: list[str]):
+        return list(await asyncio.gather(*(self.assign_member(card_id, mid) for mid in member_ids)))
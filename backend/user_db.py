@@ -1,231 +1,399 @@
 """User management database operations."""
 
 import sqlite3
-import json
+import orjson
+import atexit
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+# Hot and shared statements, defined once so every caller hands sqlite3 the
+# identical string and hits the per-connection prepared statement cache
+_SELECT_USER_SQL = '''
+    SELECT id, username, email, password_hash, full_name, role, status, is_active, created_at
+    FROM users WHERE '''
+_GET_USER_BY_USERNAME_SQL = _SELECT_USER_SQL + "username = ? AND status = 'registered' AND is_active = 1"
+_GET_USER_BY_USERNAME_ANY_STATUS_SQL = _SELECT_USER_SQL + "username = ? AND is_active = 1"
+_GET_USER_BY_EMAIL_SQL = _SELECT_USER_SQL + "email = ? AND status = 'registered' AND is_active = 1"
+_GET_USER_BY_EMAIL_ANY_STATUS_SQL = _SELECT_USER_SQL + "email = ? AND is_active = 1"
+_INSERT_USER_SQL = '''
+    INSERT INTO users (username, email, password_hash, full_name, role, status, is_active)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_PARTICIPANT_SQL = '''
+    INSERT OR IGNORE INTO meeting_participants (meeting_id, user_id, role)
+    VALUES (?, ?, ?)
+'''
+_INSERT_TASK_SQL = '''
+    INSERT INTO tasks (meeting_id, assigned_to, title, description, due_date, status, intended_owner)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Prepared statements kept per pooled connection (sqlite3 defaults to 128)
+_ASSIGN_TASK_SQL = '''
+    UPDATE tasks SET assigned_to = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+_UPDATE_TASK_DESCRIPTION_SQL = '''
+    UPDATE tasks SET description = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+STATEMENT_CACHE_SIZE = 256
+
+# Columns each update_* method may set, in the order they appear in the SQL
+_USER_UPDATE_FIELDS = ('username', 'email', 'full_name', 'role', 'status', 'is_active')
+_MEETING_UPDATE_FIELDS = ('title', 'description', 'transcript')
+_PROJECT_UPDATE_FIELDS = ('name', 'description', 'status', 'start_date', 'end_date')
+
+# Bumped whenever _TABLES or _ADDED_COLUMNS changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 2
+# Columns added after their table was first released, as (table, column, definition)
+_ADDED_COLUMNS = (
+    ('users', 'status', "TEXT NOT NULL DEFAULT 'registered'"),
+    ('tasks', 'intended_owner', 'TEXT'),
+    ('projects', 'trello_board_id', 'TEXT'),
+)
+
+# Table definitions in dependency order. Foreign keys cascade so deleting a
+# user or meeting removes its dependent rows in one statement.
+_TABLES = (
+    ('users', '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        full_name TEXT NOT NULL,
+        role TEXT NOT NULL DEFAULT 'user',
+        status TEXT NOT NULL DEFAULT 'registered',  -- 'created', 'registered'
+        is_active BOOLEAN NOT NULL DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    '''),
+    ('meetings', '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        transcript TEXT,
+        analysis_result TEXT,  -- JSON string
+        created_by INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (created_by) REFERENCES users (id) ON DELETE CASCADE
+    '''),
+    ('meeting_participants', '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        meeting_id INTEGER NOT NULL,
+        user_id INTEGER NOT NULL,
+        role TEXT DEFAULT 'participant',  -- 'participant', 'organizer'
+        joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (meeting_id) REFERENCES meetings (id) ON DELETE CASCADE,
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+        UNIQUE(meeting_id, user_id)
+    '''),
+    # Tasks extracted from meeting analysis
+    ('tasks', '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        meeting_id INTEGER NOT NULL,
+        assigned_to INTEGER,
+        title TEXT NOT NULL,
+        description TEXT,
+        due_date TIMESTAMP,
+        status TEXT DEFAULT 'pending',  -- 'pending', 'in_progress', 'completed'
+        intended_owner TEXT,  -- Store intended owner name for later assignment
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (meeting_id) REFERENCES meetings (id) ON DELETE CASCADE,
+        FOREIGN KEY (assigned_to) REFERENCES users (id) ON DELETE CASCADE
+    '''),
+    # A project outlives its creator
+    ('projects', '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        description TEXT,
+        status TEXT DEFAULT 'active',  -- 'active', 'completed', 'on_hold', 'cancelled'
+        start_date TIMESTAMP,
+        end_date TIMESTAMP,
+        created_by INTEGER,
+        trello_board_id TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (created_by) REFERENCES users (id) ON DELETE SET NULL
+    '''),
+    ('project_meetings', '''
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        meeting_id INTEGER NOT NULL,
+        linked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE,
+        FOREIGN KEY (meeting_id) REFERENCES meetings (id) ON DELETE CASCADE,
+        UNIQUE(project_id, meeting_id)
+    '''),
+)
+
+# Registered-user lookups (hit on every authenticated request) are served from
+# memory for this long; any users-table write clears the cache. Misses are not cached.
+USER_CACHE_TTL = 30
+USER_CACHE_MAX_ENTRIES = 1024
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _update_sql(table: str, fields: Tuple[str, ...], where: str = 'id = ?', fixed: Tuple[str, ...] = ()) -> str:
+    """
+    Build the UPDATE for one combination of changed columns. Shapes are few and
+    bounded, so each string is built once and always hits the statement cache.
+    """
+    assignments = [f"{field} = ?" for field in fields] + list(fixed) + ['updated_at = CURRENT_TIMESTAMP']
+    return f"UPDATE {table} SET {', '.join(assignments)} WHERE {where}"
+
+
+def _db_operation(default, error_message: str):
+    """
+    Decorate a UserDB method so a failure is logged (with traceback) and the
+    method returns `default` instead of raising. Pass a type such as `list`
+    to get a fresh empty container per failure.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception:
+                logger.exception(error_message)
+                return default() if isinstance(default, type) else default
+        return wrapper
+    return decorator
+
 
 class UserDB:
+    @_db_operation(None, "Error getting project by name")
     def get_project_by_name(self, name: str) -> Optional[Dict]:
         """Get a project by name (case-insensitive)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, name, description, status, start_date, end_date, created_by, created_at, updated_at
-                FROM projects WHERE LOWER(name) = LOWER(?)
-            ''', (name,))
-            row = cursor.fetchone()
-            conn.close()
-            if row:
-                return {
-                    'id': row[0],
-                    'name': row[1],
-                    'description': row[2],
-                    'status': row[3],
-                    'start_date': row[4],
-                    'end_date': row[5],
-                    'created_by': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8]
-                }
-            return None
-        except Exception as e:
-            print(f"Error getting project by name: {e}")
-            return None
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, name, description, status, start_date, end_date, created_by, created_at, updated_at
+            FROM projects WHERE LOWER(name) = LOWER(?)
+        ''', (name,))
+        row = cursor.fetchone()
+        if row:
+            return dict(row)
+        return None
+    @_db_operation(False, "Error updating task description")
     def update_task_description(self, task_id: int, description: str) -> bool:
         """Update the description of a task."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE tasks SET description = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (description, task_id))
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error updating task description: {e}")
-            return False
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(_UPDATE_TASK_DESCRIPTION_SQL, (description, task_id))
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
+    @_db_operation(None, "Error finding meeting by title and date")
     def find_meeting_by_title_and_date(self, title: str, date: str) -> Optional[Dict]:
         """Find a meeting by title and date (for deduplication)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, title, description, transcript, analysis_result, created_by, created_at
-                FROM meetings
-                WHERE title = ? AND created_at LIKE ?
-                ORDER BY created_at DESC
-            ''', (title, f"{date}%"))
-            row = cursor.fetchone()
-            conn.close()
-            if row:
-                return {
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'transcript': row[3],
-                    'analysis_result': row[4],
-                    'created_by': row[5],
-                    'created_at': row[6]
-                }
-            return None
-        except Exception as e:
-            print(f"Error finding meeting by title and date: {e}")
-            return None
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, title, description, transcript, analysis_result, created_by, created_at
+            FROM meetings
+            WHERE title = ? AND created_at LIKE ?
+            ORDER BY created_at DESC
+        ''', (title, f"{date}%"))
+        row = cursor.fetchone()
+        if row:
+            return dict(row)
+        return None
     def __init__(self, db_path: str = "email_tracking.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._user_cache: Dict[tuple, tuple] = {}
+        self._user_cache_lock = threading.Lock()
+        atexit.register(self.close_all)
         self.init_database()
 
     def get_connection(self):
-        """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's pooled database connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        elif conn.in_transaction:
+            # A previous call on this thread failed before committing; discard
+            # its partial writes as closing a per-call connection used to
+            conn.rollback()
+        return conn
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection):
+        """
+        Run a multi-statement write as one BEGIN IMMEDIATE ... COMMIT. The write
+        lock is taken up front so concurrent writers queue on busy_timeout instead
+        of failing mid-sequence, and any error rolls the whole unit back.
+        """
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply per-connection PRAGMAs once when a pooled connection is opened."""
+        # NORMAL under WAL skips the fsync per commit; a power loss can drop the
+        # last few commits but never corrupts the database
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        # Off by default in SQLite; the schema relies on ON DELETE actions
+        conn.execute('PRAGMA foreign_keys=ON')
+        conn.execute('PRAGMA wal_autocheckpoint=1000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA mmap_size=268435456')
+
+    def _get_cached_user(self, key: tuple) -> Optional[Dict]:
+        with self._user_cache_lock:
+            entry = self._user_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            # Copy so callers can't mutate the cached row
+            return dict(entry[1])
+        return None
+
+    def _cache_user(self, key: tuple, user: Dict):
+        now = time.monotonic()
+        with self._user_cache_lock:
+            if len(self._user_cache) >= USER_CACHE_MAX_ENTRIES:
+                for stale in [k for k, (expires, _) in self._user_cache.items() if expires <= now]:
+                    del self._user_cache[stale]
+                if len(self._user_cache) >= USER_CACHE_MAX_ENTRIES:
+                    # Still full of live entries: evict the oldest insertion
+                    del self._user_cache[next(iter(self._user_cache))]
+            self._user_cache[key] = (now + USER_CACHE_TTL, dict(user))
+
+    def _invalidate_users(self):
+        """Drop cached user rows; called after every write to the users table."""
+        with self._user_cache_lock:
+            self._user_cache.clear()
+
+    def close_all(self):
+        """Close every pooled connection (registered with atexit)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def _rebuild_foreign_keys(self, conn: sqlite3.Connection):
+        """
+        Recreate tables whose foreign keys predate ON DELETE actions. SQLite can't
+        alter a constraint in place, so each table is copied into its current
+        definition. Rows orphaned by the old manual deletes are then cleared:
+        nullable references are set to NULL, other rows are deleted.
+        """
+        for name, columns in _TABLES:
+            actions = [fk['on_delete'] for fk in conn.execute(f'PRAGMA foreign_key_list({name})')]
+            if 'NO ACTION' not in actions:
+                continue
+            column_names = ', '.join(row['name'] for row in conn.execute(f'PRAGMA table_info({name})'))
+            conn.execute(f'CREATE TABLE {name}_new ({columns})')
+            conn.execute(f'INSERT INTO {name}_new ({column_names}) SELECT {column_names} FROM {name}')
+            conn.execute(f'DROP TABLE {name}')
+            conn.execute(f'ALTER TABLE {name}_new RENAME TO {name}')
+
+        # Deleting an orphan can orphan its own dependents, so repeat until clean
+        while True:
+            violations = conn.execute('PRAGMA foreign_key_check').fetchall()
+            if not violations:
+                break
+            for table, rowid, _, fkid in violations:
+                fk = next(fk for fk in conn.execute(f'PRAGMA foreign_key_list({table})') if fk['id'] == fkid)
+                notnull = next(col['notnull'] for col in conn.execute(f'PRAGMA table_info({table})')
+                               if col['name'] == fk['from'])
+                if notnull:
+                    conn.execute(f'DELETE FROM {table} WHERE rowid = ?', (rowid,))
+                else:
+                    conn.execute(f"UPDATE {table} SET {fk['from']} = NULL WHERE rowid = ?", (rowid,))
 
     def init_database(self):
         """Initialize database with user and meeting-related tables."""
         conn = self.get_connection()
+        # WAL is persistent in the database file, so it only needs setting once
+        conn.execute('PRAGMA journal_mode=WAL')
         cursor = conn.cursor()
 
-        # Create users table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                full_name TEXT NOT NULL,
-                role TEXT NOT NULL DEFAULT 'user',
-                status TEXT NOT NULL DEFAULT 'registered',  -- 'created', 'registered'
-                is_active BOOLEAN NOT NULL DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Add status column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN status TEXT NOT NULL DEFAULT "registered"')
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
-
-        # Create meetings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS meetings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                transcript TEXT,
-                analysis_result TEXT,  -- JSON string
-                created_by INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (created_by) REFERENCES users (id)
-            )
-        ''')
-
-        # Create meeting_participants table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS meeting_participants (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                meeting_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                role TEXT DEFAULT 'participant',  -- 'participant', 'organizer'
-                joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (meeting_id) REFERENCES meetings (id),
-                FOREIGN KEY (user_id) REFERENCES users (id),
-                UNIQUE(meeting_id, user_id)
-            )
-        ''')
-
-        # Create tasks table (extracted from meeting analysis)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                meeting_id INTEGER NOT NULL,
-                assigned_to INTEGER,
-                title TEXT NOT NULL,
-                description TEXT,
-                due_date TIMESTAMP,
-                status TEXT DEFAULT 'pending',  -- 'pending', 'in_progress', 'completed'
-                intended_owner TEXT,  -- Store intended owner name for later assignment
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (meeting_id) REFERENCES meetings (id),
-                FOREIGN KEY (assigned_to) REFERENCES users (id)
-            )
-        ''')
-        
-        # Add intended_owner column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute('ALTER TABLE tasks ADD COLUMN intended_owner TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
-        # Create projects table (add trello_board_id column)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS projects (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                status TEXT DEFAULT 'active',  -- 'active', 'completed', 'on_hold', 'cancelled'
-                start_date TIMESTAMP,
-                end_date TIMESTAMP,
-                created_by INTEGER,
-                trello_board_id TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (created_by) REFERENCES users (id)
-            )
-        ''')
-        # Add trello_board_id column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute('ALTER TABLE projects ADD COLUMN trello_board_id TEXT')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
-        # Create project_meetings junction table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS project_meetings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                project_id INTEGER NOT NULL,
-                meeting_id INTEGER NOT NULL,
-                linked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE,
-                FOREIGN KEY (meeting_id) REFERENCES meetings (id) ON DELETE CASCADE,
-                UNIQUE(project_id, meeting_id)
-            )
-        ''')
+        for name, columns in _TABLES:
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS {name} ({columns})')
+
+        # Bring databases created by older versions up to date. This runs once per
+        # database file; user_version records it so later starts skip it
+        if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+            # Tables are rebuilt below, which must not fire foreign key actions;
+            # the pragma is a no-op inside a transaction so it is toggled outside
+            conn.execute('PRAGMA foreign_keys=OFF')
+            try:
+                with self._transaction(conn):
+                    # Re-check under the write lock in case another process just migrated
+                    if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+                        for table, column, definition in _ADDED_COLUMNS:
+                            columns = {row['name'] for row in conn.execute(f'PRAGMA table_info({table})')}
+                            if column not in columns:
+                                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+                        self._rebuild_foreign_keys(conn)
+                        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            finally:
+                conn.execute('PRAGMA foreign_keys=ON')
 
         # Create indexes
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_username ON users (username)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_email ON users (email)')
+        # username/email are UNIQUE, so SQLite's automatic indexes already cover
+        # plain equality lookups; the old explicit copies only cost write time.
+        # They are one-row seeks, so a partial index on the login predicate
+        # (status = 'registered' AND is_active = 1) would never be chosen either
+        cursor.execute('DROP INDEX IF EXISTS idx_users_username')
+        cursor.execute('DROP INDEX IF EXISTS idx_users_email')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_meetings_created_by ON meetings (created_by)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_meeting_participants_meeting ON meeting_participants (meeting_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_meeting_participants_user ON meeting_participants (user_id)')
+        # meeting_id-first lookups use the UNIQUE(meeting_id, user_id) automatic index
+        cursor.execute('DROP INDEX IF EXISTS idx_meeting_participants_meeting')
+        # user_id-first composite covers the participant -> meeting join in get_user_meetings
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_mp_user_meeting ON meeting_participants (user_id, meeting_id)')
+        cursor.execute('DROP INDEX IF EXISTS idx_meeting_participants_user')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_meeting ON tasks (meeting_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks (assigned_to)')
+        # Matches get_user_tasks' filter and ORDER BY, so results come back without a sort step
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tasks_assigned_due ON tasks (assigned_to, due_date, created_at DESC)')
+        cursor.execute('DROP INDEX IF EXISTS idx_tasks_assigned_to')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_created_by ON projects (created_by)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_project_meetings_project ON project_meetings (project_id)')
+        # project_id-first lookups use the UNIQUE(project_id, meeting_id) automatic index
+        cursor.execute('DROP INDEX IF EXISTS idx_project_meetings_project')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_project_meetings_meeting ON project_meetings (meeting_id)')
 
+        # Gather planner statistics the first time, then let SQLite refresh them as needed
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        cursor.execute('ANALYZE' if cursor.fetchone() is None else 'PRAGMA optimize')
+
         conn.commit()
-        conn.close()
 
+    @_db_operation(None, "Error creating user")
     def create_user(self, user_data: Dict) -> Optional[int]:
         """Create a new user."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                INSERT INTO users (username, email, password_hash, full_name, role, status, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        try:
+            cursor.execute(_INSERT_USER_SQL, (
                 user_data['username'],
                 user_data['email'],
                 user_data['password'],  # Should already be hashed
@@ -234,157 +402,106 @@ class UserDB:
                 user_data.get('status', 'registered'),
                 user_data.get('is_active', True)
             ))
-
-            user_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            return user_id
         except sqlite3.IntegrityError:
-            return None
-        except Exception as e:
-            print(f"Error creating user: {e}")
+            # Username or email already taken
             return None
 
+        user_id = cursor.lastrowid
+        conn.commit()
+        return user_id
+
+    @_db_operation(None, "Error getting user")
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """Get user by username (only registered users)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        cached = self._get_cached_user(("username", username))
+        if cached is not None:
+            return cached
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT id, username, email, password_hash, full_name, role, status, is_active, created_at
-                FROM users WHERE username = ? AND status = 'registered' AND is_active = 1
-            ''', (username,))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            if row:
-                return {
-                    'id': row[0],
-                    'username': row[1],
-                    'email': row[2],
-                    'password_hash': row[3],
-                    'full_name': row[4],
-                    'role': row[5],
-                    'status': row[6],
-                    'is_active': row[7],
-                    'created_at': row[8]
-                }
-            return None
-        except Exception as e:
-            print(f"Error getting user: {e}")
-            return None
+        cursor.execute(_GET_USER_BY_USERNAME_SQL, (username,))
+
+        row = cursor.fetchone()
 
+        if row:
+            user = dict(row)
+            self._cache_user(("username", username), user)
+            return user
+        return None
+
+    @_db_operation(None, "Error getting user")
     def get_user_by_username_any_status(self, username: str) -> Optional[Dict]:
         """Get user by username regardless of status."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT id, username, email, password_hash, full_name, role, status, is_active, created_at
-                FROM users WHERE username = ? AND is_active = 1
-            ''', (username,))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            if row:
-                return {
-                    'id': row[0],
-                    'username': row[1],
-                    'email': row[2],
-                    'password_hash': row[3],
-                    'full_name': row[4],
-                    'role': row[5],
-                    'status': row[6],
-                    'is_active': row[7],
-                    'created_at': row[8]
-                }
-            return None
-        except Exception as e:
-            print(f"Error getting user: {e}")
-            return None
+        cursor.execute(_GET_USER_BY_USERNAME_ANY_STATUS_SQL, (username,))
+
+        row = cursor.fetchone()
+
+        if row:
+            return dict(row)
+        return None
 
+    @_db_operation(None, "Error getting user by email")
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email (only registered users)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        cached = self._get_cached_user(("email", email))
+        if cached is not None:
+            return cached
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT id, username, email, password_hash, full_name, role, status, is_active, created_at
-                FROM users WHERE email = ? AND status = 'registered' AND is_active = 1
-            ''', (email,))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            if row:
-                return {
-                    'id': row[0],
-                    'username': row[1],
-                    'email': row[2],
-                    'password_hash': row[3],
-                    'full_name': row[4],
-                    'role': row[5],
-                    'status': row[6],
-                    'is_active': row[7],
-                    'created_at': row[8]
-                }
-            return None
-        except Exception as e:
-            print(f"Error getting user by email: {e}")
-            return None
+        cursor.execute(_GET_USER_BY_EMAIL_SQL, (email,))
 
+        row = cursor.fetchone()
+
+        if row:
+            user = dict(row)
+            self._cache_user(("email", email), user)
+            return user
+        return None
+
+    @_db_operation(True, "Error checking for users")
+    def any_users_exist(self) -> bool:
+        """Check whether at least one user row exists."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT EXISTS(SELECT 1 FROM users)')
+        exists = bool(cursor.fetchone()[0])
+        return exists
+
+    @_db_operation(list, "Error getting all users")
     def get_all_users(self) -> List[Dict]:
         """Get all users."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT id, username, email, full_name, role, status, is_active, created_at
-                FROM users WHERE is_active = 1
-                ORDER BY created_at DESC
-            ''')
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'username': row[1],
-                'email': row[2],
-                'full_name': row[3],
-                'role': row[4],
-                'status': row[5],
-                'is_active': row[6],
-                'created_at': row[7]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting all users: {e}")
-            return []
+        cursor.execute('''
+            SELECT id, username, email, full_name, role, status, is_active, created_at
+            FROM users WHERE is_active = 1
+            ORDER BY created_at DESC
+        ''')
+
+        return [dict(row) for row in cursor]
 
+    @_db_operation(None, "Error creating user from email")
     def create_user_from_email(self, email: str, full_name: str) -> Optional[int]:
         """Create a user with 'created' status when sending meeting emails."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Use email as username
-            username = email
-            
-            # Check if user already exists
-            existing_user = self.get_user_by_email_any_status(email)
-            if existing_user:
-                return existing_user['id']
+        # Use email as username
+        username = email
+        
+        # Check if user already exists
+        existing_user = self.get_user_by_email_any_status(email)
+        if existing_user:
+            return existing_user['id']
 
-            cursor.execute('''
-                INSERT INTO users (username, email, password_hash, full_name, role, status, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        try:
+            cursor.execute(_INSERT_USER_SQL, (
                 username,
                 email,
                 '',  # No password hash yet - will be set when user registers
@@ -393,91 +510,68 @@ class UserDB:
                 'created',
                 True
             ))
-
-            user_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            return user_id
         except sqlite3.IntegrityError as e:
-            print(f"Error creating user from email (IntegrityError): {e}")
+            logger.warning("Error creating user from email (IntegrityError): %s", e)
             # Email already exists, return None to indicate failure
             return None
-        except Exception as e:
-            print(f"Error creating user from email: {e}")
-            return None
 
+        user_id = cursor.lastrowid
+        conn.commit()
+        return user_id
+
+    @_db_operation(False, "Error updating user status")
     def update_user_status_to_registered(self, email: str, password_hash: str, username: str = None, full_name: str = None) -> bool:
         """Update user status from 'created' to 'registered' when user registers."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Build dynamic update query
-            update_fields = ['password_hash = ?', 'status = "registered"', 'updated_at = CURRENT_TIMESTAMP']
-            params = [password_hash]
-            
-            if username:
-                update_fields.append('username = ?')
-                params.append(username)
-            
-            if full_name:
-                update_fields.append('full_name = ?')
-                params.append(full_name)
-            
-            params.append(email)  # for WHERE clause
-            
-            query = f'''
-                UPDATE users 
-                SET {', '.join(update_fields)}
-                WHERE email = ? AND status = 'created'
-            '''
-            
-            cursor.execute(query, params)
-            updated = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return updated
-        except Exception as e:
-            print(f"Error updating user status: {e}")
-            return False
+        # Optional username/full_name only change the statement shape
+        fields = ('password_hash',)
+        params = [password_hash]
+        
+        if username:
+            fields += ('username',)
+            params.append(username)
+        
+        if full_name:
+            fields += ('full_name',)
+            params.append(full_name)
+        
+        params.append(email)  # for WHERE clause
+        
+        query = _update_sql('users', fields, "email = ? AND status = 'created'", ("status = 'registered'",))
+        cursor.execute(query, params)
+        updated = cursor.rowcount > 0
+        conn.commit()
+        self._invalidate_users()
+        return updated
 
+    @_db_operation(None, "Error getting user by email")
     def get_user_by_email_any_status(self, email: str) -> Optional[Dict]:
         """Get user by email regardless of status (for checking existence)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT id, username, email, password_hash, full_name, role, status, is_active, created_at
-                FROM users WHERE email = ? AND is_active = 1
-            ''', (email,))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            if row:
-                return {
-                    'id': row[0],
-                    'username': row[1],
-                    'email': row[2],
-                    'password_hash': row[3],
-                    'full_name': row[4],
-                    'role': row[5],
-                    'status': row[6],
-                    'is_active': row[7],
-                    'created_at': row[8]
-                }
-            return None
-        except Exception as e:
-            print(f"Error getting user by email: {e}")
-            return None
+        cursor.execute(_GET_USER_BY_EMAIL_ANY_STATUS_SQL, (email,))
+
+        row = cursor.fetchone()
+
+        if row:
+            return dict(row)
+        return None
 
+    @_db_operation(None, "Error creating meeting")
     def create_meeting(self, meeting_data: Dict, creator_id: int) -> Optional[int]:
-        """Create a new meeting."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        """Create a new meeting. analysis_result may be a JSON string or a dict to serialize."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
+        analysis_result = meeting_data.get('analysis_result', '')
+        if not isinstance(analysis_result, (str, bytes)):
+            analysis_result = orjson.dumps(analysis_result).decode()
+
+        # Meeting and organizer row are written in one transaction
+        with self._transaction(conn):
             cursor.execute('''
                 INSERT INTO meetings (title, description, transcript, analysis_result, created_by)
                 VALUES (?, ?, ?, ?, ?)
@@ -485,7 +579,7 @@ class UserDB:
                 meeting_data['title'],
                 meeting_data.get('description', ''),
                 meeting_data.get('transcript', ''),
-                meeting_data.get('analysis_result', ''),
+                analysis_result,
                 creator_id
             ))
 
@@ -497,864 +591,599 @@ class UserDB:
                 VALUES (?, ?, 'organizer')
             ''', (meeting_id, creator_id))
 
-            conn.commit()
-            conn.close()
-            return meeting_id
-        except Exception as e:
-            print(f"Error creating meeting: {e}")
-            return None
+        return meeting_id
 
     def add_meeting_participant(self, meeting_id: int, user_id: int, role: str = 'participant') -> bool:
         """Add a participant to a meeting."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        return self.add_meeting_participants(meeting_id, [(user_id, role)])
 
-            cursor.execute('''
-                INSERT OR IGNORE INTO meeting_participants (meeting_id, user_id, role)
-                VALUES (?, ?, ?)
-            ''', (meeting_id, user_id, role))
-
-            conn.commit()
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"Error adding meeting participant: {e}")
-            return False
+    @_db_operation(False, "Error adding meeting participants")
+    def add_meeting_participants(self, meeting_id: int, participants: List[Tuple[int, str]]) -> bool:
+        """Add several (user_id, role) participants to a meeting in one transaction."""
+        conn = self.get_connection()
 
-    def get_user_meetings(self, user_id: int) -> List[Dict]:
-        """Get all meetings for a user."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        with self._transaction(conn):
+            conn.executemany(_INSERT_PARTICIPANT_SQL, [(meeting_id, user_id, role) for user_id, role in participants])
 
-            cursor.execute('''
-                SELECT m.id, m.title, m.description, m.created_at, mp.role, u.full_name as creator
-                FROM meetings m
-                JOIN meeting_participants mp ON m.id = mp.meeting_id
-                JOIN users u ON m.created_by = u.id
-                WHERE mp.user_id = ?
-                ORDER BY m.created_at DESC
-            ''', (user_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'created_at': row[3],
-                'user_role': row[4],
-                'creator': row[5]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting user meetings: {e}")
-            return []
+        return True
+
+    @_db_operation(list, "Error getting user meetings")
+    def get_user_meetings(self, user_id: int) -> List[Dict]:
+        """
+        Get all meetings for a user, with each meeting's open task count and
+        comma-separated participant usernames aggregated in the same query.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
+        cursor.execute('''
+            SELECT m.id, m.title, m.description, m.created_at, mp.role as user_role, u.full_name as creator,
+                   (SELECT COUNT(*) FROM tasks t
+                    WHERE t.meeting_id = m.id AND t.status != 'completed') as open_tasks,
+                   (SELECT GROUP_CONCAT(u2.username) FROM meeting_participants mp2
+                    JOIN users u2 ON mp2.user_id = u2.id
+                    WHERE mp2.meeting_id = m.id) as participants
+            FROM meetings m
+            JOIN meeting_participants mp ON m.id = mp.meeting_id
+            JOIN users u ON m.created_by = u.id
+            WHERE mp.user_id = ?
+            ORDER BY m.created_at DESC, m.id DESC
+        ''', (user_id,))
+
+        return [dict(row) for row in cursor]
+
+    @_db_operation(list, "Error getting user tasks")
     def get_user_tasks(self, user_id: int) -> List[Dict]:
         """Get all tasks assigned to a user."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT t.id, t.title, t.description, t.due_date, t.status, 
-                       m.title as meeting_title, t.created_at, t.meeting_id
-                FROM tasks t
-                JOIN meetings m ON t.meeting_id = m.id
-                WHERE t.assigned_to = ?
-                ORDER BY t.due_date ASC, t.created_at DESC
-            ''', (user_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'due_date': row[3],
-                'status': row[4],
-                'meeting_title': row[5],
-                'created_at': row[6],
-                'meeting_id': row[7]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting user tasks: {e}")
-            return []
+        cursor.execute('''
+            SELECT t.id, t.title, t.description, t.due_date, t.status, 
+                   m.title as meeting_title, t.created_at, t.meeting_id
+            FROM tasks t
+            JOIN meetings m ON t.meeting_id = m.id
+            WHERE t.assigned_to = ?
+            ORDER BY t.due_date ASC, t.created_at DESC
+        ''', (user_id,))
+
+        return [dict(row) for row in cursor]
 
+    @_db_operation(None, "Error creating task")
     def create_task(self, task_data: Dict) -> Optional[int]:
         """Create a new task."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                INSERT INTO tasks (meeting_id, assigned_to, title, description, due_date, status, intended_owner)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                task_data['meeting_id'],
-                task_data.get('assigned_to'),
-                task_data['title'],
-                task_data.get('description', ''),
-                task_data.get('due_date'),
-                task_data.get('status', 'pending'),
-                task_data.get('intended_owner')
-            ))
+        cursor.execute(_INSERT_TASK_SQL, self._task_params(task_data))
 
-            task_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            return task_id
-        except Exception as e:
-            print(f"Error creating task: {e}")
-            return None
+        task_id = cursor.lastrowid
+        conn.commit()
+        return task_id
 
+    @_db_operation(0, "Error creating tasks")
+    def create_tasks(self, tasks: List[Dict]) -> int:
+        """Create several tasks in one transaction; returns how many were inserted."""
+        conn = self.get_connection()
+
+        with self._transaction(conn):
+            cursor = conn.executemany(_INSERT_TASK_SQL, [self._task_params(task_data) for task_data in tasks])
+
+        return cursor.rowcount
+
+    @staticmethod
+    def _task_params(task_data: Dict) -> tuple:
+        return (
+            task_data['meeting_id'],
+            task_data.get('assigned_to'),
+            task_data['title'],
+            task_data.get('description', ''),
+            task_data.get('due_date'),
+            task_data.get('status', 'pending'),
+            task_data.get('intended_owner')
+        )
+
+    @_db_operation(False, "Error updating task status")
     def update_task_status(self, task_id: int, status: str, user_id: int) -> bool:
         """Update task status (only by assigned user)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                UPDATE tasks SET status = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ? AND assigned_to = ?
-            ''', (status, task_id, user_id))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error updating task status: {e}")
-            return False
+        cursor.execute('''
+            UPDATE tasks SET status = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND assigned_to = ?
+        ''', (status, task_id, user_id))
 
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
+
+    @_db_operation(list, "Error getting all meetings")
     def get_all_meetings(self) -> List[Dict]:
         """Get all meetings with creator, participant, and project information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT m.id, m.title, m.description, m.transcript, m.created_by, 
-                       m.created_at, u.full_name as creator_name,
-                       COUNT(DISTINCT mp.user_id) as participant_count,
-                       p.id as project_id, p.name as project_name
-                FROM meetings m
-                LEFT JOIN users u ON m.created_by = u.id
-                LEFT JOIN meeting_participants mp ON m.id = mp.meeting_id
-                LEFT JOIN project_meetings pm ON m.id = pm.meeting_id
-                LEFT JOIN projects p ON pm.project_id = p.id
-                GROUP BY m.id, m.title, m.description, m.transcript, m.created_by, 
-                         m.created_at, u.full_name, p.id, p.name
-                ORDER BY m.created_at DESC
-            ''')
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'transcript': row[3],
-                'creator_id': row[4],
-                'created_at': row[5],
-                'creator_name': row[6],
-                'participant_count': row[7],
-                'project_id': row[8],
-                'project_name': row[9]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting all meetings: {e}")
-            return []
+        cursor.execute('''
+            SELECT m.id, m.title, m.description, m.transcript, m.created_by as creator_id, 
+                   m.created_at, u.full_name as creator_name,
+                   (SELECT COUNT(*) FROM meeting_participants mp
+                    WHERE mp.meeting_id = m.id) as participant_count,
+                   p.id as project_id, p.name as project_name
+            FROM meetings m
+            LEFT JOIN users u ON m.created_by = u.id
+            LEFT JOIN project_meetings pm ON m.id = pm.meeting_id
+            LEFT JOIN projects p ON pm.project_id = p.id
+            ORDER BY m.created_at DESC
+        ''')
+
+        return [dict(row) for row in cursor]
 
+    @_db_operation(None, "Error getting meeting by ID")
     def get_meeting_by_id(self, meeting_id: int) -> Optional[Dict]:
         """Get meeting by ID with participants and project information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            # Get meeting details with project information
-            cursor.execute('''
-                SELECT m.id, m.title, m.description, m.transcript, m.analysis_result, m.created_by, 
-                       m.created_at, u.full_name as creator_name,
-                       p.id as project_id, p.name as project_name
-                FROM meetings m
-                LEFT JOIN users u ON m.created_by = u.id
-                LEFT JOIN project_meetings pm ON m.id = pm.meeting_id
-                LEFT JOIN projects p ON pm.project_id = p.id
-                WHERE m.id = ?
-            ''', (meeting_id,))
-
-            meeting_row = cursor.fetchone()
-            if not meeting_row:
-                conn.close()
-                return None
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Get participants
-            cursor.execute('''
-                SELECT u.id, u.full_name, u.email, mp.role
-                FROM meeting_participants mp
-                JOIN users u ON mp.user_id = u.id
-                WHERE mp.meeting_id = ?
-            ''', (meeting_id,))
-
-            participants = cursor.fetchall()
-            conn.close()
-
-            # Parse analysis_result if it exists
-            analysis = None
-            if meeting_row[4]:  # analysis_result
-                try:
-                    analysis = json.loads(meeting_row[4])
-                except:
-                    analysis = None
-
-            return {
-                'id': meeting_row[0],
-                'title': meeting_row[1],
-                'description': meeting_row[2],
-                'transcript': meeting_row[3],
-                'analysis': analysis,
-                'creator_id': meeting_row[5],
-                'created_at': meeting_row[6],
-                'creator_name': meeting_row[7],
-                'project_id': meeting_row[8],
-                'project_name': meeting_row[9],
-                'participants': [{
-                    'id': p[0],
-                    'full_name': p[1],
-                    'email': p[2],
-                    'role': p[3]
-                } for p in participants]
-            }
-        except Exception as e:
-            print(f"Error getting meeting by ID: {e}")
+        # Meeting, project and participants (aggregated by JSON1) in one query
+        cursor.execute('''
+            SELECT m.id, m.title, m.description, m.transcript, m.analysis_result as analysis, m.created_by as creator_id, 
+                   m.created_at, u.full_name as creator_name,
+                   p.id as project_id, p.name as project_name,
+                   (SELECT json_group_array(json_object('id', pu.id, 'full_name', pu.full_name,
+                                                        'email', pu.email, 'role', mp.role))
+                    FROM meeting_participants mp
+                    JOIN users pu ON mp.user_id = pu.id
+                    WHERE mp.meeting_id = m.id) as participants
+            FROM meetings m
+            LEFT JOIN users u ON m.created_by = u.id
+            LEFT JOIN project_meetings pm ON m.id = pm.meeting_id
+            LEFT JOIN projects p ON pm.project_id = p.id
+            WHERE m.id = ?
+        ''', (meeting_id,))
+
+        meeting_row = cursor.fetchone()
+        if not meeting_row:
             return None
 
+        meeting = dict(meeting_row)
+
+        # Parse analysis_result if it exists
+        raw_analysis, meeting['analysis'] = meeting['analysis'], None
+        if raw_analysis:
+            try:
+                meeting['analysis'] = orjson.loads(raw_analysis)
+            except orjson.JSONDecodeError:
+                pass
+
+        meeting['participants'] = orjson.loads(meeting['participants'] or '[]')
+        return meeting
+
+    @_db_operation(False, "Error updating user")
     def update_user(self, user_id: int, user_data: Dict) -> bool:
         """Update user information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Build update query dynamically based on provided fields
-            update_fields = []
-            values = []
-            
-            for field in ['username', 'email', 'full_name', 'role', 'status', 'is_active']:
-                if field in user_data:
-                    update_fields.append(f"{field} = ?")
-                    values.append(user_data[field])
-            
-            if not update_fields:
-                return False
+        # Only the provided fields are updated; the SQL is cached per field combination
+        fields = tuple(field for field in _USER_UPDATE_FIELDS if field in user_data)
+        if not fields:
+            return False
 
-            update_fields.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(user_id)
+        values = [user_data[field] for field in fields]
+        values.append(user_id)
 
-            query = f"UPDATE users SET {', '.join(update_fields)} WHERE id = ?"
-            cursor.execute(query, values)
+        cursor.execute(_update_sql('users', fields), values)
 
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error updating user: {e}")
-            return False
+        success = cursor.rowcount > 0
+        conn.commit()
+        self._invalidate_users()
+        return success
 
+    @_db_operation(False, "Error deleting user")
     def delete_user(self, user_id: int) -> bool:
         """Delete user and related data."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Delete user's tasks
-            cursor.execute('DELETE FROM tasks WHERE assigned_to = ?', (user_id,))
-            
-            # Delete user's meeting participations
-            cursor.execute('DELETE FROM meeting_participants WHERE user_id = ?', (user_id,))
-            
-            # Delete meetings created by user
-            cursor.execute('DELETE FROM meetings WHERE created_by = ?', (user_id,))
-            
-            # Delete user
-            cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error deleting user: {e}")
-            return False
+        # Assigned tasks, participations and created meetings go by ON DELETE CASCADE
+        cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
 
+        success = cursor.rowcount > 0
+        conn.commit()
+        self._invalidate_users()
+        return success
+
+    @_db_operation(False, "Error updating meeting")
     def update_meeting(self, meeting_id: int, meeting_data: Dict) -> bool:
         """Update meeting information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Build update query dynamically based on provided fields
-            update_fields = []
-            values = []
-            
-            for field in ['title', 'description', 'transcript']:
-                if field in meeting_data:
-                    update_fields.append(f"{field} = ?")
-                    values.append(meeting_data[field])
-            
-            if not update_fields:
-                return False
+        # Only the provided fields are updated; the SQL is cached per field combination
+        fields = tuple(field for field in _MEETING_UPDATE_FIELDS if field in meeting_data)
+        if not fields:
+            return False
 
-            update_fields.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(meeting_id)
+        values = [meeting_data[field] for field in fields]
+        values.append(meeting_id)
 
-            query = f"UPDATE meetings SET {', '.join(update_fields)} WHERE id = ?"
-            cursor.execute(query, values)
+        cursor.execute(_update_sql('meetings', fields), values)
 
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error updating meeting: {e}")
-            return False
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
 
+    @_db_operation(False, "Error deleting meeting")
     def delete_meeting(self, meeting_id: int) -> bool:
         """Delete meeting and related data."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Delete meeting tasks
-            cursor.execute('DELETE FROM tasks WHERE meeting_id = ?', (meeting_id,))
-            
-            # Delete meeting participants
-            cursor.execute('DELETE FROM meeting_participants WHERE meeting_id = ?', (meeting_id,))
-            
-            # Delete meeting
-            cursor.execute('DELETE FROM meetings WHERE id = ?', (meeting_id,))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error deleting meeting: {e}")
-            return False
+        # Tasks, participants and project links go by ON DELETE CASCADE
+        cursor.execute('DELETE FROM meetings WHERE id = ?', (meeting_id,))
 
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
+
+    @_db_operation(False, "Error removing meeting participant")
     def remove_meeting_participant(self, meeting_id: int, user_id: int) -> bool:
         """Remove participant from meeting."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                DELETE FROM meeting_participants 
-                WHERE meeting_id = ? AND user_id = ?
-            ''', (meeting_id, user_id))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error removing meeting participant: {e}")
-            return False
+        cursor.execute('''
+            DELETE FROM meeting_participants 
+            WHERE meeting_id = ? AND user_id = ?
+        ''', (meeting_id, user_id))
 
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
+
+    @_db_operation(False, "Error assigning task to user")
     def assign_task_to_user(self, task_id: int, user_id: int) -> bool:
         """Assign a task to a specific user."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                UPDATE tasks SET assigned_to = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (user_id, task_id))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error assigning task to user: {e}")
-            return False
+        cursor.execute(_ASSIGN_TASK_SQL, (user_id, task_id))
+
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
+
+    @_db_operation(0, "Error assigning tasks to user")
+    def assign_tasks_to_user(self, task_ids: List[int], user_id: int) -> int:
+        """Assign several tasks to a user in one transaction; returns how many were updated."""
+        conn = self.get_connection()
+
+        with self._transaction(conn):
+            cursor = conn.executemany(_ASSIGN_TASK_SQL, [(user_id, task_id) for task_id in task_ids])
 
+        return cursor.rowcount
+
+    @_db_operation(0, "Error updating task descriptions")
+    def update_task_descriptions(self, descriptions: List[Tuple[int, str]]) -> int:
+        """Set several (task_id, description) pairs in one transaction; returns how many were updated."""
+        conn = self.get_connection()
+
+        with self._transaction(conn):
+            cursor = conn.executemany(
+                _UPDATE_TASK_DESCRIPTION_SQL, [(description, task_id) for task_id, description in descriptions]
+            )
+
+        return cursor.rowcount
+
+    @_db_operation(list, "Error getting meeting tasks")
     def get_meeting_tasks(self, meeting_id: int) -> List[Dict]:
         """Get all tasks for a specific meeting."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT t.id, t.title, t.description, t.assigned_to, t.due_date, t.status, 
-                       t.created_at, u.full_name as assigned_name
-                FROM tasks t
-                LEFT JOIN users u ON t.assigned_to = u.id
-                WHERE t.meeting_id = ?
-                ORDER BY t.created_at DESC
-            ''', (meeting_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'assigned_to': row[3],
-                'due_date': row[4],
-                'status': row[5],
-                'created_at': row[6],
-                'assigned_name': row[7]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting meeting tasks: {e}")
-            return []
+        cursor.execute('''
+            SELECT t.id, t.title, t.description, t.assigned_to, t.due_date, t.status, 
+                   t.created_at, u.full_name as assigned_name
+            FROM tasks t
+            LEFT JOIN users u ON t.assigned_to = u.id
+            WHERE t.meeting_id = ?
+            ORDER BY t.created_at DESC
+        ''', (meeting_id,))
 
+        return [dict(row) for row in cursor]
+
+    @_db_operation(list, "Error getting unassigned tasks by intended owner")
     def get_unassigned_tasks_by_intended_owner(self, meeting_id: int, owner_name: str) -> List[Dict]:
         """Get unassigned tasks that are intended for a specific owner."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Get all unassigned tasks for this meeting
-            cursor.execute('''
-                SELECT id, title, description, due_date, status, intended_owner
-                FROM tasks 
-                WHERE meeting_id = ? AND assigned_to IS NULL
-            ''', (meeting_id,))
+        # Get all unassigned tasks for this meeting
+        cursor.execute('''
+            SELECT id, title, description, due_date, status, intended_owner
+            FROM tasks 
+            WHERE meeting_id = ? AND assigned_to IS NULL
+        ''', (meeting_id,))
 
-            rows = cursor.fetchall()
-            conn.close()
+        rows = cursor.fetchall()
 
-            # Filter tasks using proper name matching to avoid partial matches
-            matching_tasks = []
-            owner_name_lower = owner_name.lower().strip()
+        # Filter tasks using proper name matching to avoid partial matches
+        matching_tasks = []
+        owner_name_lower = owner_name.lower().strip()
+        
+        for row in rows:
+            intended_owner = (row['intended_owner'] or '').lower().strip()
             
-            for row in rows:
-                intended_owner = (row[5] or '').lower().strip()
-                
-                # Check for exact match or proper word boundary match
-                if (intended_owner == owner_name_lower or 
-                    owner_name_lower in intended_owner.split()):
-                    matching_tasks.append({
-                        'id': row[0],
-                        'title': row[1],
-                        'description': row[2],
-                        'due_date': row[3],
-                        'status': row[4],
-                        'intended_owner': row[5]
-                    })
-
-            return matching_tasks
-        except Exception as e:
-            print(f"Error getting unassigned tasks by intended owner: {e}")
-            return []
+            # Check for exact match or proper word boundary match
+            if (intended_owner == owner_name_lower or 
+                owner_name_lower in intended_owner.split()):
+                matching_tasks.append(dict(row))
+
+        return matching_tasks
 
+    @_db_operation(list, "Error getting user assigned tasks")
     def get_user_assigned_tasks(self, user_id: int) -> List[Dict]:
         """Get all tasks assigned to a specific user with meeting information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT t.id, t.title, t.description, t.due_date, t.status, 
-                       t.created_at, t.updated_at, m.title as meeting_title,
-                       m.id as meeting_id, m.created_at as meeting_date
-                FROM tasks t
-                JOIN meetings m ON t.meeting_id = m.id
-                WHERE t.assigned_to = ?
-                ORDER BY t.due_date ASC, t.created_at DESC
-            ''', (user_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'due_date': row[3],
-                'status': row[4],
-                'created_at': row[5],
-                'updated_at': row[6],
-                'meeting_title': row[7],
-                'meeting_id': row[8],
-                'meeting_date': row[9]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting user assigned tasks: {e}")
-            return []
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
+        cursor.execute('''
+            SELECT t.id, t.title, t.description, t.due_date, t.status, 
+                   t.created_at, t.updated_at, m.title as meeting_title,
+                   m.id as meeting_id, m.created_at as meeting_date
+            FROM tasks t
+            JOIN meetings m ON t.meeting_id = m.id
+            WHERE t.assigned_to = ?
+            ORDER BY t.due_date ASC, t.created_at DESC
+        ''', (user_id,))
+
+        return [dict(row) for row in cursor]
+
+    @_db_operation(False, "Error updating user email")
     def update_user_email(self, user_id: int, new_email: str) -> bool:
         """Update user's email address (used when converting placeholder to real user)."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Update email and username to the new email
-            cursor.execute('''
-                UPDATE users 
-                SET email = ?, username = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (new_email, new_email, user_id))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error updating user email: {e}")
-            return False
+        # Update email and username to the new email
+        cursor.execute('''
+            UPDATE users 
+            SET email = ?, username = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (new_email, new_email, user_id))
+
+        success = cursor.rowcount > 0
+        conn.commit()
+        self._invalidate_users()
+        return success
+
+    @_db_operation(False, "Error updating password hash")
+    def update_password_hash(self, user_id: int, password_hash: str) -> bool:
+        """Replace a user's password hash (used to upgrade hashes on login)."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            UPDATE users 
+            SET password_hash = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (password_hash, user_id))
+
+        success = cursor.rowcount > 0
+        conn.commit()
+        self._invalidate_users()
+        return success
 
     # Project Management Methods
+    @_db_operation(None, "Error creating project")
     def create_project(self, project_data: Dict) -> Optional[int]:
         """Create a new project."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT INTO projects (name, description, status, start_date, end_date, created_by)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                project_data['name'],
-                project_data.get('description'),
-                project_data.get('status', 'active'),
-                project_data.get('start_date'),
-                project_data.get('end_date'),
-                project_data.get('created_by')
-            ))
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            project_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            return project_id
-        except Exception as e:
-            print(f"Error creating project: {e}")
-            return None
+        cursor.execute('''
+            INSERT INTO projects (name, description, status, start_date, end_date, created_by)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            project_data['name'],
+            project_data.get('description'),
+            project_data.get('status', 'active'),
+            project_data.get('start_date'),
+            project_data.get('end_date'),
+            project_data.get('created_by')
+        ))
+
+        project_id = cursor.lastrowid
+        conn.commit()
+        return project_id
 
+    @_db_operation(list, "Error getting all projects")
     def get_all_projects(self) -> List[Dict]:
         """Get all projects with creator information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT p.id, p.name, p.description, p.status, p.start_date, p.end_date,
-                       p.created_by, p.created_at, p.updated_at, u.full_name as creator_name
-                FROM projects p
-                LEFT JOIN users u ON p.created_by = u.id
-                ORDER BY p.created_at DESC
-            ''')
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'name': row[1],
-                'description': row[2],
-                'status': row[3],
-                'start_date': row[4],
-                'end_date': row[5],
-                'created_by': row[6],
-                'created_at': row[7],
-                'updated_at': row[8],
-                'creator_name': row[9]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting all projects: {e}")
-            return []
+        cursor.execute('''
+            SELECT p.id, p.name, p.description, p.status, p.start_date, p.end_date,
+                   p.created_by, p.created_at, p.updated_at, u.full_name as creator_name
+            FROM projects p
+            LEFT JOIN users u ON p.created_by = u.id
+            ORDER BY p.created_at DESC
+        ''')
+
+        return [dict(row) for row in cursor]
 
+    @_db_operation(None, "Error getting project by ID")
     def get_project_by_id(self, project_id: int) -> Optional[Dict]:
         """Get project by ID with creator information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT p.id, p.name, p.description, p.status, p.start_date, p.end_date,
-                       p.created_by, p.created_at, p.updated_at, u.full_name as creator_name
-                FROM projects p
-                LEFT JOIN users u ON p.created_by = u.id
-                WHERE p.id = ?
-            ''', (project_id,))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            if row:
-                return {
-                    'id': row[0],
-                    'name': row[1],
-                    'description': row[2],
-                    'status': row[3],
-                    'start_date': row[4],
-                    'end_date': row[5],
-                    'created_by': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8],
-                    'creator_name': row[9]
-                }
-            return None
-        except Exception as e:
-            print(f"Error getting project by ID: {e}")
-            return None
+        cursor.execute('''
+            SELECT p.id, p.name, p.description, p.status, p.start_date, p.end_date,
+                   p.created_by, p.created_at, p.updated_at, u.full_name as creator_name
+            FROM projects p
+            LEFT JOIN users u ON p.created_by = u.id
+            WHERE p.id = ?
+        ''', (project_id,))
 
+        row = cursor.fetchone()
+
+        if row:
+            return dict(row)
+        return None
+
+    @_db_operation(False, "Error updating project")
     def update_project(self, project_id: int, project_data: Dict) -> bool:
         """Update project information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Build update query dynamically based on provided fields
-            update_fields = []
-            values = []
-            
-            for field in ['name', 'description', 'status', 'start_date', 'end_date']:
-                if field in project_data:
-                    update_fields.append(f"{field} = ?")
-                    values.append(project_data[field])
-            
-            if not update_fields:
-                return False
+        # Only the provided fields are updated; the SQL is cached per field combination
+        fields = tuple(field for field in _PROJECT_UPDATE_FIELDS if field in project_data)
+        if not fields:
+            return False
 
-            update_fields.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(project_id)
+        values = [project_data[field] for field in fields]
+        values.append(project_id)
 
-            query = f"UPDATE projects SET {', '.join(update_fields)} WHERE id = ?"
-            cursor.execute(query, values)
+        cursor.execute(_update_sql('projects', fields), values)
 
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error updating project: {e}")
-            return False
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
 
+    @_db_operation(False, "Error deleting project")
     def delete_project(self, project_id: int) -> bool:
         """Delete a project and all its meeting associations."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Delete project (project_meetings will be deleted by CASCADE)
-            cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-            
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error deleting project: {e}")
-            return False
+        # Delete project (project_meetings will be deleted by CASCADE)
+        cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+        
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
 
+    @_db_operation(False, "Error linking meeting to project")
     def link_meeting_to_project(self, project_id: int, meeting_id: int) -> bool:
         """Link a meeting to a project."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                INSERT OR IGNORE INTO project_meetings (project_id, meeting_id)
-                VALUES (?, ?)
-            ''', (project_id, meeting_id))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error linking meeting to project: {e}")
-            return False
+        cursor.execute('''
+            INSERT OR IGNORE INTO project_meetings (project_id, meeting_id)
+            VALUES (?, ?)
+        ''', (project_id, meeting_id))
 
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
+
+    @_db_operation(False, "Error unlinking meeting from project")
     def unlink_meeting_from_project(self, project_id: int, meeting_id: int) -> bool:
         """Unlink a meeting from a project."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                DELETE FROM project_meetings 
-                WHERE project_id = ? AND meeting_id = ?
-            ''', (project_id, meeting_id))
-
-            success = cursor.rowcount > 0
-            conn.commit()
-            conn.close()
-            return success
-        except Exception as e:
-            print(f"Error unlinking meeting from project: {e}")
-            return False
+        cursor.execute('''
+            DELETE FROM project_meetings 
+            WHERE project_id = ? AND meeting_id = ?
+        ''', (project_id, meeting_id))
+
+        success = cursor.rowcount > 0
+        conn.commit()
+        return success
 
+    @_db_operation(list, "Error getting project meetings")
     def get_project_meetings(self, project_id: int) -> List[Dict]:
         """Get all meetings linked to a project."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT m.id, m.title, m.description, m.created_at, m.created_by,
-                       u.full_name as creator_name, pm.linked_at
-                FROM project_meetings pm
-                JOIN meetings m ON pm.meeting_id = m.id
-                LEFT JOIN users u ON m.created_by = u.id
-                WHERE pm.project_id = ?
-                ORDER BY pm.linked_at DESC
-            ''', (project_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'created_at': row[3],
-                'created_by': row[4],
-                'creator_name': row[5],
-                'linked_at': row[6]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting project meetings: {e}")
-            return []
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
+        cursor.execute('''
+            SELECT m.id, m.title, m.description, m.created_at, m.created_by,
+                   u.full_name as creator_name, pm.linked_at
+            FROM project_meetings pm
+            JOIN meetings m ON pm.meeting_id = m.id
+            LEFT JOIN users u ON m.created_by = u.id
+            WHERE pm.project_id = ?
+            ORDER BY pm.linked_at DESC
+        ''', (project_id,))
+
+        return [dict(row) for row in cursor]
+
+    @_db_operation(list, "Error getting meeting projects")
     def get_meeting_projects(self, meeting_id: int) -> List[Dict]:
         """Get all projects that a meeting is linked to."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT p.id, p.name, p.description, p.status, p.created_at,
-                       u.full_name as creator_name, pm.linked_at
-                FROM project_meetings pm
-                JOIN projects p ON pm.project_id = p.id
-                LEFT JOIN users u ON p.created_by = u.id
-                WHERE pm.meeting_id = ?
-                ORDER BY pm.linked_at DESC
-            ''', (meeting_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'name': row[1],
-                'description': row[2],
-                'status': row[3],
-                'created_at': row[4],
-                'creator_name': row[5],
-                'linked_at': row[6]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting meeting projects: {e}")
-            return []
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
+        cursor.execute('''
+            SELECT p.id, p.name, p.description, p.status, p.created_at,
+                   u.full_name as creator_name, pm.linked_at
+            FROM project_meetings pm
+            JOIN projects p ON pm.project_id = p.id
+            LEFT JOIN users u ON p.created_by = u.id
+            WHERE pm.meeting_id = ?
+            ORDER BY pm.linked_at DESC
+        ''', (meeting_id,))
+
+        return [dict(row) for row in cursor]
+
+    @_db_operation(list, "Error getting unlinked meetings")
     def get_unlinked_meetings(self, project_id: int) -> List[Dict]:
         """Get all meetings that are not linked to a specific project."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT m.id, m.title, m.description, m.created_at, m.created_by,
-                       u.full_name as creator_name
-                FROM meetings m
-                LEFT JOIN users u ON m.created_by = u.id
-                WHERE m.id NOT IN (
-                    SELECT meeting_id FROM project_meetings WHERE project_id = ?
-                )
-                ORDER BY m.created_at DESC
-            ''', (project_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'created_at': row[3],
-                'created_by': row[4],
-                'creator_name': row[5]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting unlinked meetings: {e}")
-            return []
+        cursor.execute('''
+            SELECT m.id, m.title, m.description, m.created_at, m.created_by,
+                   u.full_name as creator_name
+            FROM meetings m
+            LEFT JOIN users u ON m.created_by = u.id
+            WHERE m.id NOT IN (
+                SELECT meeting_id FROM project_meetings WHERE project_id = ?
+            )
+            ORDER BY m.created_at DESC
+        ''', (project_id,))
+
+        return [dict(row) for row in cursor]
 
+    @_db_operation(list, "Error getting projects for user")
     def get_projects_by_user(self, user_id: int) -> List[Dict]:
         """Get all projects created by a specific user."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT p.id, p.name, p.description, p.status, p.start_date, p.end_date,
-                       p.created_by, p.created_at, p.updated_at, u.full_name as creator_name
-                FROM projects p
-                LEFT JOIN users u ON p.created_by = u.id
-                WHERE p.created_by = ?
-                ORDER BY p.created_at DESC
-            ''', (user_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'name': row[1],
-                'description': row[2],
-                'status': row[3],
-                'start_date': row[4],
-                'end_date': row[5],
-                'created_by': row[6],
-                'created_at': row[7],
-                'updated_at': row[8],
-                'creator_name': row[9]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting projects for user {user_id}: {e}")
-            return []
+        cursor.execute('''
+            SELECT p.id, p.name, p.description, p.status, p.start_date, p.end_date,
+                   p.created_by, p.created_at, p.updated_at, u.full_name as creator_name
+            FROM projects p
+            LEFT JOIN users u ON p.created_by = u.id
+            WHERE p.created_by = ?
+            ORDER BY p.created_at DESC
+        ''', (user_id,))
+
+        return [dict(row) for row in cursor]
 
+    @_db_operation(list, "Error getting meetings for user")
     def get_meetings_by_user(self, user_id: int) -> List[Dict]:
         """Get all meetings created by a specific user with their project information."""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT m.id, m.title, m.description, m.created_at, m.created_by, 
-                       u.full_name as creator_name, p.id as project_id, p.name as project_name
-                FROM meetings m
-                LEFT JOIN users u ON m.created_by = u.id
-                LEFT JOIN project_meetings pm ON m.id = pm.meeting_id
-                LEFT JOIN projects p ON pm.project_id = p.id
-                WHERE m.created_by = ?
-                ORDER BY m.created_at DESC
-            ''', (user_id,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [{
-                'id': row[0],
-                'title': row[1],
-                'description': row[2],
-                'created_at': row[3],
-                'created_by': row[4],
-                'creator_name': row[5],
-                'project_id': row[6],
-                'project_name': row[7]
-            } for row in rows]
-        except Exception as e:
-            print(f"Error getting meetings for user {user_id}: {e}")
-            return []
+        cursor.execute('''
+            SELECT m.id, m.title, m.description, m.created_at, m.created_by, 
+                   u.full_name as creator_name, p.id as project_id, p.name as project_name
+            FROM meetings m
+            LEFT JOIN users u ON m.created_by = u.id
+            LEFT JOIN project_meetings pm ON m.id = pm.meeting_id
+            LEFT JOIN projects p ON pm.project_id = p.id
+            WHERE m.created_by = ?
+            ORDER BY m.created_at DESC
+        ''', (user_id,))
+
+        return [dict(row) for row in cursor]
@@ -1,33 +1,39 @@
 """FastAPI web interface for meeting transcript analysis and email generation with JWT authentication."""
 
-from fastapi import FastAPI, Request, Form, HTTPException, UploadFile, File, Depends, status
+from fastapi import FastAPI, Request, Form, HTTPException, UploadFile, File, Depends, status, BackgroundTasks
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 import os
+import logging
 from pathlib import Path
 from typing import Optional, List
 from dotenv import load_dotenv
-import json
 import uuid
 from datetime import datetime, timedelta
 import sendgrid
 from sendgrid.helpers.mail import Mail, TrackingSettings, ClickTracking, OpenTracking
 
-from trello_integrate import TrelloClient
+import asyncio
+from trello_integrate import TrelloClient, AsyncTrelloClient
 import os
 
 # Hardcode hoặc lấy từ biến môi trường id workspace Trello mong muốn
 TRELLO_ORG_ID = os.getenv("TRELLO_ORG_ID", "68a95b4b93544cdb2b50861b")
 TRELLO_ORG_ID = "68a95b4b93544cdb2b50861b"
+# Spacing between explicit Trello list/card positions (Trello's own default gap)
+TRELLO_POS_STEP = 16384
 # Load environment variables from .env file
 load_dotenv()
 
+# Analyzer and integration modules log through `logging`; LOG_LEVEL=DEBUG shows payload details
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s")
+
 from meeting_analyzer import MeetingTranscriptAnalyzer, MeetingData, EmailType
 from database import EmailTrackingDB
 from auth import (
-    verify_password, get_password_hash, create_access_token, 
+    averify_password, aget_password_hash, password_needs_rehash, create_access_token, 
     get_current_user, get_admin_user, get_manager_user, get_manager_or_admin_user,
     UserRole, create_default_admin_if_not_exists
 )
@@ -82,7 +88,7 @@ try:
         raise ValueError("OpenAI API key is required. Please set OPENAI_API_KEY in your environment variables or .env file.")
    
     analyzer = MeetingTranscriptAnalyzer(api_key, base_url)
-    print("✅ OpenAI API connection established successfully")
+    print("✅ OpenAI API client initialized (connection is validated on first use)")
    
 except Exception as e:
     print(f"❌ Failed to initialize OpenAI API: {e}")
@@ -130,7 +136,7 @@ async def register(user_data: UserRegister):
                 )
             
             # Update user from "created" to "registered" status
-            hashed_password = get_password_hash(user_data.password)
+            hashed_password = await aget_password_hash(user_data.password)
             updated = user_db.update_user_status_to_registered(
                 user_data.email, 
                 hashed_password, 
@@ -159,7 +165,7 @@ async def register(user_data: UserRegister):
             )
         
         # Create completely new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await aget_password_hash(user_data.password)
         user_dict = {
             "username": user_data.username,
             "email": user_data.email,
@@ -198,8 +204,14 @@ async def register(user_data: UserRegister):
         "user": user_info
     }
 
+async def rehash_user_password(user_id: int, password: str):
+    """Upgrade a user's stored password hash to the current hashing settings."""
+    new_hash = await aget_password_hash(password)
+    if user_db.update_password_hash(user_id, new_hash):
+        print(f"🔐 Upgraded password hash for user {user_id}")
+
 @app.post("/api/auth/login", response_model=Token)
-async def login(user_data: UserLogin):
+async def login(user_data: UserLogin, background_tasks: BackgroundTasks):
     """Authenticate user and return JWT token."""
     user = user_db.get_user_by_username_any_status(user_data.username)
     
@@ -234,13 +246,17 @@ async def login(user_data: UserLogin):
             )
     
     # Only verify password for registered users (who have valid password hashes)
-    if not user["password_hash"] or not verify_password(user_data.password, user["password_hash"]):
+    if not user["password_hash"] or not await averify_password(user_data.password, user["password_hash"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Upgrade outdated password hashes after the response is sent
+    if password_needs_rehash(user["password_hash"]):
+        background_tasks.add_task(rehash_user_password, user["id"], user_data.password)
+    
     # Create access token
     access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
@@ -343,7 +359,7 @@ async def analyze_meeting_transcript(
         print("🔍 Processing transcript length:", len(analysis_data.transcript))
         
         # Analyze the meeting
-        meeting_summary = analyzer.analyze_transcript(meeting_data)
+        meeting_summary = await analyzer.aanalyze_transcript(meeting_data)
         
         print("✅ Meeting analysis complete")
         
@@ -352,7 +368,7 @@ async def analyze_meeting_transcript(
             "title": analysis_data.meeting_title,
             "description": "Meeting analyzed by AI",
             "transcript": analysis_data.transcript,
-            "analysis_result": json.dumps({
+            "analysis_result": {
                 "executive_summary": meeting_summary.executive_summary,
                 "key_decisions": meeting_summary.key_decisions,
                 "action_items": [
@@ -366,7 +382,7 @@ async def analyze_meeting_transcript(
                 ],
                 "next_steps": meeting_summary.next_steps,
                 "risks_concerns": meeting_summary.risks_concerns
-            })
+            }
         }
         
         meeting_id = user_db.create_meeting(meeting_record, current_user["user_id"])
@@ -378,38 +394,32 @@ async def analyze_meeting_transcript(
             )
         
         # Add participants to meeting
-        for participant_id in analysis_data.participants:
-            user_db.add_meeting_participant(meeting_id, participant_id, "participant")
+        user_db.add_meeting_participants(
+            meeting_id, [(participant_id, "participant") for participant_id in analysis_data.participants]
+        )
         
         # Create tasks from action items
-        created_tasks = []
+        users = user_db.get_all_users() if any(item.owner for item in meeting_summary.action_items) else []
+        new_tasks = []
         for item in meeting_summary.action_items:
             # Try to find user by name (simplified matching)
             assigned_user = None
             if item.owner:
-                users = user_db.get_all_users()
                 for user in users:
                     if item.owner.lower() in user["full_name"].lower():
                         assigned_user = user["id"]
                         break
             
-            task_data = {
+            new_tasks.append({
                 "meeting_id": meeting_id,
                 "assigned_to": assigned_user,
                 "title": item.task,
                 "description": f"Priority: {item.priority}",
                 "due_date": item.due_date,
                 "status": "pending"
-            }
-            
-            task_id = user_db.create_task(task_data)
-            if task_id:
-                created_tasks.append({
-                    "id": task_id,
-                    "title": item.task,
-                    "assigned_to": assigned_user,
-                    "due_date": item.due_date
-                })
+            })
+        
+        user_db.create_tasks(new_tasks)
         
         return AnalysisResponse(
             success=True,
@@ -465,7 +475,7 @@ async def analyze_meeting_ajax(
         print("🔍 Processing transcript length:", len(transcript))
         
         # Analyze the meeting (this will auto-extract metadata)
-        meeting_summary = analyzer.analyze_transcript(meeting_data)
+        meeting_summary = await analyzer.aanalyze_transcript(meeting_data)
         
         print("✅ Meeting analysis complete")
         print("👥 Extracted participants data:", getattr(meeting_data, 'participants_data', []))
@@ -525,10 +535,15 @@ async def analyze_meeting_ajax(
                     print(f"[TRELLO] create_board result: {board}")
                     board_id = board["id"]
                     user_db.update_project(project["id"], {"trello_board_id": board_id})
-            # Always ensure To Do list exists
-            print(f"[TRELLO] Getting lists for board {board_id}")
-            lists = trello.get_lists(board_id)
+            # Lists and labels come back in one batched round trip
+            print(f"[TRELLO] Getting lists and labels for board {board_id}")
+            overview = trello.get_board_overview(board_id, raise_errors=False)
+            lists = overview["lists"]
+            if isinstance(lists, Exception):
+                raise lists
             print(f"[TRELLO] get_lists result: {lists}")
+
+            # Always ensure To Do list exists
             todo_list_id = None
             for l in lists:
                 if l["name"].strip().lower() == "to do":
@@ -549,8 +564,9 @@ async def analyze_meeting_ajax(
             # Get all labels on the board
             label_map = {}
             try:
-                print(f"[TRELLO] Getting labels for board {board_id}")
-                labels = trello.get_labels(board_id)
+                labels = overview["labels"]
+                if isinstance(labels, Exception):
+                    raise labels
                 print(f"[TRELLO] get_labels result: {labels}")
                 for label in labels:
                     if label.get("name"):
@@ -633,7 +649,7 @@ async def analyze_meeting_ajax(
             'title': meeting_data.title or 'Meeting Analysis',
             'description': f"Meeting from {meeting_data.date}",
             'transcript': transcript,
-            'analysis_result': json.dumps({
+            'analysis_result': {
                 "executive_summary": meeting_summary.executive_summary,
                 "key_decisions": meeting_summary.key_decisions,
                 "action_items": [
@@ -647,7 +663,7 @@ async def analyze_meeting_ajax(
                 ],
                 "next_steps": meeting_summary.next_steps,
                 "risks_concerns": meeting_summary.risks_concerns
-            })
+            }
         }, current_user["user_id"])
         
         # Link meeting to project if project_id is provided
@@ -668,17 +684,16 @@ async def analyze_meeting_ajax(
         # Create tasks from action items but DON'T assign to users yet
         # This will be done later when sending emails
         if meeting_id:
-            for item in meeting_summary.action_items:
-                task_id = user_db.create_task({
-                    'meeting_id': meeting_id,
-                    'assigned_to': None,  # No assignment during analysis
-                    'title': item.task,
-                    'description': f"Priority: {item.priority}, Owner: {item.owner or 'Unassigned'}",
-                    'due_date': item.due_date,
-                    'status': 'pending',
-                    'intended_owner': item.owner  # Store intended owner for later assignment
-                })
-                print(f"📝 Created unassigned task {task_id}: '{item.task}' (intended for: {item.owner or 'Unassigned'})")
+            created_count = user_db.create_tasks([{
+                'meeting_id': meeting_id,
+                'assigned_to': None,  # No assignment during analysis
+                'title': item.task,
+                'description': f"Priority: {item.priority}, Owner: {item.owner or 'Unassigned'}",
+                'due_date': item.due_date,
+                'status': 'pending',
+                'intended_owner': item.owner  # Store intended owner for later assignment
+            } for item in meeting_summary.action_items])
+            print(f"📝 Created {created_count} unassigned tasks (owners: {', '.join(item.owner or 'Unassigned' for item in meeting_summary.action_items)})")
         
         # Prepare participant data for frontend (no user creation here)
         participants_data = getattr(meeting_data, 'participants_data', [])
@@ -852,8 +867,8 @@ async def send_email(
                             unassigned_tasks.append(task)
             
             # Assign found tasks to the user
+            user_db.assign_tasks_to_user([task['id'] for task in unassigned_tasks], user_id)
             for task in unassigned_tasks:
-                user_db.assign_task_to_user(task['id'], user_id)
                 print(f"📋 Assigned task '{task['title']}' (ID: {task['id']}) to {recipient_name} based on intended owner: {task['intended_owner']}")
             
             if unassigned_tasks:
@@ -958,12 +973,12 @@ async def analyze_meeting(
         meeting_data = MeetingData(transcript=transcript)
        
         # Analyze the meeting (this will auto-extract metadata)
-        meeting_summary = analyzer.analyze_transcript(meeting_data)
+        meeting_summary = await analyzer.aanalyze_transcript(meeting_data)
        
         # Generate email based on selected type
         email_type_enum = EmailType(email_type)
         recipient_list = [r.strip() for r in recipients.split(",")]
-        generated_email = analyzer.generate_stakeholder_email(
+        generated_email = await analyzer.agenerate_stakeholder_email(
             meeting_summary, email_type_enum, recipient_list
         )
        
@@ -1110,21 +1125,16 @@ async def get_user_meeting_details(
     current_user: dict = Depends(get_current_user)
 ):
     """Get meeting details for a user (only if they're a participant)."""
-    # Check if user is a participant in this meeting
-    user_meetings = user_db.get_user_meetings(current_user["user_id"])
-    meeting_ids = [m["id"] for m in user_meetings]
-    
-    if meeting_id not in meeting_ids:
+    # Get detailed meeting information; its participant list doubles as the access check
+    meeting = user_db.get_meeting_by_id(meeting_id)
+    participants = meeting['participants'] if meeting else []
+    user_participant = next((p for p in participants if p['id'] == current_user["user_id"]), None)
+    if user_participant is None:
         raise HTTPException(
             status_code=403,
             detail="You don't have access to this meeting"
         )
     
-    # Get detailed meeting information
-    meeting = user_db.get_meeting_by_id(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    
     # Get user tasks for this meeting
     user_tasks = user_db.get_user_tasks(current_user["user_id"])
     meeting_tasks = [task for task in user_tasks if task.get("meeting_id") == meeting_id]
@@ -1132,16 +1142,8 @@ async def get_user_meeting_details(
     # Add tasks to meeting data
     meeting["tasks"] = meeting_tasks
     
-    # Add user role from the participants list
-    user_participant = next((p for p in meeting['participants'] if p['id'] == current_user["user_id"]), None)
-    if user_participant:
-        meeting['user_role'] = user_participant['role']
-    else:
-        # If not found in participants, check if user is the creator
-        if meeting.get('created_by') == current_user["user_id"]:
-            meeting['user_role'] = 'organizer'
-        else:
-            meeting['user_role'] = 'participant'
+    # Add user role from the participant entry that granted access
+    meeting['user_role'] = user_participant['role']
     
     return meeting
 
@@ -1254,8 +1256,9 @@ async def create_meeting(
         )
     
     # Add participants
-    for participant_id in meeting_data.participants:
-        user_db.add_meeting_participant(meeting_id, participant_id, "participant")
+    user_db.add_meeting_participants(
+        meeting_id, [(participant_id, "participant") for participant_id in meeting_data.participants]
+    )
     
     return {"meeting_id": meeting_id, "message": "Meeting created successfully"}
 
@@ -1433,7 +1436,7 @@ async def analyze_and_create_trello_cards(
         )
     try:
         meeting_data = MeetingData(transcript=analysis_data.transcript)
-        meeting_summary = analyzer.analyze_transcript(meeting_data)
+        meeting_summary = await analyzer.aanalyze_transcript(meeting_data)
 
         # Extract board name from meeting_title, removing any prefix like 'Analyzing meeting:'
         meeting_title = analysis_data.meeting_title
@@ -1453,7 +1456,7 @@ async def analyze_and_create_trello_cards(
                 "title": meeting_title,
                 "description": "Meeting analyzed by AI",
                 "transcript": analysis_data.transcript,
-                "analysis_result": json.dumps({
+                "analysis_result": {
                     "executive_summary": meeting_summary.executive_summary,
                     "key_decisions": meeting_summary.key_decisions,
                     "action_items": [
@@ -1467,7 +1470,7 @@ async def analyze_and_create_trello_cards(
                     ],
                     "next_steps": meeting_summary.next_steps,
                     "risks_concerns": meeting_summary.risks_concerns
-                })
+                }
             }
             meeting_id = user_db.create_meeting(meeting_record, current_user["user_id"])
             if not meeting_id:
@@ -1476,175 +1479,183 @@ async def analyze_and_create_trello_cards(
                     detail="Failed to save meeting analysis"
                 )
             # Add participants to meeting
-            for participant_id in analysis_data.participants:
-                user_db.add_meeting_participant(meeting_id, participant_id, "participant")
+            user_db.add_meeting_participants(
+                meeting_id, [(participant_id, "participant") for participant_id in analysis_data.participants]
+            )
 
         # Create tasks from action items (skip if already exists for this meeting and title)
-        created_tasks = []
+        users = user_db.get_all_users() if any(item.owner for item in meeting_summary.action_items) else []
+        existing_titles = {t["title"] for t in user_db.get_meeting_tasks(meeting_id)}
+        new_tasks = []
         for item in meeting_summary.action_items:
             assigned_user = None
             if item.owner:
-                users = user_db.get_all_users()
                 for user in users:
                     if item.owner.lower() in user["full_name"].lower():
                         assigned_user = user["id"]
                         break
             # Check for existing task with same title for this meeting
-            existing_tasks = user_db.get_meeting_tasks(meeting_id)
-            if any(t["title"] == item.task for t in existing_tasks):
+            if item.task in existing_titles:
                 continue
-            task_data = {
+            existing_titles.add(item.task)
+            new_tasks.append({
                 "meeting_id": meeting_id,
                 "assigned_to": assigned_user,
                 "title": item.task,
                 "description": f"Priority: {item.priority}",
                 "due_date": item.due_date,
                 "status": "pending"
-            }
-            task_id = user_db.create_task(task_data)
-            if task_id:
-                created_tasks.append({
-                    "id": task_id,
-                    "title": item.task,
-                    "assigned_to": assigned_user,
-                    "due_date": item.due_date
-                })
+            })
+        user_db.create_tasks(new_tasks)
 
         # --- Trello integration: create board/lists if needed, then create cards ---
-        trello = TrelloClient()
-        # Use board_name (extracted) for Trello project/board
-        project = user_db.get_project_by_name(board_name)
-        if not project:
-            # Create project in DB
-            project_id = user_db.create_project({
-                "name": board_name,
-                "description": f"Project for meeting: {board_name}",
-                "created_by": current_user["user_id"]
-            })
+        # Independent Trello calls are issued together so their round trips overlap
+        async with AsyncTrelloClient() as trello:
+            # Use board_name (extracted) for Trello project/board
             project = user_db.get_project_by_name(board_name)
-        # Check if project has trello_board_id
-        board_id = project.get("trello_board_id")
-        if not board_id:
-            # Check if a board with the same name already exists in Trello
-            existing_board = trello.find_board_by_name(board_name)
-            if existing_board:
-                board_id = existing_board["id"]
-                # Save board_id to project
-                user_db.update_project(project["id"], {"trello_board_id": board_id})
+            if not project:
+                # Create project in DB
+                project_id = user_db.create_project({
+                    "name": board_name,
+                    "description": f"Project for meeting: {board_name}",
+                    "created_by": current_user["user_id"]
+                })
+                project = user_db.get_project_by_name(board_name)
+            # Check if project has trello_board_id
+            board_id = project.get("trello_board_id")
+            todo_list_id = None
+            if not board_id:
+                # Check if a board with the same name already exists in Trello
+                existing_board = await trello.find_board_by_name(board_name)
+                if existing_board:
+                    board_id = existing_board["id"]
+                    # Save board_id to project
+                    user_db.update_project(project["id"], {"trello_board_id": board_id})
+                else:
+                    # Create Trello board (public) in the hardcoded workspace (organization)
+                    board = await trello.create_board(board_name, public=True, idOrganization=TRELLO_ORG_ID)
+                    board_id = board["id"]
+                    # Create lists: To Do, In Progress, Done (explicit pos keeps the order when created concurrently)
+                    todo_list, inprogress_list, done_list = await asyncio.gather(*(
+                        trello.create_list(board_id, list_name, pos=str(TRELLO_POS_STEP * (i + 1)))
+                        for i, list_name in enumerate(("To Do", "In Progress", "Done"))
+                    ))
+                    # Save board_id to project
+                    user_db.update_project(project["id"], {"trello_board_id": board_id})
+                    # Save list ids to project (optional: you can add columns for these if needed)
+                    todo_list_id = todo_list["id"]
+
+            # Lists and labels of an existing board come back in one /batch round trip
+            overview = await trello.get_board_overview(board_id, raise_errors=False)
+            if not todo_list_id:
+                lists = overview["lists"]
+                if isinstance(lists, Exception):
+                    raise lists
                 # Get To Do list id by name
-                lists = trello.get_lists(board_id)
-                todo_list_id = None
                 for l in lists:
                     if l["name"].strip().lower() == "to do":
                         todo_list_id = l["id"]
                         break
                 if not todo_list_id:
-                    todo_list = trello.create_list(board_id, "To Do")
+                    todo_list = await trello.create_list(board_id, "To Do")
                     todo_list_id = todo_list["id"]
+
+            # Deduplicate cards by name in To Do list
+            trello_results = []
+            existing_cards = await trello.get_cards_in_list(todo_list_id) or []
+            existing_card_names = {card["name"] for card in existing_cards}
+
+            # Get all labels on the board
+            label_map = {}
+            if isinstance(overview["labels"], Exception):
+                print(f"Error fetching Trello labels: {overview['labels']}")
             else:
-                # Create Trello board (public) in the hardcoded workspace (organization)
-                board = trello.create_board(board_name, public=True, idOrganization=TRELLO_ORG_ID)
-                board_id = board["id"]
-                # Create lists: To Do, In Progress, Done
-                todo_list = trello.create_list(board_id, "To Do")
-                inprogress_list = trello.create_list(board_id, "In Progress")
-                done_list = trello.create_list(board_id, "Done")
-                # Save board_id to project
-                user_db.update_project(project["id"], {"trello_board_id": board_id})
-                # Save list ids to project (optional: you can add columns for these if needed)
-                todo_list_id = todo_list["id"]
-        else:
-            # Get To Do list id by name
-            lists = trello.get_lists(board_id)
-            todo_list_id = None
-            for l in lists:
-                if l["name"].strip().lower() == "to do":
-                    todo_list_id = l["id"]
-                    break
-            if not todo_list_id:
-                todo_list = trello.create_list(board_id, "To Do")
-                todo_list_id = todo_list["id"]
+                for label in overview["labels"]:
+                    if label.get("name"):
+                        label_map[label["name"].strip().lower()] = label
 
-        # Deduplicate cards by name in To Do list
-        trello_results = []
-        existing_cards = trello.get_cards_in_list(todo_list_id) or []
-        existing_card_names = {card["name"] for card in existing_cards}
 
-        # Get all labels on the board
-        label_map = {}
-        try:
-            labels = trello.get_labels(board_id)
-            for label in labels:
-                if label.get("name"):
-                    label_map[label["name"].strip().lower()] = label
-        except Exception as e:
-            print(f"Error fetching Trello labels: {e}")
+            from dateutil.parser import isoparse
+            def is_valid_iso8601(date_str):
+                if not date_str or date_str == "TBD":
+                    return False
+                try:
+                    isoparse(date_str)
+                    return True
+                except Exception:
+                    return False
 
+            new_items = []
+            for item in meeting_summary.action_items:
+                if item.task in existing_card_names:
+                    continue
+                new_items.append(item)
 
-        from dateutil.parser import isoparse
-        def is_valid_iso8601(date_str):
-            if not date_str or date_str == "TBD":
-                return False
-            try:
-                isoparse(date_str)
-                return True
-            except Exception:
-                return False
+            # Create each missing priority label once, all at the same time
+            color_map = {"critical": "red", "high": "yellow", "medium": "sky", "low": "green"}
+            missing_labels = {}
+            for item in new_items:
+                label_name = str(item.priority).strip() if item.priority else None
+                if label_name and label_name.lower() not in label_map:
+                    missing_labels.setdefault(label_name.lower(), label_name)
+            label_errors = {}
+            created_labels = await asyncio.gather(*(
+                trello.create_label(board_id, label_name, color_map.get(label_key, "null"))
+                for label_key, label_name in missing_labels.items()
+            ), return_exceptions=True)
+            for (label_key, label_name), new_label in zip(missing_labels.items(), created_labels):
+                if isinstance(new_label, Exception):
+                    print(f"Error creating Trello label '{label_name}': {new_label}")
+                    label_errors[label_key] = str(new_label)
+                elif new_label and new_label.get("id"):
+                    label_map[label_key] = new_label
+
+            async def create_item_card(item, pos):
+                name = item.task
+                desc = f"Owner: {item.owner}\nPriority: {item.priority}\nStatus: {item.status}"
+                due = item.due_date if is_valid_iso8601(item.due_date) else None
+                label_name = str(item.priority).strip() if item.priority else None
+                label_key = label_name.lower() if label_name else None
+                label_obj = label_map.get(label_key) if label_key else None
+                label_id = label_obj["id"] if label_obj else None
+                trello_label_error = label_errors.get(label_key)
 
-        for item in meeting_summary.action_items:
-            name = item.task
-            if name in existing_card_names:
-                continue
-            desc = f"Owner: {item.owner}\nPriority: {item.priority}\nStatus: {item.status}"
-            due = item.due_date if is_valid_iso8601(item.due_date) else None
-
-            label_id = None
-            label_name = str(item.priority).strip() if item.priority else None
-            label_color = None
-            trello_label_error = None
-            if label_name:
-                label_key = label_name.lower()
-                label_obj = label_map.get(label_key)
-                if label_obj:
-                    label_id = label_obj["id"]
-                else:
-                    color_map = {"critical": "red", "high": "yellow", "medium": "sky", "low": "green"}
-                    label_color = color_map.get(label_key, "null")
-                    try:
-                        new_label = trello.create_label(board_id, label_name, label_color)
-                        if new_label and new_label.get("id"):
-                            label_id = new_label["id"]
-                            label_map[label_key] = new_label
-                    except Exception as e:
-                        print(f"Error creating Trello label '{label_name}': {e}")
-                        trello_label_error = str(e)
-
-            label_ids = [label_id] if label_id else None
-            try:
-                card = trello.create_card(
-                    list_id=todo_list_id,
-                    name=name,
-                    desc=desc,
-                    due_iso=due,
-                    label_ids=label_ids
-                )
-                card["assigned_label"] = label_name
-                card["label_id"] = label_id
-                card["label_error"] = trello_label_error
-            except Exception as e:
-                print(f"Error creating Trello card '{name}': {e}")
-                card = {"error": str(e), "name": name, "assigned_label": label_name, "label_error": trello_label_error}
-            trello_results.append(card)
+                label_ids = [label_id] if label_id else None
+                try:
+                    card = await trello.create_card(
+                        list_id=todo_list_id,
+                        name=name,
+                        desc=desc,
+                        due_iso=due,
+                        label_ids=label_ids,
+                        pos=pos
+                    )
+                    card["assigned_label"] = label_name
+                    card["label_id"] = label_id
+                    card["label_error"] = trello_label_error
+                except Exception as e:
+                    print(f"Error creating Trello card '{name}': {e}")
+                    card = {"error": str(e), "name": name, "assigned_label": label_name, "label_error": trello_label_error}
+                return card
+
+            # Cards are created concurrently; explicit positions below the existing cards keep action-item order
+            bottom = max((card.get("pos", 0) for card in existing_cards), default=0)
+            trello_results = list(await asyncio.gather(*(
+                create_item_card(item, bottom + TRELLO_POS_STEP * (i + 1)) for i, item in enumerate(new_items)
+            )))
 
-        # Update DB: save label info for each task
+        # Update DB: save label info for each task (the last action item with a title wins)
+        label_infos = {}
         for item in meeting_summary.action_items:
-            tasks = user_db.get_meeting_tasks(meeting_id)
-            for t in tasks:
-                if t["title"] == item.task:
-                    label_info = f"Priority: {item.priority}"
-                    if hasattr(item, "label_id") and item.label_id:
-                        label_info += f", TrelloLabelID: {item.label_id}"
-                    user_db.update_task_description(t["id"], label_info)
+            label_info = f"Priority: {item.priority}"
+            if hasattr(item, "label_id") and item.label_id:
+                label_info += f", TrelloLabelID: {item.label_id}"
+            label_infos[item.task] = label_info
+        user_db.update_task_descriptions([
+            (t["id"], label_infos[t["title"]])
+            for t in user_db.get_meeting_tasks(meeting_id)
+            if t["title"] in label_infos
+        ])
 
         return {
             "success": True,